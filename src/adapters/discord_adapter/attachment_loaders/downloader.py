@@ -13,6 +13,7 @@ from src.core.rate_limiter.rate_limiter import RateLimiter
 from src.core.utils.attachment_loading import (
     create_attachment_dir,
     get_attachment_type_by_extension,
+    get_file_extension,
     save_metadata_file
 )
 from src.core.utils.config import Config
@@ -46,11 +47,10 @@ class Downloader():
             return []
 
         metadata = []
+        created_at = datetime.now()  # One timestamp for all attachments of the message
 
         for attachment in getattr(message, "attachments", []):
-            file_extension = None
-            if "." in attachment.filename:
-                file_extension = attachment.filename.split(".")[-1].lower()
+            file_extension = get_file_extension(attachment.filename)
 
             attachment_metadata = {
                 "attachment_id": str(attachment.id),
@@ -60,7 +60,7 @@ class Downloader():
                 "content_type": attachment.content_type,
                 "content": None,
                 "url": attachment.url,
-                "created_at": datetime.now(),
+                "created_at": created_at,
                 "processable": False
             }
 
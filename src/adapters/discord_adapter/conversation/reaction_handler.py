@@ -1,8 +1,7 @@
-import emoji
-
 from src.core.cache.message_cache import CachedMessage
 from src.core.conversation.base_data_classes import ConversationDelta
 from src.core.conversation.base_reaction_handler import BaseReactionHandler
+from src.core.utils.emoji_converter import get_emoji_name
 
 class ReactionHandler:
     """Handles message reactions"""
@@ -20,7 +19,7 @@ class ReactionHandler:
             reaction: Reaction to update
             delta: Current delta object
         """
-        reaction = emoji.demojize(reaction).strip(":")
+        reaction = get_emoji_name(reaction)
 
         if op == "added_reaction":
             BaseReactionHandler.add_reaction(cached_msg, reaction)
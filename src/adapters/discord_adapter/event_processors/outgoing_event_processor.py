@@ -1,9 +1,10 @@
 import asyncio
-import emoji
 import json
 import logging
 import os
+import time
 
+from collections import OrderedDict
 from pydantic import BaseModel
 from typing import Any, Dict, List, Optional
 
@@ -14,11 +15,16 @@ from src.adapters.discord_adapter.event_processors.history_fetcher import Histor
 
 from src.core.conversation.base_data_classes import UserInfo
 from src.core.events.processors.base_outgoing_event_processor import BaseOutgoingEventProcessor
+from src.core.utils.attachment_loading import chunk_attachments
 from src.core.utils.config import Config
+from src.core.utils.emoji_converter import get_emoji_symbol
 
 class OutgoingEventProcessor(BaseOutgoingEventProcessor):
     """Processes events from socket.io and sends them to Discord"""
 
+    MESSAGE_CACHE_SIZE = 256  # recently sent or fetched messages kept for follow-up requests
+    MESSAGE_CACHE_TTL = 30  # seconds
+
     def __init__(self, config: Config, client: Any, conversation_manager: Manager):
         """Initialize the socket.io events processor
 
@@ -29,6 +35,11 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         """
         super().__init__(config, client, conversation_manager)
         self.uploader = Uploader(self.config)
+        self.attachment_limit = int(self.config.get_setting("attachments", "max_attachments_per_message"))
+        self.send_parts_concurrently = self.config.get_setting(
+            "adapter", "send_message_parts_concurrently", False
+        )
+        self._message_cache: OrderedDict = OrderedDict()
 
     async def _send_message(self, conversation_info: Any, data: BaseModel) -> Dict[str, Any]:
         """Send a message to a chat
@@ -40,30 +51,31 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         Returns:
             Dictionary containing the status and message_ids
         """
-        message_ids = []
         channel = await self._get_channel(data.conversation_id)
-
-        for message in self._split_long_message(
+        message_parts = self._split_long_message(
             self._mention_users(conversation_info, data.mentions, data.text)
-        ):
-            await self.rate_limiter.limit_request("message", data.conversation_id)
-            response = await channel.send(message)
+        )
+
+        if self.send_parts_concurrently:
+            responses = await self._send_parts_concurrently(channel, data.conversation_id, list(message_parts))
+        else:
+            responses = []
+            for message in message_parts:
+                await self.rate_limiter.limit_request("message", data.conversation_id)
+                responses.append(await channel.send(message))
+
+        message_ids = []
+        for response in responses:
             if hasattr(response, "id"):
                 message_ids.append(str(response.id))
+                self._cache_message(data.conversation_id, response.id, response)
 
         attachments = data.attachments
-        attachment_limit = self.config.get_setting(
-            "attachments", "max_attachments_per_message"
-        )
 
         if attachments:
-            attachment_chunks = [
-                attachments[i:i+attachment_limit]
-                for i in range(0, len(attachments), attachment_limit)
-            ]
             clean_up_paths = []
 
-            for chunk in attachment_chunks:
+            for chunk in chunk_attachments(attachments, self.attachment_limit):
                 await self.rate_limiter.limit_request("message", data.conversation_id)
                 files, paths = self.uploader.upload_attachment(chunk)
                 clean_up_paths.extend(paths)
@@ -75,6 +87,28 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         logging.info(f"Message sent to {data.conversation_id} with {len(attachments)} attachments")
         return {"request_completed": True, "message_ids": message_ids}
 
+    async def _send_parts_concurrently(self,
+                                       channel: Any,
+                                       conversation_id: str,
+                                       message_parts: List[str]) -> List[Any]:
+        """Send the parts of a long message in parallel
+
+        Rate limit slots are still taken one by one, only the requests themselves overlap.
+        Discord may then show the parts in a different order than they were split in.
+
+        Args:
+            channel: Discord channel
+            conversation_id: Conversation ID
+            message_parts: Message parts to send
+
+        Returns:
+            List[Any]: Sent messages, in the order of the parts
+        """
+        for _ in message_parts:
+            await self.rate_limiter.limit_request("message", conversation_id)
+
+        return await asyncio.gather(*(channel.send(message) for message in message_parts))
+
     async def _edit_message(self, conversation_info: Any, data: BaseModel) -> Dict[str, Any]:
         """Edit a message
 
@@ -85,11 +119,14 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         Returns:
             Dictionary containing the status
         """
-        channel = await self._get_channel(data.conversation_id)
-        message = await channel.fetch_message(int(data.message_id))
+        message = await self._get_message(data.conversation_id, data.message_id)
 
         await self.rate_limiter.limit_request("edit_message", data.conversation_id)
-        await message.edit(content=self._mention_users(conversation_info, data.mentions, data.text))
+        edited_message = await message.edit(
+            content=self._mention_users(conversation_info, data.mentions, data.text)
+        )
+        if edited_message:
+            self._cache_message(data.conversation_id, data.message_id, edited_message)
         logging.info(f"Message {data.message_id} edited successfully")
 
         return {"request_completed": True}
@@ -103,11 +140,11 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         Returns:
             Dictionary containing the status
         """
-        channel = await self._get_channel(data.conversation_id)
-        message = await channel.fetch_message(int(data.message_id))
+        message = await self._get_message(data.conversation_id, data.message_id)
 
         await self.rate_limiter.limit_request("delete_message", data.conversation_id)
         await message.delete()
+        self._message_cache.pop((data.conversation_id, str(data.message_id)), None)
         logging.info(f"Message {data.message_id} deleted successfully")
 
         return {"request_completed": True}
@@ -121,11 +158,10 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         Returns:
             Dictionary containing the status
         """
-        channel = await self._get_channel(data.conversation_id)
-        message = await channel.fetch_message(int(data.message_id))
-        emoji_symbol = emoji.emojize(f":{data.emoji}:")
+        message = await self._get_message(data.conversation_id, data.message_id)
+        emoji_symbol = get_emoji_symbol(data.emoji)
 
-        if not emoji_symbol or emoji_symbol == f":{data.emoji}:":
+        if emoji_symbol is None:
             logging.error(f"Python library emoji does not support this emoji: {data.emoji}")
             return {"request_completed": False}
 
@@ -143,11 +179,10 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         Returns:
             Dictionary containing the status
         """
-        channel = await self._get_channel(data.conversation_id)
-        message = await channel.fetch_message(int(data.message_id))
-        emoji_symbol = emoji.emojize(f":{data.emoji}:")
+        message = await self._get_message(data.conversation_id, data.message_id)
+        emoji_symbol = get_emoji_symbol(data.emoji)
 
-        if not emoji_symbol or emoji_symbol == f":{data.emoji}:":
+        if emoji_symbol is None:
             logging.error(f"Python library emoji does not support this emoji: {data.emoji}")
             return {"request_completed": False}
 
@@ -186,8 +221,7 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         Returns:
             Dict[str, Any]: Dictionary containing the status
         """
-        channel = await self._get_channel(data.conversation_id)
-        message = await channel.fetch_message(int(data.message_id))
+        message = await self._get_message(data.conversation_id, data.message_id)
 
         await self.rate_limiter.limit_request("pin_message", data.conversation_id)
         await message.pin()
@@ -204,8 +238,7 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         Returns:
             Dict[str, Any]: Dictionary containing the status
         """
-        channel = await self._get_channel(data.conversation_id)
-        message = await channel.fetch_message(int(data.message_id))
+        message = await self._get_message(data.conversation_id, data.message_id)
 
         await self.rate_limiter.limit_request("unpin_message", data.conversation_id)
         await message.unpin()
@@ -243,6 +276,43 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         """
         return f"<@{user_info.user_id}> "
 
+    async def _get_message(self, conversation_id: str, message_id: str) -> Any:
+        """Get a message, reusing it if it was sent or fetched recently
+
+        Args:
+            conversation_id: Conversation ID
+            message_id: Message ID
+
+        Returns:
+            Any: Discord message object
+        """
+        key = (conversation_id, str(message_id))
+        cached = self._message_cache.get(key)
+
+        if cached and time.monotonic() - cached[1] < self.MESSAGE_CACHE_TTL:
+            self._message_cache.move_to_end(key)
+            return cached[0]
+
+        channel = await self._get_channel(conversation_id)
+        message = await channel.fetch_message(int(message_id))
+        self._cache_message(conversation_id, message_id, message)
+        return message
+
+    def _cache_message(self, conversation_id: str, message_id: Any, message: Any) -> None:
+        """Remember a message for follow-up requests, evicting the least recently used one
+
+        Args:
+            conversation_id: Conversation ID
+            message_id: Message ID
+            message: Discord message object
+        """
+        key = (conversation_id, str(message_id))
+        self._message_cache[key] = (message, time.monotonic())
+        self._message_cache.move_to_end(key)
+
+        if len(self._message_cache) > self.MESSAGE_CACHE_SIZE:
+            self._message_cache.popitem(last=False)
+
     async def _get_channel(self, conversation_id: str) -> Optional[Any]:
         """Get a channel from a conversation_id
 
@@ -72,5 +72,7 @@ class Adapter(BaseAdapter):
 
     async def _teardown_client(self) -> None:
         """Teardown client"""
+        if self.outgoing_events_processor:
+            await self.outgoing_events_processor.uploader.aclose()
         if self.client:
             await self.client.disconnect()
@@ -1,14 +1,21 @@
+import asyncio
 import base64
 import logging
 import os
+import re
 import shutil
+import tempfile
 
-from typing import Any, List
+from typing import Any, Iterator, List, Optional
 from src.core.utils.config import Config
 
+NON_BASE64_CHARACTERS = re.compile(r"[^A-Za-z0-9+/=]")
+
 class Uploader():
     """Prepares files for upload to Discord"""
 
+    DECODE_BLOCK_SIZE = 4 * 65536  # base64 characters decoded at a time
+
     def __init__(self, config: Config):
         """Initialize with a Discord webhook uploader
 
@@ -24,54 +31,129 @@ class Uploader():
         )
         os.makedirs(self.temp_dir, exist_ok=True)
 
-    def __del__(self):
-        """Cleanup the temporary directory when object is garbage collected"""
+    async def aclose(self) -> None:
+        """Remove the temporary upload directory
+
+        Called explicitly on adapter shutdown instead of at garbage collection
+        time, so the recursive removal never blocks the event loop.
+        """
         try:
-            if os.path.exists(self.temp_dir):
-                shutil.rmtree(self.temp_dir, ignore_errors=True)
+            if os.path.isdir(self.temp_dir):
+                await asyncio.to_thread(shutil.rmtree, self.temp_dir, ignore_errors=True)
                 logging.info(f"Removed temporary upload directory: {self.temp_dir}")
         except Exception as e:
             logging.error(f"Error removing temporary directory: {e}")
 
-    def upload_attachment(self, attachments: List[Any]) -> List[str]:
+    async def upload_attachment(self, attachments: List[Any]) -> List[str]:
         """Upload a file to Discord
 
+        Decoding and writing happen in worker threads, one per attachment,
+        so large attachments do not block the event loop. Each attachment is
+        written to its own subdirectory, so attachments with the same file
+        name are all sent under that name.
+
         Args:
             attachments: List of attachment details
 
         Returns:
             List of file paths or [] if error
         """
-        files = []
-
         try:
-            for attachment in attachments:
-                try:
-                    file_content = base64.b64decode(attachment.content)
-                except Exception as e:
-                    logging.error(f"Failed to decode base64 content: {e}")
-                    continue
-
-                if len(file_content) > self.max_file_size:
-                    logging.error(f"Decoded content exceeds size limit: {len(file_content)/1024/1024:.2f} MB")
-                    continue
-
-                temp_path = os.path.join(self.temp_dir, attachment.file_name)
-                with open(temp_path, "wb") as f:
-                    f.write(file_content)
-
-                files.append(temp_path)
-
-            return files
+            files = await asyncio.gather(
+                *(asyncio.to_thread(self._write_attachment, attachment) for attachment in attachments)
+            )
+            return [file for file in files if file]
         except Exception as e:
             logging.error(f"Error uploading file: {str(e)}", exc_info=True)
             return []
 
-    def clean_up_uploaded_files(self, attachments: List[str]) -> None:
+    async def clean_up_uploaded_files(self, attachments: List[str]) -> None:
         """Clean up files after they have been uploaded to Discord
 
         Args:
             attachments: List of attachment details (json)
         """
-        for attachment in attachments:
-            os.remove(attachment)
+        await asyncio.to_thread(self._remove_files, attachments)
+
+    def _write_attachment(self, attachment: Any) -> Optional[str]:
+        """Decode an attachment and write it to the temporary directory
+
+        Raw bytes are written as they are; base64 content is decoded block by
+        block, so the whole decoded file never has to be held in memory.
+
+        Args:
+            attachment: Attachment details
+
+        Returns:
+            File path or None if the attachment could not be prepared
+        """
+        temp_path = os.path.join(tempfile.mkdtemp(dir=self.temp_dir), attachment.file_name)
+
+        if isinstance(attachment.content, (bytes, bytearray, memoryview)):
+            if len(attachment.content) > self.max_file_size:
+                logging.error(f"Content exceeds size limit: {len(attachment.content)/1024/1024:.2f} MB")
+                os.rmdir(os.path.dirname(temp_path))
+                return None
+            with open(temp_path, "wb") as f:
+                f.write(attachment.content)
+            return temp_path
+
+        try:
+            with open(temp_path, "wb") as f:
+                for block in self._decode_blocks(attachment.content):
+                    f.write(block)
+            return temp_path
+        except ValueError as e:
+            logging.error(f"Failed to decode attachment {attachment.file_name}: {e}")
+        except Exception:
+            logging.error(f"Failed to write attachment {attachment.file_name}", exc_info=True)
+
+        shutil.rmtree(os.path.dirname(temp_path), ignore_errors=True)
+        return None
+
+    def _decode_blocks(self, content: str) -> Iterator[bytes]:
+        """Decode base64 content in blocks of DECODE_BLOCK_SIZE characters
+
+        Like a non-strict b64decode of the whole content, characters outside
+        the base64 alphabet (such as line breaks) are dropped. Characters that
+        do not complete a 4-character group are carried over to the next block.
+
+        Args:
+            content: Base64 encoded content
+
+        Yields:
+            Decoded bytes of each block
+
+        Raises:
+            ValueError: If the content is incomplete or the decoded content
+                exceeds the size limit
+        """
+        carry = ""
+        size = 0
+
+        for start in range(0, len(content), self.DECODE_BLOCK_SIZE):
+            block = carry + NON_BASE64_CHARACTERS.sub("", content[start:start + self.DECODE_BLOCK_SIZE])
+            usable = len(block) - len(block) % 4
+            carry = block[usable:]
+            decoded = base64.b64decode(block[:usable], validate=False)
+
+            size += len(decoded)
+            if size > self.max_file_size:
+                raise ValueError(f"decoded content exceeds size limit of {self.max_file_size/1024/1024:.2f} MB")
+            yield decoded
+
+        if carry:
+            raise ValueError("incomplete base64 content")
+
+    def _remove_files(self, file_paths: List[str]) -> None:
+        """Remove uploaded files together with their subdirectories
+
+        Args:
+            file_paths: List of file paths
+        """
+        for file_path in file_paths:
+            try:
+                os.remove(file_path)
+                os.rmdir(os.path.dirname(file_path))
+            except Exception as e:
+                logging.error(f"Error removing uploaded file {file_path}: {e}")
@@ -79,11 +79,15 @@ class Manager():
         if not conversation_id:
             return None
 
-        if conversation_id not in self.conversations:
-            self.conversations[conversation_id] = ConversationInfo(
+        conversation_info = self.conversations.get(conversation_id)
+        if conversation_info is not None:
+            return conversation_info
+
+        return self.conversations.setdefault(
+            conversation_id,
+            ConversationInfo(
                 conversation_id=conversation_id,
                 webhook_url=event.get("webhook_url", None),
                 webhook_name=event.get("webhook_name", None)
             )
-
-        return self.conversations[conversation_id]
+        )
@@ -12,6 +12,7 @@ from src.adapters.discord_webhook_adapter.event_processors.history_fetcher impor
 
 from src.core.conversation.base_data_classes import UserInfo
 from src.core.events.processors.base_outgoing_event_processor import BaseOutgoingEventProcessor
+from src.core.utils.attachment_loading import chunk_attachments
 from src.core.utils.config import Config
 
 class OutgoingEventProcessor(BaseOutgoingEventProcessor):
@@ -28,6 +29,7 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         super().__init__(config, client, conversation_manager)
         self.session = self.client.session
         self.uploader = Uploader(self.config)
+        self.attachment_limit = int(self.config.get_setting("attachments", "max_attachments_per_message"))
 
     async def _handle_fetch_attachment_event(self, data: BaseModel) -> Dict[str, Any]:
         """Fetch attachment event is not available for webhooks adapter.
@@ -58,12 +60,12 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
             message_ids.append(response.get("id", ""))
             self.conversation_manager.add_to_conversation({**response, **webhook_info})
 
-        attachments = self.uploader.upload_attachment(data.attachments)
+        attachments = await self.uploader.upload_attachment(data.attachments)
         for response in await self._send_attachments(webhook_info, attachments):
             message_ids.append(response.get("id", ""))
             self.conversation_manager.add_to_conversation({**response, **webhook_info})
 
-        self.uploader.clean_up_uploaded_files(attachments)
+        await self.uploader.clean_up_uploaded_files(attachments)
         logging.info(f"Message sent to {data.conversation_id}")
         return {"request_completed": True, "message_ids": list(filter(len, message_ids))}
 
@@ -104,17 +106,10 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         Returns:
             List[Any]: API responses
         """
-        attachment_limit = self.config.get_setting(
-            "attachments", "max_attachments_per_message"
-        )
-        attachment_chunks = [
-            attachments[i:i+attachment_limit]
-            for i in range(0, len(attachments), attachment_limit)
-        ] if attachments else []
         payload = {"content": "", "username": webhook_info["name"]}
         responses = []
 
-        for chunk in attachment_chunks:
+        for chunk in chunk_attachments(attachments, self.attachment_limit):
             await self.rate_limiter.limit_request("message", webhook_info["url"])
             form = aiohttp.FormData()
             for i, attachment in enumerate(chunk):
@@ -22,6 +22,7 @@ class Adapter():
         self.config = config
         self.adapter_type = self.config.get_setting("adapter", "adapter_type")
         self.running = False
+        self.stopped = asyncio.Event()
         self.monitoring_task = None
         self.session_manager = None
         self.outgoing_events_processor = None
@@ -31,6 +32,7 @@ class Adapter():
         logging.info("Starting adapter...")
 
         self.running = True
+        self.stopped.clear()
         self.monitoring_task = asyncio.create_task(self._monitor_connection())
 
         self.session_manager = Manager(self.config, True)
@@ -74,6 +76,7 @@ class Adapter():
             self.monitoring_task.cancel()
 
         await self._emit_event("disconnect")
+        self.stopped.set()
         logging.info("Adapter stopped")
 
     async def process_outgoing_event(self, data: Any) -> Dict[str, Any]:
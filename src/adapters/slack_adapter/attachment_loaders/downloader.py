@@ -11,6 +11,7 @@ from src.core.rate_limiter.rate_limiter import RateLimiter
 from src.core.utils.attachment_loading import (
     create_attachment_dir,
     get_attachment_type_by_extension,
+    get_file_extension,
     save_metadata_file
 )
 from src.core.utils.config import Config
@@ -46,11 +47,10 @@ class Downloader():
             return []
 
         metadata = []
+        created_at = datetime.now()  # One timestamp for all attachments of the message
 
         for file in message["files"]:
-            file_extension = None
-            if "." in file.get("name", ""):
-                file_extension = file["name"].split(".")[-1].lower()
+            file_extension = get_file_extension(file.get("name"))
 
             attachment_metadata = {
                 "attachment_id": file["id"],
@@ -60,7 +60,7 @@ class Downloader():
                 "content_type": file["mimetype"],
                 "content": None,
                 "url": file.get("url_private", None),
-                "created_at": datetime.now(),
+                "created_at": created_at,
                 "processable": False
             }
 
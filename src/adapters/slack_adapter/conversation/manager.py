@@ -216,7 +216,7 @@ class Manager(BaseManager):
         await self._update_delta_list(
             conversation_id=cached_msg.conversation_id,
             delta=delta,
-            list_to_update="updated_messages",
+            target_list=delta.updated_messages,
             cached_msg=cached_msg,
             attachments=[],
             mentions=self._get_bot_mentions(cached_msg)
@@ -13,17 +13,23 @@ from src.core.rate_limiter.rate_limiter import RateLimiter
 from src.core.socket_io.server import SocketIOServer
 from src.core.utils.logger import setup_logging
 from src.core.utils.config import Config
+from src.core.utils.event_loop import run_event_loop, wait_for_any
 from src.core.utils.emoji_converter import EmojiConverter
 
-should_shutdown = False
+def shutdown(shutdown_event: asyncio.Event) -> None:
+    """Perform graceful shutdown when signal is received
 
-def shutdown():
-    """Perform graceful shutdown when signal is received"""
-    global should_shutdown
+    Args:
+        shutdown_event: Event the main coroutine waits on
+    """
     logging.warning("Shutdown signal received, initiating shutdown...")
-    should_shutdown = True
+    shutdown_event.set()
 
 async def main():
+    adapter = None
+    socketio_server = None
+    shutdown_event = asyncio.Event()
+
     try:
         config = Config("config/slack_config.yaml")
         EmojiConverter.get_instance(config)
@@ -38,21 +44,21 @@ async def main():
 
         loop = asyncio.get_running_loop()
         for sig in (signal.SIGTERM, signal.SIGINT):
-            loop.add_signal_handler(sig, shutdown)
+            loop.add_signal_handler(sig, shutdown, shutdown_event)
 
         await socketio_server.start()
         await adapter.start()
-        while adapter.running and not should_shutdown:
-            await asyncio.sleep(1)
+        await wait_for_any(adapter.stopped, shutdown_event)
     except (ValueError, FileNotFoundError) as e:
         print(f"Configuration error: {e}")
         print("Please ensure slack_config.yaml exists with required settings")
     except Exception as e:
         print(f"Unexpected error: {e}")
     finally:
-        if adapter.running:
+        if adapter and adapter.running:
             await adapter.stop()
-        await socketio_server.stop()
+        if socketio_server:
+            await socketio_server.stop()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_event_loop(main())
@@ -12,12 +12,14 @@ from src.adapters.telegram_adapter.event_processors.outgoing_event_processor imp
 from src.adapters.telegram_adapter.client import Client
 
 from src.core.adapter.base_adapter import BaseAdapter
+from src.core.events.models.connection_events import ConnectionEvent
 from src.core.utils.config import Config
 
 class Adapter(BaseAdapter):
     """Telegram adapter implementation using Telethon"""
     ADAPTER_VERSION = "0.1.0"  # Our adapter version
     TESTED_WITH_API = "8.3"    # Telegram API version we've tested with
+    EMIT_DRAIN_TIMEOUT = 10    # seconds to wait for queued events on teardown
 
     def __init__(self, config: Config, socketio_server, start_maintenance=False):
         """Initialize the Telegram adapter
@@ -29,6 +31,10 @@ class Adapter(BaseAdapter):
         """
         super().__init__(config, socketio_server, start_maintenance)
         self.conversation_manager = Manager(config, start_maintenance)
+        self.emit_queue = asyncio.Queue(
+            maxsize=self.config.get_setting("adapter", "emit_queue_size", 1000)
+        )
+        self.emit_task = None
 
     async def _setup_client(self) -> None:
         """Connect to client"""
@@ -67,7 +73,45 @@ class Adapter(BaseAdapter):
 
     async def _perform_post_setup_tasks(self) -> None:
         """Perform post setup tasks"""
-        pass
+        self.emit_task = asyncio.create_task(self._emit_queued_events())
+
+    async def process_incoming_event(self, event: Any) -> None:
+        """Process events from client and queue the results for emission
+
+        Args:
+            event: client's event object
+        """
+        for event_info in await self.incoming_events_processor.process_event(event):
+            await self.emit_queue.put(("bot_request", event_info))
+
+    async def _emit_event(self, event_type: str) -> None:
+        """Emit a connection event behind the queued events while the writer runs
+
+        Args:
+            event_type: event type (connect, disconnect)
+        """
+        if not self.emit_task:
+            await super()._emit_event(event_type)
+            return
+
+        await self.emit_queue.put(
+            (event_type, ConnectionEvent(adapter_type=self.adapter_type).model_dump())
+        )
+
+    async def _emit_queued_events(self) -> None:
+        """Send queued events to the framework one by one, in the order they were queued"""
+        while True:
+            try:
+                event_type, event_info = await self.emit_queue.get()
+            except asyncio.CancelledError:
+                break
+
+            try:
+                await self.socketio_server.emit_event(event_type, event_info)
+            except Exception as e:
+                logging.error(f"Error emitting queued {event_type} event: {e}", exc_info=True)
+            finally:
+                self.emit_queue.task_done()
 
     async def _connection_exists(self) -> Optional[Any]:
         """Check connection
@@ -84,6 +128,15 @@ class Adapter(BaseAdapter):
 
     async def _teardown_client(self) -> None:
         """Teardown client"""
+        if self.emit_task:
+            try:
+                await asyncio.wait_for(self.emit_queue.join(), timeout=self.EMIT_DRAIN_TIMEOUT)
+            except asyncio.TimeoutError:
+                logging.error(f"Dropping {self.emit_queue.qsize()} queued events on teardown")
+
+            self.emit_task.cancel()
+            self.emit_task = None
+
         try:
             await self.client.disconnect()
             logging.info("Disconnected from Telegram")
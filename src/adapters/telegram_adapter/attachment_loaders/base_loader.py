@@ -2,7 +2,7 @@ import os
 
 from typing import Optional, Dict, Any
 from datetime import datetime
-from src.core.utils.attachment_loading import get_attachment_type_by_extension
+from src.core.utils.attachment_loading import get_attachment_type_by_extension, get_file_extension
 from src.core.utils.config import Config
 
 class BaseLoader:
@@ -29,7 +29,7 @@ class BaseLoader:
 
         Returns: Dictionary with attachment metadata or {} if no attachment
         """
-        if not message or not hasattr(message, "media") or not message.media:
+        if not message or not getattr(message, "media", None):
             return {}
 
         metadata = {
@@ -44,19 +44,20 @@ class BaseLoader:
             "processable": False
         }
 
-        if hasattr(message, "photo") and message.photo:
+        photo = getattr(message, "photo", None)
+        document = getattr(message, "document", None)
+
+        if photo:
             metadata["attachment_type"] = "photo"
-            metadata["attachment_id"] = str(message.photo.id)
+            metadata["attachment_id"] = str(photo.id)
             metadata["filename"] = f"{metadata['attachment_id']}.jpg"
-        elif hasattr(message, "document") and message.document:
-            document = message.document
+        elif document:
             file_extension = None
 
-            if hasattr(document, "attributes"):
-                for attr in document.attributes:
-                    if hasattr(attr, "file_name") and attr.file_name and "." in attr.file_name:
-                        file_extension = attr.file_name.split(".")[-1].lower()
-                        break
+            for attr in getattr(document, "attributes", None) or []:
+                file_extension = get_file_extension(getattr(attr, "file_name", None))
+                if file_extension is not None:
+                    break
 
             metadata["attachment_type"] = get_attachment_type_by_extension(file_extension)
             metadata["attachment_id"] = str(document.id)
@@ -76,13 +77,17 @@ class BaseLoader:
         Returns: File size in bytes or None if not available
         """
         try:
-            if hasattr(message, "document") and message.document:
-                return message.document.size
-            if hasattr(message, "photo") and message.photo:
-                sizes = message.photo.sizes
-                if sizes:
-                    largest = max(sizes, key=lambda s: getattr(s, "size", 0) if hasattr(s, "size") else 0)
-                    return getattr(largest, "size", None)
+            document = getattr(message, "document", None)
+            if document:
+                return document.size
+            photo = getattr(message, "photo", None)
+            if photo:
+                largest = None
+                for photo_size in photo.sizes or []:
+                    size = getattr(photo_size, "size", None)
+                    if size is not None and (largest is None or size > largest):
+                        largest = size
+                return largest
             return None
         except Exception:
             return None
@@ -1,8 +1,8 @@
-import emoji
 from typing import Dict, Any, List
 
 from src.core.cache.message_cache import CachedMessage
 from src.core.conversation.base_data_classes import ConversationDelta
+from src.core.utils.emoji_converter import get_emoji_name
 
 class ReactionHandler:
     """Handles message reactions"""
@@ -24,7 +24,7 @@ class ReactionHandler:
 
         for result in reactions.results:
             if hasattr(result, "reaction") and hasattr(result.reaction, "emoticon"):
-                emoji_name = emoji.demojize(result.reaction.emoticon).strip(":")
+                emoji_name = get_emoji_name(result.reaction.emoticon)
                 count = getattr(result, "count", 1)
                 reaction_data[emoji_name] = count
 
@@ -1,5 +1,4 @@
 import asyncio
-import emoji
 import json
 import logging
 import os
@@ -17,6 +16,7 @@ from src.adapters.telegram_adapter.event_processors.history_fetcher import Histo
 from src.core.conversation.base_data_classes import UserInfo
 from src.core.events.processors.base_outgoing_event_processor import BaseOutgoingEventProcessor
 from src.core.utils.config import Config
+from src.core.utils.emoji_converter import get_emoji_symbol
 
 class OutgoingEventProcessor(BaseOutgoingEventProcessor):
     """Processes events from socket.io and sends them to Telegram"""
@@ -146,9 +146,9 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         """
         conversation_id = self._format_conversation_id(data.conversation_id)
         entity = await self._get_entity(conversation_id)
-        emoji_symbol = emoji.emojize(f":{data.emoji}:")
+        emoji_symbol = get_emoji_symbol(data.emoji)
 
-        if not emoji_symbol or emoji_symbol == f":{data.emoji}:":
+        if emoji_symbol is None:
             logging.error(f"Python library emoji does not support this emoji: {data.emoji}")
             return {"request_completed": False}
 
@@ -178,9 +178,9 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         """
         conversation_id = self._format_conversation_id(data.conversation_id)
         entity = await self._get_entity(conversation_id)
-        emoji_symbol = emoji.emojize(f":{data.emoji}:")
+        emoji_symbol = get_emoji_symbol(data.emoji)
 
-        if not emoji_symbol or emoji_symbol == f":{data.emoji}:":
+        if emoji_symbol is None:
             logging.error(f"Python library emoji does not support this emoji: {data.emoji}")
             return {"request_completed": False}
 
@@ -294,6 +294,19 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         """
         return True
 
+    def _reactions_can_run_concurrently(self) -> bool:
+        """Check if several reactions to the same message can be updated concurrently
+
+        Returns:
+            bool: True if reactions can be updated concurrently, False otherwise
+
+        Note:
+            Telegram replaces the whole list of reactions of a message and a
+            removal is computed from the current list, so concurrent updates
+            would overwrite each other.
+        """
+        return False
+
     def _adapter_specific_mention_all(self) -> str:
         """Mention all users in a conversation
 
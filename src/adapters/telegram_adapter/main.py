@@ -8,23 +8,33 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from src.adapters.telegram_adapter.adapter import Adapter
-from src.core.rate_limiter.rate_limiter import RateLimiter
 from src.core.utils.logger import setup_logging
 from src.core.utils.config import Config
-from src.core.socket_io.server import SocketIOServer
+from src.core.utils.event_loop import run_event_loop, wait_for_any
 
-should_shutdown = False
+def shutdown(shutdown_event: asyncio.Event) -> None:
+    """Perform graceful shutdown when signal is received
 
-def shutdown():
-    """Perform graceful shutdown when signal is received"""
-    global should_shutdown
+    Args:
+        shutdown_event: Event the main coroutine waits on
+    """
     logging.warning("Shutdown signal received, initiating shutdown...")
-    should_shutdown = True
+    shutdown_event.set()
 
 async def main():
+    adapter = None
+    socketio_server = None
+    shutdown_event = asyncio.Event()
+
     try:
         config = Config("config/telegram_config.yaml")
+
+        # Imported once the config is loaded, so a configuration error exits
+        # without loading Telethon and the Socket.IO stack
+        from src.adapters.telegram_adapter.adapter import Adapter
+        from src.core.rate_limiter.rate_limiter import RateLimiter
+        from src.core.socket_io.server import SocketIOServer
+
         RateLimiter.get_instance(config)
         setup_logging(config)
 
@@ -34,19 +44,29 @@ async def main():
         adapter = Adapter(config, socketio_server, start_maintenance=True)
         socketio_server.set_adapter(adapter)
 
+        # Signal handling - Windows compatible
+        loop = asyncio.get_running_loop()
+        if sys.platform != 'win32':
+            for sig in (signal.SIGTERM, signal.SIGINT):
+                loop.add_signal_handler(sig, shutdown, shutdown_event)
+        else:
+            # On Windows, use signal.signal instead
+            signal.signal(signal.SIGINT, lambda s, f: loop.call_soon_threadsafe(shutdown, shutdown_event))
+            signal.signal(signal.SIGTERM, lambda s, f: loop.call_soon_threadsafe(shutdown, shutdown_event))
+
         await socketio_server.start()
         await adapter.start()
-        while adapter.running and not should_shutdown:
-            await asyncio.sleep(1)
+        await wait_for_any(adapter.stopped, shutdown_event)
     except (ValueError, FileNotFoundError) as e:
         print(f"Configuration error: {e}")
         print("Please ensure telegram_config.yaml exists with required settings")
     except Exception as e:
         print(f"Unexpected error: {e}")
     finally:
-        if adapter.running:
+        if adapter and adapter.running:
             await adapter.stop()
-        await socketio_server.stop()
+        if socketio_server:
+            await socketio_server.stop()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_event_loop(main())
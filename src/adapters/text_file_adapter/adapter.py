@@ -21,6 +21,7 @@ class Adapter():
         self.config = config
         self.adapter_type = self.config.get_setting("adapter", "adapter_type")
         self.running = False
+        self.stopped = asyncio.Event()
         self.monitoring_task = None
         self.outgoing_events_processor = None
 
@@ -29,6 +30,7 @@ class Adapter():
         logging.info("Starting adapter...")
 
         self.running = True
+        self.stopped.clear()
         self.monitoring_task = asyncio.create_task(self._monitor_connection())
         self.file_event_cache = FileEventCache(self.config, True)
         await self.file_event_cache.start()
@@ -70,6 +72,7 @@ class Adapter():
             await self.file_event_cache.stop()
 
         await self._emit_event("disconnect")
+        self.stopped.set()
         logging.info("Adapter stopped")
 
     async def process_outgoing_event(self, data: Any) -> Dict[str, Any]:
@@ -91,5 +91,7 @@ class Adapter(BaseAdapter):
 
     async def _teardown_client(self) -> None:
         """Teardown client"""
+        if self.outgoing_events_processor:
+            await self.outgoing_events_processor.api_client.close()
         if self.client:
             await self.client.disconnect()
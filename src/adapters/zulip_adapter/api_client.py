@@ -0,0 +1,199 @@
+import aiohttp
+import json
+import logging
+
+from typing import Any, Dict, Optional
+
+from src.core.rate_limiter.rate_limiter import RateLimiter
+from src.core.utils.config import Config
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class ApiClient:
+    """Asynchronous client for the Zulip REST endpoints used to send and poll events
+
+    The official Zulip client is synchronous, so the endpoints used by the
+    outgoing event processor and the event queue long-poll are called through
+    a shared aiohttp session that keeps connections to the Zulip server alive
+    between requests.
+    """
+
+    KEEPALIVE_TIMEOUT = 75  # seconds an idle connection is kept open for reuse
+    SOCK_READ_TIMEOUT = 90  # seconds, longer than the Zulip heartbeat interval of a long-poll
+
+    def __init__(self, config: Config, client: Any):
+        """Initialize the API client
+
+        Args:
+            config: Config instance
+            client: Zulip client instance, used for its site and credentials
+        """
+        self.config = config
+        self.client = client
+        self.base_url = f"{self.client.base_url.rstrip('/')}/v1"
+        self.max_connections = self.config.get_setting("adapter", "max_connections_per_host", 64)
+        self.rate_limiter = RateLimiter.get_instance(self.config)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def send_message(self, message_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a message
+
+        Args:
+            message_data: Message parameters (type, to, content, subject)
+
+        Returns:
+            Zulip API response
+        """
+        return await self.call_endpoint("messages", method="POST", request=message_data)
+
+    async def update_message(self, message_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Update a message
+
+        Args:
+            message_data: Message parameters, must contain message_id
+
+        Returns:
+            Zulip API response
+        """
+        request = dict(message_data)
+        message_id = request.pop("message_id")
+        return await self.call_endpoint(f"messages/{message_id}", method="PATCH", request=request)
+
+    async def add_reaction(self, reaction_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Add a reaction to a message
+
+        Args:
+            reaction_data: Reaction parameters, must contain message_id
+
+        Returns:
+            Zulip API response
+        """
+        request = dict(reaction_data)
+        message_id = request.pop("message_id")
+        return await self.call_endpoint(f"messages/{message_id}/reactions", method="POST", request=request)
+
+    async def remove_reaction(self, reaction_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Remove a reaction from a message
+
+        Args:
+            reaction_data: Reaction parameters, must contain message_id
+
+        Returns:
+            Zulip API response
+        """
+        request = dict(reaction_data)
+        message_id = request.pop("message_id")
+        return await self.call_endpoint(f"messages/{message_id}/reactions", method="DELETE", request=request)
+
+    async def get_events(self, queue_id: str, last_event_id: int) -> Dict[str, Any]:
+        """Long-poll the event queue for new events
+
+        Args:
+            queue_id: ID of the registered event queue
+            last_event_id: ID of the last event that was received
+
+        Returns:
+            Zulip API response
+        """
+        return await self.call_endpoint(
+            "events",
+            method="GET",
+            request={"queue_id": queue_id, "last_event_id": last_event_id, "dont_block": False}
+        )
+
+    async def call_endpoint(self,
+                            url: str,
+                            method: str = "POST",
+                            request: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Call a Zulip API endpoint
+
+        Args:
+            url: Endpoint path relative to /api/v1
+            method: HTTP method
+            request: Request parameters
+
+        Returns:
+            Zulip API response or an error response if the request failed
+        """
+        encoded_request = self._encode_request(request or {})
+        request_kwargs = {"params": encoded_request} if method == "GET" else {"data": encoded_request}
+
+        try:
+            async with self._get_session().request(
+                method, f"{self.base_url}/{url}", **request_kwargs
+            ) as response:
+                self._update_rate_limits(response.headers)
+                body = await response.read()
+                return orjson.loads(body) if orjson else json.loads(body)
+        except Exception as e:
+            logging.error(f"Error calling Zulip endpoint {url}: {e}")
+            return {"result": "error", "msg": str(e)}
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use
+
+        Returns:
+            aiohttp session authenticated with the adapter credentials
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                auth=aiohttp.BasicAuth(self.client.email, self.client.api_key),
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=self.max_connections,
+                    keepalive_timeout=self.KEEPALIVE_TIMEOUT
+                ),
+                timeout=aiohttp.ClientTimeout(total=None, sock_read=self.SOCK_READ_TIMEOUT)
+            )
+        return self._session
+
+    def _update_rate_limits(self, headers: Any) -> None:
+        """Pass the rate limit budget reported by Zulip to the rate limiter
+
+        Args:
+            headers: Response headers
+        """
+        remaining = headers.get("X-RateLimit-Remaining", None)
+        reset_time = headers.get("X-RateLimit-Reset", None)
+
+        if remaining is None or reset_time is None:
+            return
+
+        try:
+            self.rate_limiter.update_server_limits(int(remaining), float(reset_time))
+        except ValueError:
+            logging.warning(f"Invalid rate limit headers: {remaining}, {reset_time}")
+
+    def _encode_request(self, request: Dict[str, Any]) -> Dict[str, str]:
+        """Encode request parameters the way the Zulip API expects them
+
+        Args:
+            request: Request parameters
+
+        Returns:
+            Form parameters with non-string values JSON-encoded
+        """
+        return {
+            key: value if isinstance(value, str) else self._dumps(value)
+            for key, value in request.items()
+            if value is not None
+        }
+
+    def _dumps(self, value: Any) -> str:
+        """Serialize a value to JSON, using orjson when it is installed
+
+        Args:
+            value: Value to serialize
+
+        Returns:
+            JSON string
+        """
+        return orjson.dumps(value).decode() if orjson else json.dumps(value)
@@ -39,49 +39,64 @@ class Downloader(BaseLoader):
     async def download_attachment(self, message: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Process attachments from a Zulip message
 
+        Attachments of the message are downloaded concurrently; a file linked
+        several times in the same message is downloaded only once.
+
         Args:
             message: Zulip message object
 
         Returns:
             List of dictionaries with attachment metadata, empty list if no attachments
         """
-        attachments_metadata = []
-
-        for filename, file_path in self._get_attachments_list(message):
-            metadata = self._get_initial_metadata(filename, file_path)
-
-            attachment_dir = os.path.join(
-                self.download_dir,
-                metadata["attachment_type"],
-                metadata["attachment_id"]
+        return list(await asyncio.gather(
+            *(
+                self._download_single_attachment(filename, file_path)
+                for filename, file_path in dict.fromkeys(self._get_attachments_list(message))
             )
-            local_file_path = os.path.join(attachment_dir, metadata["filename"])
-
-            if not os.path.exists(local_file_path):
-                create_attachment_dir(attachment_dir)
-                await self._download_file(metadata["url"], local_file_path)
-            else:
-                logging.info(f"Skipping download for {local_file_path} because it already exists")
-
-            metadata["size"] = os.path.getsize(local_file_path)
-            mime = magic.Magic(mime=True)
-            metadata["content_type"] = mime.from_file(local_file_path)
-
-            if metadata["size"] <= self.max_file_size:
-                metadata["processable"] = True
-                save_metadata_file(metadata, attachment_dir)
+        ))
 
-                if self.content_required:
-                    try:
-                        with open(local_file_path, "rb") as f:
-                            file_content = f.read()
-                            metadata["content"] = base64.b64encode(file_content).decode("utf-8")
-                    except Exception as e:
-                        logging.error(f"Error reading file {local_file_path}: {e}")
+    async def _download_single_attachment(self, filename: str, file_path: str) -> Dict[str, Any]:
+        """Download a single attachment and collect its metadata
 
-            attachments_metadata.append(metadata)
+        Args:
+            filename: The filename of the attachment
+            file_path: The file path of the attachment
 
-        return attachments_metadata
+        Returns:
+            Dictionary with attachment metadata
+        """
+        metadata = self._get_initial_metadata(filename, file_path)
+
+        attachment_dir = os.path.join(
+            self.download_dir,
+            metadata["attachment_type"],
+            metadata["attachment_id"]
+        )
+        local_file_path = os.path.join(attachment_dir, metadata["filename"])
+
+        if not os.path.exists(local_file_path):
+            create_attachment_dir(attachment_dir)
+            await self._download_file(metadata["url"], local_file_path)
+        else:
+            logging.info(f"Skipping download for {local_file_path} because it already exists")
+
+        metadata["size"] = os.path.getsize(local_file_path)
+        mime = magic.Magic(mime=True)
+        metadata["content_type"] = mime.from_file(local_file_path)
+
+        if metadata["size"] <= self.max_file_size:
+            metadata["processable"] = True
+            save_metadata_file(metadata, attachment_dir)
+
+            if self.content_required:
+                try:
+                    with open(local_file_path, "rb") as f:
+                        file_content = f.read()
+                        metadata["content"] = base64.b64encode(file_content).decode("utf-8")
+                except Exception as e:
+                    logging.error(f"Error reading file {local_file_path}: {e}")
+
+        return metadata
 
     def _get_attachments_list(self, message: Dict[str, Any]) -> List[Tuple[str, str]]:
         """Extract attachment information from a Zulip message
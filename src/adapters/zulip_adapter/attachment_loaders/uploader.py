@@ -118,7 +118,7 @@ class Uploader(BaseLoader):
             old_path: Path to the old file
             zulip_uri: Zulip URI of the uploaded file
         """
-        file_extension = old_path.split(".")[-1]
+        file_extension = old_path.rpartition(".")[2]
         attachment_id = self._generate_attachment_id(zulip_uri)
         attachment_type = get_attachment_type_by_extension(file_extension)
         attachment_dir = os.path.join(self.download_dir, attachment_type, attachment_id)
@@ -1,15 +1,21 @@
 import asyncio
 import logging
+import random
 import zulip
 
 from typing import List, Dict, Callable, Optional
 
+from src.adapters.zulip_adapter.api_client import ApiClient
 from src.core.rate_limiter.rate_limiter import RateLimiter
 from src.core.utils.config import Config
 
 class Client:
     """Zulip client implementation"""
 
+    EVENT_DRAIN_TIMEOUT = 5  # seconds to stop polling and finish queued events on disconnect
+    MIN_POLLING_BACKOFF = 0.1  # seconds, first delay after a failed poll
+    MAX_POLLING_BACKOFF = 60  # seconds
+
     def __init__(self, config: Config, process_zulip_event: Callable):
         self.config = config
         self.process_event = process_zulip_event
@@ -17,16 +23,23 @@ class Client:
         self.client = zulip.Client(
             config_file=self.config.get_setting("adapter", "zuliprc_path")
         )
+        self.api_client = ApiClient(self.config, self.client)
         self.queue_id = None
         self.last_event_id = None
         self.running = False
         self._event_handlers: Dict[str, List[Callable]] = {}
+        self._events: asyncio.Queue = asyncio.Queue(
+            maxsize=self.config.get_setting("adapter", "event_queue_size", 256)
+        )
         self._polling_task: Optional[asyncio.Task] = None
+        self._processing_task: Optional[asyncio.Task] = None
+        self._polling_backoff = self.MIN_POLLING_BACKOFF
 
     async def connect(self) -> None:
         """Initialize connection and register for events"""
         try:
-            result = self.client.register(
+            result = await asyncio.to_thread(
+                self.client.register,
                 event_types=[
                     "message", "reaction", "update_message", "delete_message"
                 ]
@@ -44,38 +57,69 @@ class Client:
             logging.error(f"Error connecting to Zulip: {e}")
 
     async def start_polling(self) -> None:
-        """Start the long polling loop in a separate task"""
+        """Start the long polling loop and the event processing loop in separate tasks"""
+        if self._processing_task is None or self._processing_task.done():
+            self._processing_task = asyncio.create_task(self._processing_loop())
         if self._polling_task is None or self._polling_task.done():
             self._polling_task = asyncio.create_task(self._polling_loop())
             logging.info("Started Zulip event polling")
 
     async def _polling_loop(self) -> None:
-        """Long polling loop that runs as a background task"""
-        loop = asyncio.get_running_loop()
+        """Long polling loop that runs as a background task
 
+        The long-poll is an asynchronous HTTP request, so it does not hold
+        an executor thread and is aborted as soon as the task is cancelled.
+        Polled events are handed to the processing loop through a bounded
+        queue, so a slow handler delays the next poll only once the queue is full.
+        """
         while self.running:
             try:
                 await self.rate_limiter.limit_request("get_events")
-                response = await loop.run_in_executor(
-                    None,
-                    lambda: self.client.get_events(
-                        queue_id=self.queue_id,
-                        last_event_id=self.last_event_id,
-                        dont_block=False
-                    )
-                )
+                response = await self.api_client.get_events(self.queue_id, self.last_event_id)
 
                 if response and "events" in response:
+                    self._polling_backoff = self.MIN_POLLING_BACKOFF
                     events = response["events"]
 
                     if events:
                         self.last_event_id = events[-1]["id"]
 
                     for event in events:
-                        await self.process_event(event)
+                        await self._events.put(event)
+                    continue
+
+                logging.error(f"Error polling Zulip events: {response}")
             except Exception as e:
                 logging.error(f"Error in polling loop: {e}")
 
+            await self._back_off()
+
+    async def _back_off(self) -> None:
+        """Wait before the next poll after a failure
+
+        The delay doubles with every consecutive failure up to MAX_POLLING_BACKOFF
+        and is jittered, so that clients do not retry against the server in lockstep.
+        """
+        self._polling_backoff = min(self.MAX_POLLING_BACKOFF, self._polling_backoff * 2)
+        await asyncio.sleep(self._polling_backoff * (0.5 + random.random()))
+
+    async def _processing_loop(self) -> None:
+        """Process polled events one at a time, in the order they were received
+
+        Getting an event from a non-empty queue does not suspend, so the loop
+        yields to the event loop before each event; otherwise a burst of events
+        whose handlers never await I/O would starve the other tasks.
+        """
+        while True:
+            await asyncio.sleep(0)
+            event = await self._events.get()
+            try:
+                await self.process_event(event)
+            except Exception as e:
+                logging.error(f"Error processing Zulip event: {e}")
+            finally:
+                self._events.task_done()
+
     async def disconnect(self) -> None:
         """Disconnect from Zulip and clean up resources"""
         self.running = False
@@ -84,10 +128,29 @@ class Client:
             self._polling_task.cancel()
 
             try:
-                await self._polling_task
+                await asyncio.wait_for(self._polling_task, timeout=self.EVENT_DRAIN_TIMEOUT)
+            except (asyncio.CancelledError, asyncio.TimeoutError):
+                pass  # This is expected
+
+        if self._processing_task and not self._processing_task.done():
+            try:
+                await asyncio.wait_for(self._events.join(), timeout=self.EVENT_DRAIN_TIMEOUT)
+            except asyncio.TimeoutError:
+                logging.warning(f"{self._events.qsize()} Zulip events left unprocessed on disconnect")
+            self._processing_task.cancel()
+
+            try:
+                await self._processing_task
             except asyncio.CancelledError:
                 pass  # This is expected
 
+        if self.queue_id:
+            try:
+                await asyncio.to_thread(self.client.delete_queue, self.queue_id)
+            except Exception as e:
+                logging.warning(f"Error deleting Zulip event queue: {e}")
+
+        await self.api_client.close()
         self.queue_id = None
         self.last_event_id = None
         logging.info("Disconnected from Zulip")
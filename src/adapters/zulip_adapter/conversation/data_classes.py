@@ -7,14 +7,21 @@ from src.core.conversation.base_data_classes import BaseConversationInfo
 class ConversationInfo(BaseConversationInfo):
     """Comprehensive information about a Zulip conversation"""
     messages: Set[str] = field(default_factory=set)
+    stream_id: Optional[str] = field(default=None, init=False)
+    topic: Optional[str] = field(default=None, init=False)
+
+    def __post_init__(self):
+        super().__post_init__()
+
+        # Stream conversation ids look like "stream_id/topic"; split once here
+        # so that narrows do not have to re-parse the id on every fetch
+        stream_id, separator, topic = self.conversation_id.partition("/")
+        if separator:
+            self.stream_id, self.topic = stream_id, topic
 
     def _private_to_fields(self) -> List[str]:
         """Get the private to fields for the conversation"""
-        emails = []
-        for _, user_info in self.known_members.items():
-            if user_info.email:
-                emails.append(user_info.email)
-        return emails
+        return [user_info.email for user_info in self.known_members.values() if user_info.email]
 
     def _stream_to_fields(self) -> Optional[str]:
         """Get the stream to fields for the conversation"""
@@ -3,7 +3,7 @@ import re
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional
 
 from src.adapters.zulip_adapter.conversation.data_classes import ConversationInfo
 from src.adapters.zulip_adapter.conversation.message_builder import MessageBuilder
@@ -35,6 +35,9 @@ class Manager(BaseManager):
         super().__init__(config, start_maintenance)
         self.message_builder = MessageBuilder()
         self.thread_handler = ThreadHandler(self.message_cache)
+        self._message_to_conversation: Dict[str, str] = {}  # message_id -> conversation_id
+        self.message_cache.on_evict = self._forget_evicted_message
+        self._private_conversation_ids: Dict[FrozenSet[Any], str] = {}  # recipient ids -> conversation_id
 
     async def migrate_between_conversations(self, event: Any) -> Dict[str, Any]:
         """Handle a supergroup that was migrated from a regular group
@@ -47,62 +50,104 @@ class Manager(BaseManager):
         """
         event.update({"type": "stream"})
 
-        old_conversation = self.get_conversation(f"{event.get('stream_id', '')}/{event.get('orig_subject', '')}")
-        new_conversation = await self._get_or_create_conversation_info(event)
+        old_conversation_id = f"{event.get('stream_id', '')}/{event.get('orig_subject', '')}"
+        new_conversation_id = await self._get_conversation_id(event)
 
-        if not new_conversation:
+        if not new_conversation_id:
             return {}
 
-        async with self._lock:
+        async with self._lock_conversations(old_conversation_id, new_conversation_id):
+            old_conversation = self.get_conversation(old_conversation_id)
+            new_conversation = await self._get_or_create_conversation_info(event)
+
+            if not new_conversation:
+                return {}
+
             delta = self._create_conversation_delta(event, new_conversation)
-            messages = [str(id) for id in event.get("message_ids", [])]
+            message_ids = [str(id) for id in event.get("message_ids", [])]
 
             if not old_conversation:
                 return delta.to_dict()
 
-            for message_id in messages:
-                delta.deleted_message_ids.append(message_id)
+            delta.deleted_message_ids.extend(message_ids)
 
-                old_cached_msg = await self.message_cache.get_message_by_id(
-                    old_conversation.conversation_id, message_id
-                )
-                attachment_ids = old_cached_msg.attachments.copy() if old_cached_msg else set()
+            old_cached_msgs = await asyncio.gather(*(
+                self.message_cache.get_message_by_id(old_conversation_id, message_id)
+                for message_id in message_ids
+            ))
+            await asyncio.gather(*(
+                self.message_cache.migrate_message(old_conversation_id, new_conversation_id, message_id)
+                for message_id in message_ids
+            ))
 
-                await self.message_cache.migrate_message(
-                    old_conversation.conversation_id, new_conversation.conversation_id, message_id
-                )
-                self.conversations[new_conversation.conversation_id].messages.add(str(message_id))
-                self.conversations[old_conversation.conversation_id].messages.discard(str(message_id))
+            new_conversation.messages.update(message_ids)
+            old_conversation.messages.difference_update(message_ids)
+            self._message_to_conversation.update(dict.fromkeys(message_ids, new_conversation_id))
+
+            for message_id, old_cached_msg in zip(message_ids, old_cached_msgs):
+                attachment_ids = old_cached_msg.attachments.copy() if old_cached_msg else set()
 
                 for attachment_id in attachment_ids:
                     new_conversation.attachments.add(attachment_id)
 
-                    attachment = self.attachment_cache.get_attachment(attachment_id)
+                    attachment = self.attachment_cache.peek_attachment(attachment_id)
                     if attachment:
-                        attachment.conversations.add(new_conversation.conversation_id)
+                        attachment.conversations.add(new_conversation_id)
 
-                    still_referenced = False
-                    if old_conversation.conversation_id in self.message_cache.messages:
-                        for other_msg_id, other_msg in self.message_cache.messages[old_conversation.conversation_id].items():
-                            if other_msg_id != message_id and attachment_id in other_msg.attachments:
-                                still_referenced = True
-                                break
+                    still_referenced = any(
+                        attachment_id in other_msg.attachments
+                        for other_msg in self.message_cache.messages.get(old_conversation_id, {}).values()
+                    )
 
                     if not still_referenced:
                         old_conversation.attachments.discard(attachment_id)
                         if attachment:
-                            attachment.conversations.discard(old_conversation.conversation_id)
+                            attachment.conversations.discard(old_conversation_id)
 
                 if not delta.fetch_history:
                     await self._update_delta_list(
-                        conversation_id=new_conversation.conversation_id,
+                        conversation_id=new_conversation_id,
                         delta=delta,
-                        list_to_update="added_messages",
+                        target_list=delta.added_messages,
                         message_id=message_id
                     )
 
         return delta.to_dict()
 
+    async def update_conversation(self, event: Any) -> Dict[str, Any]:
+        """Update conversation information based on a received event
+
+        Reactions only touch a single cached message, so they are resolved
+        through the message index and serialized per conversation instead
+        of going through the manager-wide lock.
+
+        Args:
+            event: Event object that should contain the following keys:
+                - event_type: Type of event
+                - message: Zulip message object
+                - attachments: Optional attachment information
+
+        Returns:
+            Dictionary with delta information
+        """
+        if event.get("event_type", None) != ZulipEventType.REACTION:
+            return await super().update_conversation(event)
+
+        message = event.get("message", None)
+        if not message:
+            return {}
+
+        conversation_id = self._message_to_conversation.get(str(message.get("message_id", "")), None)
+        conversation_info = self.conversations.get(conversation_id, None) if conversation_id else None
+        if not conversation_info:
+            return {}
+
+        async with self._get_conversation_lock(conversation_id):
+            delta = self._create_conversation_delta(event, conversation_info)
+            await self._update_reaction(message, conversation_info, delta)
+
+        return delta.to_dict()
+
     async def _get_conversation_id(self, message: Any) -> Optional[str]:
         """Get the conversation ID from a Zulip message
 
@@ -128,10 +173,16 @@ class Manager(BaseManager):
         Returns:
             Conversation ID as a comma-separated list of user IDs
         """
-        user_ids = sorted(
-            [str(p.get("id")) for p in message.get("display_recipient", []) if "id" in p]
+        recipient_ids = frozenset(
+            p["id"] for p in message.get("display_recipient", []) if "id" in p
         )
-        return "_".join(user_ids)
+        conversation_id = self._private_conversation_ids.get(recipient_ids, None)
+
+        if conversation_id is None:
+            conversation_id = "_".join(sorted(str(user_id) for user_id in recipient_ids))
+            self._private_conversation_ids[recipient_ids] = conversation_id
+
+        return conversation_id
 
     def _get_stream_conversation_id(self, message: Dict[str, Any]) -> str:
         """Create a conversation ID for a stream message
@@ -158,9 +209,7 @@ class Manager(BaseManager):
         message_id = str(message.get("message_id", ""))
 
         if message_id:
-            for conversation_id, conversation_info in self.conversations.items():
-                if message_id in conversation_info.messages:
-                    return conversation_id
+            return self._message_to_conversation.get(message_id, None)
 
         return None
 
@@ -255,7 +304,7 @@ class Manager(BaseManager):
             await self._update_delta_list(
                 conversation_id=conversation_info.conversation_id,
                 delta=delta,
-                list_to_update="updated_messages",
+                target_list=delta.updated_messages,
                 cached_msg=cached_msg,
                 attachments=attachments,
                 mentions=mentions
@@ -285,9 +334,31 @@ class Manager(BaseManager):
             message, conversation_info, user_info, thread_info
         )
         conversation_info.messages.add(cached_msg.message_id)
+        self._message_to_conversation[cached_msg.message_id] = conversation_info.conversation_id
 
         return cached_msg
 
+    def _remove_message_from_conversation(self,
+                                          conversation_info: ConversationInfo,
+                                          message_id: str) -> None:
+        """Remove a message from the conversation info and the message index
+
+        Args:
+            conversation_info: Conversation info object
+            message_id: ID of the removed message
+        """
+        super()._remove_message_from_conversation(conversation_info, message_id)
+        self._message_to_conversation.pop(message_id, None)
+
+    def _forget_evicted_message(self, message: CachedMessage) -> None:
+        """Drop a message evicted from the cache from the message index
+
+        Args:
+            message: Evicted message
+        """
+        if self._message_to_conversation.get(message.message_id) == message.conversation_id:
+            del self._message_to_conversation[message.message_id]
+
     async def _update_message(self,
                               message: Dict[str, Any],
                               conversation_info: ConversationInfo,
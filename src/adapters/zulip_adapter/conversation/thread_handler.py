@@ -7,6 +7,8 @@ from src.core.cache.message_cache import MessageCache
 from src.core.conversation.base_data_classes import ThreadInfo
 from src.core.conversation.base_thread_handler import BaseThreadHandler
 
+REPLY_TO_PATTERN = re.compile(r"\[said\]\([^\)]+/near/(\d+)\)")
+
 class ThreadHandler(BaseThreadHandler):
     """Handles thread information for Zulip messages"""
 
@@ -67,8 +69,7 @@ class ThreadHandler(BaseThreadHandler):
         if not message or "content" not in message:
             return None
 
-        pattern = r'\[said\]\([^\)]+/near/(\d+)\)'
-        match = re.search(pattern, message.get("content", ""))
+        match = REPLY_TO_PATTERN.search(message.get("content", ""))
 
         if match:
             return match.group(1)
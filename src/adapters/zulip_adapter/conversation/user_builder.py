@@ -65,14 +65,19 @@ class UserBuilder:
         Returns:
             User info object or None if user info is not found
         """
+        user_id = str(message.get("sender_id", ""))
+        user_info = conversation_info.known_members.get(user_id, None)
+        if user_info:
+            return user_info
+
         if message.get("type", None) == "private":
             UserBuilder.add_known_members_to_private_conversation(
                 config, message, conversation_info
             )
 
-        user_id = str(message.get("sender_id", ""))
-        if user_id in conversation_info.known_members:
-            return conversation_info.known_members[user_id]
+            user_info = conversation_info.known_members.get(user_id, None)
+            if user_info:
+                return user_info
 
         if user_id:
             conversation_info.known_members[user_id] = UserInfo(
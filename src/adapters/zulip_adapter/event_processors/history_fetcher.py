@@ -1,19 +1,84 @@
 import asyncio
 import json
 import logging
-import re
 
-from typing import Any, Dict, List, Optional
+from operator import attrgetter
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from src.adapters.zulip_adapter.conversation.manager import Manager
 from src.adapters.zulip_adapter.attachment_loaders.downloader import Downloader
+from src.adapters.zulip_adapter.conversation.thread_handler import REPLY_TO_PATTERN
 
 from src.core.events.history_fetcher.base_history_fetcher import BaseHistoryFetcher
 from src.core.utils.config import Config
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class FormattedMessage:
+    """Message fetched from history that is not cached by the conversation manager
+
+    Kept as a slotted object while history is filtered and limited; converted
+    to the emitted dictionary only for the messages that are returned.
+    """
+    __slots__ = (
+        "message_id",
+        "conversation_id",
+        "sender_user_id",
+        "sender_display_name",
+        "text",
+        "thread_id",
+        "timestamp",
+        "attachments",
+        "is_direct_message"
+    )
+
+    def __init__(self,
+                 message_id: str,
+                 conversation_id: str,
+                 sender_user_id: str,
+                 sender_display_name: str,
+                 text: str,
+                 thread_id: Optional[str],
+                 timestamp: Optional[int],
+                 attachments: List[Dict[str, Any]],
+                 is_direct_message: bool):
+        self.message_id = message_id
+        self.conversation_id = conversation_id
+        self.sender_user_id = sender_user_id
+        self.sender_display_name = sender_display_name
+        self.text = text
+        self.thread_id = thread_id
+        self.timestamp = timestamp
+        self.attachments = attachments
+        self.is_direct_message = is_direct_message
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the formatted history dictionary"""
+        return {
+            "message_id": self.message_id,
+            "conversation_id": self.conversation_id,
+            "sender": {
+                "user_id": self.sender_user_id,
+                "display_name": self.sender_display_name
+            },
+            "text": self.text,
+            "thread_id": self.thread_id,
+            "timestamp": self.timestamp,
+            "attachments": self.attachments,
+            "is_direct_message": self.is_direct_message,
+            "mentions": []
+        }
+
 class HistoryFetcher(BaseHistoryFetcher):
     """Fetches and formats history from Zulip"""
 
+    # Zulip puts the quote of the replied-to message at the start of the reply,
+    # so only the beginning of each fetched message is scanned for it
+    REPLY_TO_SEARCH_WINDOW = 1024
+
     def __init__(self,
                  config: Config,
                  client: Any,
@@ -46,6 +111,10 @@ class HistoryFetcher(BaseHistoryFetcher):
             history_limit
         )
         self.downloader = Downloader(self.config, self.client, False)
+        self.download_semaphore = asyncio.Semaphore(
+            self.config.get_setting("attachments", "max_concurrent_downloads", 8)
+        )
+        self._narrow = None
 
     async def _fetch_from_api(self) -> List[Dict[str, Any]]:
         """Fetch conversation history
@@ -58,13 +127,10 @@ class HistoryFetcher(BaseHistoryFetcher):
 
         try:
             result = []
+            attachments = None
 
             if self.anchor:
-                result = await self._make_api_request(
-                    json.dumps(self._get_narrow_for_conversation()),
-                    self.history_limit,
-                    0
-                )
+                result, attachments = await self._fetch_history_in_pages()
             else:
                 if self.before:
                     self.anchor = "newest"
@@ -77,13 +143,66 @@ class HistoryFetcher(BaseHistoryFetcher):
                         -1, 0, self.config.get_setting("adapter", "max_history_limit")
                     )
 
-            return self._filter_and_limit_messages(
-                await self._parse_fetched_history(result)
-            )
+            history = await self._parse_fetched_history(result, attachments)
+
+            if self.cache_fetched_history:
+                return self._filter_and_limit_messages(history)
+            return [
+                msg.to_dict()
+                for msg in self._filter_and_limit_messages(history, attrgetter("timestamp"))
+            ]
         except Exception as e:
             logging.error(f"Error fetching conversation history: {e}", exc_info=True)
             return []
 
+    async def _fetch_history_in_pages(self) -> Tuple[List[Any], Dict[int, Any]]:
+        """Fetch history before the anchor page by page
+
+        Attachments of every page are downloaded in the background while
+        the next (older) page is being requested.
+
+        Returns:
+            Tuple of messages (oldest first) and their downloaded attachments
+            indexed by the message position
+        """
+        narrow = self._get_serialized_narrow()
+        page_size = self.config.get_setting("adapter", "history_page_size", 100)
+        remaining = self.history_limit
+        pages = []
+        downloads = []
+
+        try:
+            while remaining > 0:
+                num_before = min(page_size, remaining)
+                batch = await self._make_api_request(narrow, num_before, 0)
+                if not batch:
+                    break
+
+                pages.append(batch)
+                downloads.append(asyncio.create_task(self._download_attachments(batch)))
+
+                remaining -= len(batch)
+                if len(batch) < num_before:
+                    break
+                self.anchor = batch[0].get("id")
+
+            downloaded = await asyncio.gather(*downloads)
+        except BaseException:
+            for download in downloads:
+                download.cancel()
+            raise
+
+        history = []
+        attachments = {}
+
+        for batch, batch_attachments in zip(reversed(pages), reversed(downloaded)):
+            offset = len(history)
+            for i, attachment in batch_attachments.items():
+                attachments[offset + i] = attachment
+            history.extend(batch)
+
+        return history, attachments
+
     async def _fetch_history_in_batches(self,
                                         index: int,
                                         num_before: int,
@@ -98,7 +217,7 @@ class HistoryFetcher(BaseHistoryFetcher):
         Returns:
             List of messages
         """
-        narrow = json.dumps(self._get_narrow_for_conversation())
+        narrow = self._get_serialized_narrow()
         max_iterations = self.config.get_setting("adapter", "max_pagination_iterations")
         result = []
 
@@ -124,7 +243,7 @@ class HistoryFetcher(BaseHistoryFetcher):
         return result
 
     async def _make_api_request(self,
-                                narrow: List[Dict[str, Any]],
+                                narrow: str,
                                 num_before: int,
                                 num_after: int) -> List[Any]:
         """Make a history request
@@ -159,48 +278,58 @@ class HistoryFetcher(BaseHistoryFetcher):
 
         return result.get("messages", [])
 
-    async def _parse_fetched_history(self, history: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    async def _parse_fetched_history(self,
+                                     history: List[Dict[str, Any]],
+                                     attachments: Optional[Dict[int, Any]] = None
+                                     ) -> List[Union[Dict[str, Any], FormattedMessage]]:
         """Parse fetched history
 
         Args:
             history: List of message history
+            attachments: Already downloaded attachments indexed by the message
+                         position; downloaded here when not provided
 
         Returns:
-            List of formatted message history
+            List of formatted message history; messages that are not cached are
+            returned as FormattedMessage objects
         """
+        if attachments is None:
+            attachments = await self._download_attachments(history)
+
+        if self.cache_fetched_history:
+            delta = await self.conversation_manager.add_many_to_conversation([
+                {
+                    "message": msg,
+                    "attachments": attachments.get(i, []),
+                    "history_fetching_in_progress": True
+                }
+                for i, msg in enumerate(history)
+                if msg.get("sender_realm_str", "") != "zulipinternal"
+            ])
+            return delta.get("added_messages", [])
+
         formatted_history = []
-        attachments = await self._download_attachments(history)
+        conversation_id = self.conversation.conversation_id
+        is_direct_message = self.conversation.conversation_type == "private"
 
         for i, msg in enumerate(history):
-            if msg.get("sender_realm_str", "") == "zulipinternal":
+            get = msg.get
+
+            if get("sender_realm_str", "") == "zulipinternal":
                 continue
 
-            if self.cache_fetched_history:
-                delta = await self.conversation_manager.add_to_conversation(
-                    {
-                        "message": msg,
-                        "attachments": attachments.get(i, []),
-                        "history_fetching_in_progress": True
-                    }
-                )
-
-                for cached_msg in delta.get("added_messages", []):
-                    formatted_history.append(cached_msg)
-            else:
-                formatted_history.append({
-                    "message_id": str(msg.get("id", "")),
-                    "conversation_id": self.conversation.conversation_id,
-                    "sender": {
-                        "user_id": str(msg.get("sender_id", "")),
-                        "display_name": msg.get("sender_full_name", "")
-                    },
-                    "text": msg.get("content", ""),
-                    "thread_id": self._extract_reply_to_id(msg.get("content", "")),
-                    "timestamp": msg.get("timestamp", None),
-                    "attachments": attachments.get(i, []),
-                    "is_direct_message": self.conversation.conversation_type == "private",
-                    "mentions": []
-                })
+            content = get("content", "")
+            formatted_history.append(FormattedMessage(
+                str(get("id", "")),
+                conversation_id,
+                str(get("sender_id", "")),
+                get("sender_full_name", ""),
+                content,
+                self._extract_reply_to_id(content),
+                get("timestamp", None),
+                attachments.get(i, []),
+                is_direct_message
+            ))
 
         return formatted_history
 
@@ -213,26 +342,43 @@ class HistoryFetcher(BaseHistoryFetcher):
         Returns:
             Dictionary of download results
         """
-        download_tasks = []
-        message_map = {}
         attachments = {}
+        results = await asyncio.gather(
+            *(self._download_message_attachments(msg) for msg in history),
+            return_exceptions=True
+        )
 
-        for i, msg in enumerate(history):
-            task = self.downloader.download_attachment(msg)
-            download_tasks.append(task)
-            message_map[task] = i
-
-        for task, result in zip(
-            download_tasks,
-            await asyncio.gather(*download_tasks, return_exceptions=True)
-        ):
+        for i, result in enumerate(results):
             if isinstance(result, Exception):
                 logging.error(f"Error downloading attachment: {result}")
                 continue
-            attachments[message_map[task]] = result
+            attachments[i] = result
 
         return attachments
 
+    async def _download_message_attachments(self, message: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Download attachments of a single message, bounded by the download semaphore
+
+        Args:
+            message: Zulip message object
+
+        Returns:
+            List of dictionaries with attachment metadata
+        """
+        async with self.download_semaphore:
+            return await self.downloader.download_attachment(message)
+
+    def _get_serialized_narrow(self) -> str:
+        """Get the JSON-serialized narrow parameter, built once per fetcher
+
+        Returns:
+            Serialized narrow parameter for API call
+        """
+        if self._narrow is None:
+            narrow = self._get_narrow_for_conversation()
+            self._narrow = orjson.dumps(narrow).decode() if orjson else json.dumps(narrow)
+        return self._narrow
+
     def _get_narrow_for_conversation(self) -> List[Dict[str, Any]]:
         """Get the narrow parameter for a conversation
 
@@ -247,7 +393,7 @@ class HistoryFetcher(BaseHistoryFetcher):
 
         return [
             {"operator": "stream", "operand": self.conversation.conversation_name},
-            {"operator": "topic", "operand": self.conversation.conversation_id.split("/", 1)[1]}
+            {"operator": "topic", "operand": self.conversation.topic}
         ]
 
     def _extract_reply_to_id(self, content: str) -> str:
@@ -259,8 +405,7 @@ class HistoryFetcher(BaseHistoryFetcher):
         Returns:
             The reply to ID from the message
         """
-        pattern = r'\[said\]\([^\)]+/near/(\d+)\)'
-        match = re.search(pattern, content)
+        match = REPLY_TO_PATTERN.search(content, 0, self.REPLY_TO_SEARCH_WINDOW)
 
         if match:
             return match.group(1)
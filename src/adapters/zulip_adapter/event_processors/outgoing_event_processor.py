@@ -4,8 +4,9 @@ import logging
 import os
 
 from pydantic import BaseModel
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
+from src.adapters.zulip_adapter.api_client import ApiClient
 from src.adapters.zulip_adapter.attachment_loaders.uploader import Uploader
 from src.adapters.zulip_adapter.conversation.manager import Manager
 from src.adapters.zulip_adapter.event_processors.history_fetcher import HistoryFetcher
@@ -28,6 +29,11 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         """
         super().__init__(config, client, conversation_manager)
         self.uploader = Uploader(self.config, self.client)
+        self.api_client = ApiClient(self.config, self.client)
+        self.max_request_attempts = self.config.get_setting("adapter", "max_request_attempts", 3)
+        self.upload_semaphore = asyncio.Semaphore(
+            self.config.get_setting("attachments", "max_concurrent_uploads", 8)
+        )
 
     async def _send_message(self, conversation_info: Any, data: BaseModel) -> Dict[str, Any]:
         """Send a message to a chat
@@ -39,40 +45,91 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         Returns:
             Dict[str, Any]: Dictionary containing the status and message_ids
         """
-        messages = self._split_long_message(self._mention_users(conversation_info, data.mentions, data.text))
+        parts = iter(self._split_long_message(self._mention_users(conversation_info, data.mentions, data.text)))
 
-        for attachment in data.attachments:
-            await self.rate_limiter.limit_request("upload_attachment", conversation_info.conversation_id)
-            uri = await self.uploader.upload_attachment(attachment)
-            file_name = uri.split("/")[-1]
-            messages[-1] += f"\n[{file_name}]({uri})"
+        # Attachment links go to the last chunk, so earlier chunks are sent
+        # while the attachments are still being uploaded
+        upload_task = asyncio.create_task(
+            self._upload_attachments(conversation_info.conversation_id, data.attachments)
+        )
 
         to_field = conversation_info.to_fields()
         message_type = conversation_info.conversation_type
-        subject = None
-
-        if conversation_info.conversation_type == "stream":
-            subject = conversation_info.conversation_id.split("/")[1]
+        subject = conversation_info.topic if message_type == "stream" else None
 
         message_ids = []
-        for message in messages:
-            await self.rate_limiter.limit_request("message", conversation_info.conversation_id)
-            result = self.client.send_message({
-                "type": message_type,
-                "to": to_field,
-                "content": message,
-                "subject": subject
-            })
-
-            if not self._check_api_request_success(result, f"send message to {conversation_info.conversation_id}"):
-                return {"request_completed": False}
-
-            if "id" in result:
-                message_ids.append(str(result["id"]))
-
-        logging.info(f"Message sent to {conversation_info.conversation_id}")
+        try:
+            message = next(parts)
+            while message is not None:
+                next_message = next(parts, None)
+                if next_message is None:
+                    links = await upload_task
+                    if links is None:
+                        return {"request_completed": False}
+                    message += links
+
+                await self.rate_limiter.limit_request("message", conversation_info.conversation_id)
+                result = await self._call_with_retry(self.api_client.send_message, {
+                    "type": message_type,
+                    "to": to_field,
+                    "content": message,
+                    "subject": subject
+                }, idempotent=False)
+
+                if not self._check_api_request_success(result, f"send message to {conversation_info.conversation_id}"):
+                    return {"request_completed": False}
+
+                if "id" in result:
+                    message_ids.append(str(result["id"]))
+
+                message = next_message
+        finally:
+            upload_task.cancel()
+
+        logging.info("Message sent to %s", conversation_info.conversation_id)
         return {"request_completed": True, "message_ids": message_ids}
 
+    async def _upload_attachments(self, conversation_id: str, attachments: List[Any]) -> Optional[str]:
+        """Upload attachments concurrently
+
+        Args:
+            conversation_id: Conversation ID
+            attachments: Attachments to upload
+
+        Returns:
+            Optional[str]: Markdown links to the uploaded files in the original order
+                           or None if any upload failed
+        """
+        uris = await asyncio.gather(
+            *(self._upload_attachment(conversation_id, attachment) for attachment in attachments),
+            return_exceptions=True
+        )
+
+        links = ""
+        for attachment, uri in zip(attachments, uris):
+            if isinstance(uri, Exception) or not uri:
+                logging.error(f"Failed to upload attachment {attachment.file_name}: {uri}")
+                return None
+
+            file_name = uri.rpartition("/")[2]
+            links += f"\n[{file_name}]({uri})"
+
+        return links
+
+    async def _upload_attachment(self, conversation_id: str, attachment: Any) -> Optional[str]:
+        """Upload a single attachment, bounded by the upload semaphore
+
+        Args:
+            conversation_id: Conversation ID
+            attachment: Attachment details
+
+        Returns:
+            Optional[str]: URI of the uploaded file or None if upload failed
+        """
+        async with self.upload_semaphore:
+            await self.rate_limiter.limit_request("upload_attachment", conversation_id)
+            return await self.uploader.upload_attachment(attachment)
+
     async def _edit_message(self, conversation_info: Any, data: BaseModel) -> Dict[str, Any]:
         """Edit a message
 
@@ -91,12 +148,12 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         }
 
         if not self._check_api_request_success(
-            self.client.update_message(message_data),
+            await self._call_with_retry(self.api_client.update_message, message_data),
             f"edit message {data.message_id}"
         ):
             return {"request_completed": False}
 
-        logging.info(f"Message {data.message_id} edited successfully")
+        logging.info("Message %s edited successfully", data.message_id)
         return {"request_completed": True}
 
     async def _delete_message(self, data: BaseModel) -> Dict[str, Any]:
@@ -111,7 +168,8 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         await self.rate_limiter.limit_request("delete_message", data.conversation_id)
 
         if not self._check_api_request_success(
-            self.client.call_endpoint(
+            await self._call_with_retry(
+                self.api_client.call_endpoint,
                 f"messages/{int(data.message_id)}",
                 method="DELETE"
             ),
@@ -126,7 +184,7 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
             }
         )
 
-        logging.info(f"Message {data.message_id} deleted successfully")
+        logging.info("Message %s deleted successfully", data.message_id)
         return {"request_completed": True}
 
     async def _add_reaction(self, data: BaseModel) -> Dict[str, Any]:
@@ -146,12 +204,12 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         }
 
         if not self._check_api_request_success(
-            self.client.add_reaction(reaction_data),
+            await self._call_with_retry(self.api_client.add_reaction, reaction_data, idempotent=False),
             f"add reaction to {data.message_id}"
         ):
             return {"request_completed": False}
 
-        logging.info(f"Reaction {data.emoji} added to message {data.message_id}")
+        logging.info("Reaction %s added to message %s", data.emoji, data.message_id)
         return {"request_completed": True}
 
     async def _remove_reaction(self, data: BaseModel) -> Dict[str, Any]:
@@ -171,12 +229,12 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         }
 
         if not self._check_api_request_success(
-            self.client.remove_reaction(reaction_data),
+            await self._call_with_retry(self.api_client.remove_reaction, reaction_data),
             f"remove reaction from {data.message_id}"
         ):
             return {"request_completed": False}
 
-        logging.info(f"Reaction {data.emoji} removed from message {data.message_id}")
+        logging.info("Reaction %s removed from message %s", data.emoji, data.message_id)
         return {"request_completed": True}
 
     async def _fetch_history(self, data: BaseModel) -> List[Any]:
@@ -237,6 +295,45 @@ class OutgoingEventProcessor(BaseOutgoingEventProcessor):
         """
         return f"@**{user_info.display_name}** "
 
+    async def _call_with_retry(self,
+                               api_call: Callable[..., Awaitable[Dict[str, Any]]],
+                               *args: Any,
+                               idempotent: bool = True,
+                               **kwargs: Any) -> Dict[str, Any]:
+        """Call the Zulip API, retrying rate limited and transient failures
+
+        Zulip reports request errors with an error code; those are returned
+        right away. Rate limit hits and failures without a code (connection
+        errors, non-JSON server errors) are retried with exponential backoff.
+        A failure without a code may still have reached the server, so calls
+        that are not idempotent are only retried after a rate limit hit.
+
+        Args:
+            api_call: API client method
+            *args: Positional arguments of the call
+            idempotent: Whether repeating the call is safe if it already went through
+            **kwargs: Keyword arguments of the call
+
+        Returns:
+            Dict[str, Any]: Last API response
+        """
+        result = {}
+
+        for attempt in range(self.max_request_attempts):
+            result = await api_call(*args, **kwargs)
+
+            if not result or result.get("result", None) == "success":
+                return result
+            if result.get("code") != "RATE_LIMIT_HIT" and ("code" in result or not idempotent):
+                return result
+
+            if attempt < self.max_request_attempts - 1:
+                delay = max(2 ** attempt, result.get("retry-after", 0))
+                logging.warning(f"Zulip request failed ({result.get('msg', 'Unknown error')}), retrying in {delay}s")
+                await asyncio.sleep(delay)
+
+        return result
+
     def _check_api_request_success(self,
                                    result: Optional[Dict[str, Any]],
                                    operation: str) -> bool:
@@ -38,6 +38,7 @@ class BaseAdapter(ABC):
         self.config = config
         self.adapter_type = config.get_setting("adapter", "adapter_type")
         self.running = False
+        self.stopped = asyncio.Event()
         self.connected = False
         self.initialized = False
         self.monitoring_task = None
@@ -52,6 +53,7 @@ class BaseAdapter(ABC):
         """Start the adapter"""
         logging.info("Starting adapter...")
         self.running = True
+        self.stopped.clear()
 
         try:
             await self._setup_client()
@@ -73,6 +75,7 @@ class BaseAdapter(ABC):
             await self._emit_event("disconnect")
 
         self.running = False
+        self.stopped.set()
 
     @abstractmethod
     async def _setup_client(self) -> None:
@@ -166,6 +169,7 @@ class BaseAdapter(ABC):
         self.connected = False
 
         await self._emit_event("disconnect")
+        self.stopped.set()
         logging.info("Adapter stopped")
 
     @abstractmethod
@@ -5,7 +5,7 @@ import os
 
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional, Set
+from typing import Any, Dict, List, Optional, Set
 
 from src.core.utils.config import Config
 
@@ -21,6 +21,7 @@ class CachedAttachment:
     created_at: datetime = field(default_factory=datetime.now)
     conversations: Set[str] = field(default_factory=set)  # Set of conversation IDs where this appears
     url: Optional[str] = None
+    visited: bool = field(default=False, compare=False)  # Read since the last eviction pass
 
     @property
     def file_path(self) -> str:
@@ -32,6 +33,18 @@ class CachedAttachment:
         """Get the full path to the attachment file"""
         return os.path.join(self.attachment_type, self.attachment_id, f"{self.attachment_id}.json")
 
+    def cache_to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for API responses (without the file content)"""
+        return {
+            "attachment_id": self.attachment_id,
+            "filename": self.filename,
+            "content_type": self.content_type,
+            "content": None,
+            "size": self.size,
+            "processable": self.processable,
+            "url": self.url
+        }
+
 class AttachmentCache:
     """Tracks and manages information about Telegram attachments"""
 
@@ -101,6 +114,7 @@ class AttachmentCache:
                 await asyncio.sleep(self.cleanup_interval_hours * 3600)
                 await self._enforce_age_limit()
                 await self._enforce_total_limit()
+                self._clear_visited()
 
                 logging.info(f"Attachment cache maintenance completed")
         except asyncio.CancelledError:
@@ -133,9 +147,11 @@ class AttachmentCache:
         to_remove_count = len(self.attachments) - self.max_total_attachments
 
         async with self._lock:
+            # Unvisited attachments go first, so re-adding old media during
+            # history replay does not push out the attachments in use
             sorted_attachments = sorted(
                 self.attachments.items(),
-                key=lambda x: x[1].created_at
+                key=lambda x: (x[1].visited, x[1].created_at)
             )
 
             for attachment_id, _ in sorted_attachments[:to_remove_count]:
@@ -143,8 +159,13 @@ class AttachmentCache:
 
             logging.info(f"Removed attachments due to total limit")
 
+    def _clear_visited(self) -> None:
+        """Reset the visited flag of the attachments that survived a maintenance pass"""
+        for attachment in self.attachments.values():
+            attachment.visited = False
+
     def get_attachment(self, attachment_id: str) -> Optional[CachedAttachment]:
-        """Get an attachment from the cache
+        """Get an attachment from the cache and mark it as read
 
         Args:
             attachment_id: Attachment ID
@@ -152,7 +173,24 @@ class AttachmentCache:
         Returns:
             CachedAttachment or None if not found
         """
-        return self.attachments.get(attachment_id, {})
+        attachment = self.attachments.get(attachment_id)
+        if attachment:
+            attachment.visited = True
+        return attachment or {}
+
+    def peek_attachment(self, attachment_id: str) -> Optional[CachedAttachment]:
+        """Get an attachment from the cache without marking it as read
+
+        Used for bookkeeping and for building conversation snapshots, which
+        would otherwise mark every attachment of the conversation as in use.
+
+        Args:
+            attachment_id: Attachment ID
+
+        Returns:
+            CachedAttachment or None if not found
+        """
+        return self.attachments.get(attachment_id) or {}
 
     async def add_attachment(self, conversation_id: str, attachment_info: Dict[str, Any]) -> None:
         """Add an attachment to the cache
@@ -162,20 +200,50 @@ class AttachmentCache:
             attachment_info: Attachment info
         """
         async with self._lock:
-            if attachment_info["attachment_id"] not in self.attachments:
-                self.attachments[attachment_info["attachment_id"]] = CachedAttachment(
-                    attachment_id=attachment_info["attachment_id"],
-                    attachment_type=attachment_info["attachment_type"],
-                    filename=attachment_info["filename"],
-                    content_type=attachment_info["content_type"],
-                    created_at=attachment_info["created_at"],
-                    size=attachment_info["size"],
-                    processable=attachment_info["processable"],
-                    url=attachment_info.get("url", None)
-                )
-
-            self.attachments[attachment_info["attachment_id"]].conversations.add(conversation_id)
-            return self.attachments[attachment_info["attachment_id"]]
+            return self._add_attachment(conversation_id, attachment_info)
+
+    async def add_attachments(self,
+                              conversation_id: str,
+                              attachments_info: List[Dict[str, Any]]) -> List[CachedAttachment]:
+        """Add several attachments of a message to the cache under a single lock
+
+        Args:
+            conversation_id: Conversation ID
+            attachments_info: List of attachment info
+
+        Returns:
+            Cached attachments, in the order they were given
+        """
+        async with self._lock:
+            return [
+                self._add_attachment(conversation_id, attachment_info)
+                for attachment_info in attachments_info
+            ]
+
+    def _add_attachment(self, conversation_id: str, attachment_info: Dict[str, Any]) -> CachedAttachment:
+        """Add an attachment to the cache, the caller must hold the lock
+
+        Args:
+            conversation_id: Conversation ID
+            attachment_info: Attachment info
+
+        Returns:
+            Cached attachment
+        """
+        if attachment_info["attachment_id"] not in self.attachments:
+            self.attachments[attachment_info["attachment_id"]] = CachedAttachment(
+                attachment_id=attachment_info["attachment_id"],
+                attachment_type=attachment_info["attachment_type"],
+                filename=attachment_info["filename"],
+                content_type=attachment_info["content_type"],
+                created_at=attachment_info["created_at"],
+                size=attachment_info["size"],
+                processable=attachment_info["processable"],
+                url=attachment_info.get("url", None)
+            )
+
+        self.attachments[attachment_info["attachment_id"]].conversations.add(conversation_id)
+        return self.attachments[attachment_info["attachment_id"]]
 
     async def remove_attachment(self, attachment_id: str) -> None:
         """Remove an attachment from the cache
@@ -3,7 +3,7 @@ import logging
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from src.core.utils.config import Config
 
@@ -22,6 +22,7 @@ class CachedMessage:
     reactions: Dict[str, int] = field(default_factory=dict)
     is_pinned: bool = False
     attachments: Set[str] = field(default_factory=set)
+    visited: bool = field(default=False, compare=False)  # Read since the last eviction pass
 
     @property
     def age_seconds(self) -> float:
@@ -59,6 +60,7 @@ class MessageCache:
         self.max_total_messages = self.config.get_setting("caching", "max_total_messages")
         self.max_age_seconds = self.config.get_setting("caching", "max_age_hours") * 3600
         self._lock = asyncio.Lock()
+        self.on_evict: Optional[Callable[[CachedMessage], None]] = None  # called for every evicted message
         self.maintenance_task = asyncio.create_task(self._maintenance_loop()) if start_maintenance else None
 
     def __del__(self):
@@ -90,9 +92,32 @@ class MessageCache:
             CachedMessage object or None if not found
         """
         async with self._lock:
-            if conversation_id in self.messages and message_id in self.messages[conversation_id]:
-                return self.messages[conversation_id][message_id]
-            return None
+            message = self.messages.get(conversation_id, {}).get(message_id)
+            if message:
+                message.visited = True
+            return message
+
+    async def get_messages_by_ids(self,
+                                  conversation_id: str,
+                                  message_ids: List[str]) -> Dict[str, CachedMessage]:
+        """Get several messages of a conversation by ID in one pass
+
+        Args:
+            conversation_id: Conversation ID
+            message_ids: Message IDs
+
+        Returns:
+            Dictionary of the cached messages that were found, in the order of message_ids
+        """
+        async with self._lock:
+            messages = self.messages.get(conversation_id, {})
+            found = {
+                message_id: messages[message_id]
+                for message_id in message_ids if message_id in messages
+            }
+            for message in found.values():
+                message.visited = True
+            return found
 
     async def add_message(self, message_info: Dict[str, Any]) -> None:
         """Add a message to the cache
@@ -103,14 +128,12 @@ class MessageCache:
         Returns:
             CachedMessage object
         """
-        cached_message = await self.get_message_by_id(
-            message_info["conversation_id"], message_info["message_id"]
-        )
-
-        if cached_message:
-            return cached_message
-
         async with self._lock:
+            # Re-adding a known message (e.g. during history replay) is not a visit
+            cached_message = self.messages.get(message_info["conversation_id"], {}).get(message_info["message_id"])
+            if cached_message:
+                return cached_message
+
             if message_info["conversation_id"] not in self.messages:
                 self.messages[message_info["conversation_id"]] = {}
 
@@ -173,17 +196,68 @@ class MessageCache:
         try:
             while True:
                 await asyncio.sleep(int(self.config.get_setting("caching", "cache_maintenance_interval")))
-                async with self._lock:
-                    for conv_id in list(self.messages.keys()):
-                        if conv_id in self.messages:  # Check again in case it was removed
-                            if not self.messages[conv_id]:
-                                del self.messages[conv_id]
-                            await self._enforce_conversation_limit(conv_id)
-                    await self._enforce_total_limit()
+                await self._run_maintenance()
                 logging.debug(f"Cache maintenance completed. Current size: {sum(len(msgs) for msgs in self.messages.values())} messages")
         except Exception as e:
             logging.error(f"Error in cache maintenance: {e}")
 
+    async def _run_maintenance(self) -> None:
+        """Enforce the cache limits in a single maintenance pass
+
+        Each conversation keeps its newest messages. Messages read since the
+        last pass only get a second chance against the total limit, after which
+        their visited flags are cleared.
+        """
+        async with self._lock:
+            for conv_id in list(self.messages.keys()):
+                if conv_id in self.messages:  # Check again in case it was removed
+                    if not self.messages[conv_id]:
+                        del self.messages[conv_id]
+                        continue
+                    await self._enforce_conversation_limit(conv_id)
+            await self._enforce_total_limit()
+            self._clear_visited(msg for messages in self.messages.values() for msg in messages.values())
+
+    @staticmethod
+    def _eviction_key(message: CachedMessage) -> Tuple[bool, int]:
+        """Order messages for eviction: unvisited first, then oldest first
+
+        Messages that were read since the last pass get a second chance, so a
+        bulk history replay does not push out the messages that are in use.
+
+        Args:
+            message: CachedMessage object
+
+        Returns:
+            Sort key, smallest is evicted first
+        """
+        return (message.visited, message.timestamp or 0)
+
+    @staticmethod
+    def _clear_visited(messages: Iterable[CachedMessage]) -> None:
+        """Reset the visited flag of the messages that survived a maintenance pass
+
+        Args:
+            messages: Remaining messages
+        """
+        for message in messages:
+            message.visited = False
+
+    def _notify_evicted(self, messages: Iterable[CachedMessage]) -> None:
+        """Report evicted messages to the on_evict callback
+
+        Args:
+            messages: Evicted messages
+        """
+        if not self.on_evict:
+            return
+
+        for message in messages:
+            try:
+                self.on_evict(message)
+            except Exception as e:
+                logging.error(f"Error handling eviction of message {message.message_id}: {e}")
+
     async def _enforce_conversation_limit(self, conversation_id: str) -> None:
         """Ensure conversation doesn't exceed message limit
 
@@ -194,13 +268,11 @@ class MessageCache:
         if len(conversation) <= self.max_messages_per_conversation:
             return
 
-        sorted_messages = sorted(
-            conversation.values(),
-            key=lambda m: datetime.fromtimestamp(m.timestamp)
-        )
+        sorted_messages = sorted(conversation.values(), key=lambda msg: msg.timestamp or 0)
         self.messages[conversation_id] = {
             msg.message_id: msg for msg in sorted_messages[-self.max_messages_per_conversation:]
         }
+        self._notify_evicted(sorted_messages[:-self.max_messages_per_conversation])
 
     async def _enforce_total_limit(self) -> None:
         """Ensure total messages don't exceed limit"""
@@ -210,21 +282,12 @@ class MessageCache:
 
         to_remove = total_count - self.max_total_messages
 
-        all_messages = []
-        for conv_id, messages in self.messages.items():
-            for msg_id, msg in messages.items():
-                all_messages.append(
-                    (conv_id, msg_id, datetime.fromtimestamp(msg.timestamp))
-                )
-
-        all_messages.sort(key=lambda x: x[2])
-
-        for i in range(to_remove):
-            if i >= len(all_messages):
-                break
-            conv_id, msg_id, _ = all_messages[i]
-            if conv_id in self.messages and msg_id in self.messages[conv_id]:
-                del self.messages[conv_id][msg_id]
+        all_messages = [msg for messages in self.messages.values() for msg in messages.values()]
+        all_messages.sort(key=self._eviction_key)
+
+        for msg in all_messages[:to_remove]:
+            del self.messages[msg.conversation_id][msg.message_id]
+        self._notify_evicted(all_messages[:to_remove])
 
         empty_convs = [
             conv_id for conv_id, msgs in self.messages.items()
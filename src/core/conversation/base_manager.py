@@ -2,7 +2,8 @@ import asyncio
 import os
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
 from src.core.conversation.base_data_classes import BaseConversationInfo, ConversationDelta
 
@@ -14,6 +15,8 @@ from src.core.utils.config import Config
 class BaseManager(ABC):
     """Tracks and manages information about a conversations"""
 
+    CONVERSATION_LOCK_STRIPES = 16  # locks shared by all conversations, must be a power of two
+
     def __init__(self, config: Config, start_maintenance=False):
         """Initialize the conversation manager
 
@@ -24,6 +27,9 @@ class BaseManager(ABC):
         self.config = config
         self.conversations: Dict[str, BaseConversationInfo] = {}
         self._lock = asyncio.Lock()
+        self._conversation_locks: List[asyncio.Lock] = [
+            asyncio.Lock() for _ in range(self.CONVERSATION_LOCK_STRIPES)
+        ]
         self.message_cache = MessageCache(config, start_maintenance)
         self.attachment_cache = AttachmentCache(config, start_maintenance)
         self.message_builder = None # set by child class
@@ -40,41 +46,44 @@ class BaseManager(ABC):
         """
         return self.conversations.get(conversation_id, None)
 
-    def get_conversation_cache(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+    def get_conversation_cache(self, conversation_id: str) -> List[Dict[str, Any]]:
         """Get the conversation cache for a given conversation ID
 
         Args:
             conversation_id: The ID of the conversation to get info for
 
         Returns:
-            The conversation cache for the given conversation ID, or None if it doesn't exist
+            The cached messages of the conversation, or an empty list if it doesn't exist
         """
-        result = []
+        return list(self.iter_conversation_cache(conversation_id))
+
+    def iter_conversation_cache(self, conversation_id: str) -> Iterator[Dict[str, Any]]:
+        """Iterate over the conversation cache for a given conversation ID
 
+        Messages are converted one at a time, so callers that filter or
+        forward them do not hold the whole converted cache in memory. The
+        iteration must not be interleaved with awaits that may change the cache.
+
+        Args:
+            conversation_id: The ID of the conversation to get info for
+
+        Yields:
+            Dictionaries of the cached messages with text or attachments
+        """
         for msg in self.message_cache.messages.get(conversation_id, {}).values():
             if not msg.text and not msg.attachments:
                 continue
 
-            msg_dict = msg.cache_to_dict().copy()
+            msg_dict = msg.cache_to_dict()
             msg_dict["attachments"] = []
             msg_dict["mentions"] = []
 
             for attachment_id in msg.attachments:
-                cached_attachment = self.attachment_cache.get_attachment(attachment_id)
+                cached_attachment = self.attachment_cache.peek_attachment(attachment_id)
                 if cached_attachment:
-                    msg_dict["attachments"].append({
-                        "attachment_id": cached_attachment.attachment_id,
-                        "filename": cached_attachment.filename,
-                        "content_type": cached_attachment.content_type,
-                        "content": None,
-                        "size": cached_attachment.size,
-                        "processable": cached_attachment.processable,
-                        "url": cached_attachment.url
-                    })
-
-            result.append(msg_dict)
+                    msg_dict["attachments"].append(cached_attachment.cache_to_dict())
 
-        return result
+            yield msg_dict
 
     def get_conversation_member(self, conversation_id: str, user_id: str) -> Optional[UserInfo]:
         """Get the member info for a given conversation and user ID
@@ -108,39 +117,98 @@ class BaseManager(ABC):
         message = event.get("message", None)
         attachments = event.get("attachments", [])
 
-        async with self._lock:
+        if not message:
+            return {}
+
+        conversation_info = await self._get_or_create_conversation_info(message)
+        if not conversation_info:
+            return {}
+
+        # The delta reads conversation state that ingesting the message changes,
+        # so both steps run under the conversation's lock
+        async with self._get_conversation_lock(conversation_info.conversation_id):
+            delta = self._create_conversation_delta(event, conversation_info)
+            await self._ingest_message(event, message, conversation_info, delta, attachments)
+
+        return delta.to_dict()
+
+    async def add_many_to_conversation(self, events: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Add several messages (for example, fetched history) in one pass
+
+        Conversations for all messages are resolved first; the messages are
+        then ingested in order, each under the lock of its conversation.
+
+        Args:
+            events: List of event objects with the same keys as in add_to_conversation
+
+        Returns:
+            Dictionary with the added messages of all events
+        """
+        prepared = []
+
+        for event in events:
+            message = event.get("message", None)
             if not message:
-                return {}
+                continue
 
             conversation_info = await self._get_or_create_conversation_info(message)
             if not conversation_info:
-                return {}
+                continue
 
-            cached_msg = await self._create_message(
-                message,
-                conversation_info,
-                await self._get_user_info(event, conversation_info),
-                await self.thread_handler.add_thread_info(message, conversation_info)
-            )
+            prepared.append((event, message, conversation_info))
 
-            attachments = await self._update_attachment(conversation_info, attachments)
-            for attachment in attachments:
-                cached_msg.attachments.add(attachment["attachment_id"])
+        added_messages = []
+        for event, message, conversation_info in prepared:
+            async with self._get_conversation_lock(conversation_info.conversation_id):
+                delta = self._create_conversation_delta(event, conversation_info)
+                await self._ingest_message(
+                    event, message, conversation_info, delta, event.get("attachments", [])
+                )
+            added_messages.extend(delta.added_messages)
 
-            delta = self._create_conversation_delta(event, conversation_info)
-            delta.message_id = cached_msg.message_id
-            mentions = self._get_mentions(delta, cached_msg, message)
+        return {"added_messages": added_messages}
 
-            await self._update_delta_list(
-                conversation_id=conversation_info.conversation_id,
-                delta=delta,
-                list_to_update="added_messages",
-                cached_msg=cached_msg,
-                attachments=attachments,
-                mentions=mentions
-            )
+    async def _ingest_message(self,
+                              event: Dict[str, Any],
+                              message: Any,
+                              conversation_info: BaseConversationInfo,
+                              delta: ConversationDelta,
+                              attachments: List[Any]) -> CachedMessage:
+        """Cache a new message with its attachments and record it in the delta
 
-            return delta.to_dict()
+        Args:
+            event: Event object
+            message: Message object (type depends on the adapter)
+            conversation_info: Conversation info object
+            delta: Delta object to update
+            attachments: Attachment information
+
+        Returns:
+            Cached message object
+        """
+        # Every step is awaited directly; none of them spawns tasks, so the
+        # whole ingestion runs as a single coroutine chain on the caller's task
+        user_info = await self._get_user_info(event, conversation_info)
+        thread_info = await self.thread_handler.add_thread_info(message, conversation_info)
+        cached_msg = await self._create_message(message, conversation_info, user_info, thread_info)
+
+        attachments = await self._update_attachment(conversation_info, attachments)
+        for attachment in attachments:
+            cached_msg.attachments.add(attachment["attachment_id"])
+
+        delta.message_id = cached_msg.message_id
+        mentions = self._get_mentions(delta, cached_msg, message)
+
+        await self._update_delta_list(
+            conversation_id=conversation_info.conversation_id,
+            delta=delta,
+            target_list=delta.added_messages,
+            cached_msg=cached_msg,
+            attachments=attachments,
+            mentions=mentions
+        )
+
+        return cached_msg
 
     async def update_conversation(self, event: Any) -> Dict[str, Any]:
         """Update conversation information based on a received event
@@ -156,19 +224,19 @@ class BaseManager(ABC):
         """
         message = event.get("message", None)
 
-        async with self._lock:
-            if not message:
-                return {}
+        if not message:
+            return {}
 
-            conversation_id = await self._get_conversation_id_from_update(message)
-            if not conversation_id or conversation_id not in self.conversations:
-                return {}
+        conversation_id = await self._get_conversation_id_from_update(message)
+        conversation_info = self.conversations.get(conversation_id, None) if conversation_id else None
+        if not conversation_info:
+            return {}
 
-            conversation_info = self.conversations[conversation_id]
+        async with self._get_conversation_lock(conversation_id):
             delta = self._create_conversation_delta(event, conversation_info)
             await self._process_event(event, conversation_info, delta)
 
-            return delta.to_dict()
+        return delta.to_dict()
 
     async def delete_from_conversation(self,
                                        incoming_event: Any = None,
@@ -189,31 +257,65 @@ class BaseManager(ABC):
         if not conversation_info:
             return {}
 
-        delta = self._create_conversation_delta(event, conversation_info)
+        conversation_id = conversation_info.conversation_id
 
-        async with self._lock:
-            for msg_id in deleted_ids:
-                cached_msg = await self.message_cache.get_message_by_id(
-                    conversation_id=conversation_info.conversation_id,
-                    message_id=msg_id
-                )
-                if cached_msg:
-                    if not cached_msg.is_from_bot:
-                        delta.deleted_message_ids.append(msg_id)
+        async with self._get_conversation_lock(conversation_id):
+            delta = self._create_conversation_delta(event, conversation_info)
+            cached_msgs = await self.message_cache.get_messages_by_ids(conversation_id, deleted_ids)
+
+            for msg_id, cached_msg in cached_msgs.items():
+                if not cached_msg.is_from_bot:
+                    delta.deleted_message_ids.append(msg_id)
+
+                self.thread_handler.remove_thread_info(conversation_info, cached_msg)
+                await self.message_cache.delete_message(conversation_id, msg_id)
+                self._remove_message_from_conversation(conversation_info, msg_id)
+
+        return delta.to_dict()
+
+    def _get_conversation_lock(self, conversation_id: str) -> asyncio.Lock:
+        """Get the lock that serializes mutations of a single conversation
 
-                    self.thread_handler.remove_thread_info(
-                        conversation_info, cached_msg
-                    )
-                    await self.message_cache.delete_message(
-                        conversation_info.conversation_id, msg_id
-                    )
+        Events of unrelated conversations do not wait for each other. Conversations
+        are spread over a fixed set of lock stripes, so no lock has to be created
+        or kept per conversation. Callers that need the locks of several
+        conversations must take them through _lock_conversations.
 
-                    if hasattr(conversation_info, "messages"):
-                        conversation_info.messages.discard(msg_id)
-                    if hasattr(conversation_info, "pinned_messages"):
-                        conversation_info.pinned_messages.discard(msg_id)
+        Args:
+            conversation_id: Conversation ID
+
+        Returns:
+            Lock for the given conversation
+        """
+        return self._conversation_locks[self._get_conversation_lock_index(conversation_id)]
+
+    @asynccontextmanager
+    async def _lock_conversations(self, *conversation_ids: str) -> AsyncIterator[None]:
+        """Hold the locks of several conversations at once
+
+        Locks are acquired in stripe order, so two callers cannot deadlock each
+        other, and conversations sharing a stripe take its lock only once.
+
+        Args:
+            *conversation_ids: Conversation IDs
+        """
+        indices = sorted({self._get_conversation_lock_index(conversation_id) for conversation_id in conversation_ids})
 
-            return delta.to_dict()
+        async with AsyncExitStack() as stack:
+            for index in indices:
+                await stack.enter_async_context(self._conversation_locks[index])
+            yield
+
+    def _get_conversation_lock_index(self, conversation_id: str) -> int:
+        """Get the lock stripe of a conversation
+
+        Args:
+            conversation_id: Conversation ID
+
+        Returns:
+            Index of the conversation's lock
+        """
+        return hash(conversation_id) & (self.CONVERSATION_LOCK_STRIPES - 1)
 
     async def _update_attachment(self,
                                  conversation_info: BaseConversationInfo,
@@ -227,15 +329,24 @@ class BaseManager(ABC):
         Returns:
             List of dictionaries with attachment information
         """
+        # An attachment listed more than once in the same event (e.g. a retried
+        # upload) is only cached and returned once; attachments that are already
+        # known to the conversation are kept, as they belong to this message too
+        unique_attachments = {}
+        for attachment in attachments:
+            if attachment:
+                unique_attachments.setdefault(attachment["attachment_id"], attachment)
+
+        attachments = list(unique_attachments.values())
+        if not attachments:
+            return []
+
+        await self.attachment_cache.add_attachments(
+            conversation_info.conversation_id, attachments
+        )
         result = []
 
         for attachment in attachments:
-            if not attachment:
-                continue
-
-            await self.attachment_cache.add_attachment(
-                conversation_info.conversation_id, attachment
-            )
             conversation_info.attachments.add(attachment["attachment_id"])
             result.append({
                 "attachment_id": attachment["attachment_id"],
@@ -262,16 +373,32 @@ class BaseManager(ABC):
 
         if not conversation_id:
             return None
-        if conversation_id in self.conversations:
-            return self.conversations[conversation_id]
 
-        self.conversations[conversation_id] = self._create_conversation_info(
+        conversation_info = self.conversations.get(conversation_id)
+        if conversation_info is not None:
+            return conversation_info
+
+        conversation_info = self._create_conversation_info(
             conversation_id,
             await self._get_conversation_type(message),
             await self._get_conversation_name(message)
         )
 
-        return self.conversations[conversation_id]
+        return self.conversations.setdefault(conversation_id, conversation_info)
+
+    def _remove_message_from_conversation(self,
+                                          conversation_info: BaseConversationInfo,
+                                          message_id: str) -> None:
+        """Remove a message from the sets tracked by the conversation info
+
+        Args:
+            conversation_info: Conversation info object
+            message_id: ID of the removed message
+        """
+        if hasattr(conversation_info, "messages"):
+            conversation_info.messages.discard(message_id)
+        if hasattr(conversation_info, "pinned_messages"):
+            conversation_info.pinned_messages.discard(message_id)
 
     def _get_mentions(self, delta: ConversationDelta, cached_msg: CachedMessage, message: Any) -> List[str]:
         """Get the mentions for a given cached message
@@ -307,10 +434,9 @@ class BaseManager(ABC):
             delta.fetch_history = True
             conversation_info.just_started = False
 
-        try:
+        # Some platforms hand over their raw event objects (e.g. Discord deletes)
+        if isinstance(event, dict):
             delta.history_fetching_in_progress = event.get("history_fetching_in_progress", False)
-        except Exception as e:
-            pass
 
         return delta
 
@@ -343,7 +469,7 @@ class BaseManager(ABC):
     async def _update_delta_list(self,
                                  conversation_id: str,
                                  delta: ConversationDelta,
-                                 list_to_update: str,
+                                 target_list: List[Dict[str, Any]],
                                  message_id: Optional[str] = None,
                                  cached_msg: Optional[CachedMessage] = None,
                                  attachments: Optional[List[Dict[str, Any]]] = [],
@@ -353,7 +479,7 @@ class BaseManager(ABC):
         Args:
             conversation_id: Conversation ID
             delta: Delta object to update
-            list_to_update: List to update
+            target_list: Delta list to append the message to (e.g. delta.added_messages)
             message_id: Message ID
             cached_msg: Cached message object
             attachments: List of attachment dictionaries
@@ -366,7 +492,7 @@ class BaseManager(ABC):
             cached_msg = await self.message_cache.get_message_by_id(conversation_id, message_id)
 
         if cached_msg and (cached_msg.text or attachments):
-            getattr(delta, list_to_update).append({
+            target_list.append({
                 "message_id": cached_msg.message_id,
                 "conversation_id": conversation_id,
                 "sender":  {
@@ -202,6 +202,10 @@ class IncomingEventBuilder:
         """
         Process a message delta and return a MessageReceivedData object.
 
+        Message deltas are built by the conversation managers from cached messages,
+        so they are already normalized; the models are constructed without validation,
+        which keeps large history batches cheap. The event wrapping them is still validated.
+
         Args:
             delta: Event change information
 
@@ -212,19 +216,22 @@ class IncomingEventBuilder:
         sender_id = sender["user_id"] if "user_id" in sender and sender["user_id"] else "Unknown"
         sender_name = sender["display_name"] if "display_name" in sender and sender["display_name"] else "Unknown User"
 
-        return MessageReceivedData(
+        return MessageReceivedData.model_construct(
             adapter_name=self.adapter_name,
             adapter_id=self.adapter_id,
             message_id=delta["message_id"],
             conversation_id=delta["conversation_id"],
-            sender=SenderInfo(
+            sender=SenderInfo.model_construct(
                 user_id=sender_id,
                 display_name=sender_name
             ),
             text=delta.get("text", ""),
             thread_id=delta.get("thread_id"),
             is_direct_message=delta.get("is_direct_message", True),
-            attachments=[IncomingAttachmentInfo(**attachment) for attachment in delta.get("attachments", [])],
+            attachments=[
+                IncomingAttachmentInfo.model_construct(**attachment)
+                for attachment in delta.get("attachments", [])
+            ],
             timestamp=delta["timestamp"],
             mentions=delta.get("mentions", [])
         )
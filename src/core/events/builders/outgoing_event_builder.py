@@ -5,6 +5,7 @@ from src.core.events.models.outgoing_events import (
     EditMessageData,
     DeleteMessageData,
     ReactionData,
+    ReactionsData,
     FetchHistoryData,
     FetchAttachmentData,
     PinStatusData,
@@ -14,6 +15,8 @@ from src.core.events.models.outgoing_events import (
     DeleteMessageEvent,
     AddReactionEvent,
     RemoveReactionEvent,
+    AddReactionsEvent,
+    RemoveReactionsEvent,
     FetchHistoryEvent,
     FetchAttachmentEvent,
     PinMessageEvent,
@@ -73,6 +76,18 @@ class OutgoingEventBuilder:
                 data=ReactionData(**event_data)
             )
 
+        if event_type == "add_reactions":
+            return AddReactionsEvent(
+                event_type=event_type,
+                data=ReactionsData(**event_data)
+            )
+
+        if event_type == "remove_reactions":
+            return RemoveReactionsEvent(
+                event_type=event_type,
+                data=ReactionsData(**event_data)
+            )
+
         if event_type == "fetch_history":
             return FetchHistoryEvent(
                 event_type=event_type,
@@ -17,6 +17,28 @@ class RequestEventBuilder:
         """Initialize the builder with the data"""
         self.adapter_type = adapter_type
 
+    def build_status(self,
+                     request_id: str,
+                     internal_request_id: Optional[str] = None) -> Dict[str, Any]:
+        """Build a request event without data (e.g. request_queued) as a dictionary
+
+        The shape of these events is fixed, so the model is not built and dumped
+        for each of them; the result equals build(request_id, internal_request_id).model_dump().
+
+        Args:
+            request_id: The request ID
+            internal_request_id: The internal request ID
+
+        Returns:
+            The request event as a dictionary
+        """
+        return {
+            "adapter_type": self.adapter_type,
+            "request_id": request_id,
+            "internal_request_id": internal_request_id,
+            "data": None
+        }
+
     def build(self,
               request_id: str,
               internal_request_id: Optional[str] = None,
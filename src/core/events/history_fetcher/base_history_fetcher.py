@@ -4,7 +4,8 @@ import logging
 import re
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional
 
 from src.core.conversation.base_manager import BaseManager
 from src.core.rate_limiter.rate_limiter import RateLimiter
@@ -75,17 +76,20 @@ class BaseHistoryFetcher(ABC):
             )
         )
 
-    def _filter_and_limit_messages(self, history: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _filter_and_limit_messages(self,
+                                   history: List[Any],
+                                   timestamp: Callable[[Any], Any] = itemgetter("timestamp")) -> List[Any]:
         """Apply the history limit to the formatted history
 
         Args:
             history: List of formatted message history
+            timestamp: Gets the timestamp of a message, by default its "timestamp" key
 
         Returns:
             List of formatted message history
         """
-        history = self._filter_history(history)
-        history.sort(key=lambda x: x["timestamp"])
+        history = self._filter_history(history, timestamp)
+        history.sort(key=timestamp)
 
         if self.before:
             index = len(history) - self.history_limit
@@ -97,19 +101,22 @@ class BaseHistoryFetcher(ABC):
 
         return history
 
-    def _filter_history(self, history: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _filter_history(self,
+                        history: List[Any],
+                        timestamp: Callable[[Any], Any] = itemgetter("timestamp")) -> List[Any]:
         """Filter history according to timestamps
 
         Args:
             history: List of formatted message history
+            timestamp: Gets the timestamp of a message, by default its "timestamp" key
 
         Returns:
             List of filtered message history
         """
         if self.before:
-            return [msg for msg in history if msg["timestamp"] < self.before]
+            return [msg for msg in history if timestamp(msg) < self.before]
         if self.after:
-            return [msg for msg in history if msg["timestamp"] > self.after]
+            return [msg for msg in history if timestamp(msg) > self.after]
         return history
 
     @abstractmethod
@@ -1,14 +1,21 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Any, Dict, List, Optional
 
+# Incoming models are built once per event and only dumped afterwards
+FROZEN_MODEL_CONFIG = ConfigDict(frozen=True)
+
 # Base models
 class SenderInfo(BaseModel):
     """Model for sender information"""
+    model_config = FROZEN_MODEL_CONFIG
+
     user_id: str
     display_name: str
 
 class IncomingAttachmentInfo(BaseModel):
     """Model for attachment information"""
+    model_config = FROZEN_MODEL_CONFIG
+
     attachment_id: str
     filename: str
     size: int
@@ -20,6 +27,8 @@ class IncomingAttachmentInfo(BaseModel):
 # Data models for incoming events
 class BaseIncomingData(BaseModel):
     """Base data model for incoming events"""
+    model_config = FROZEN_MODEL_CONFIG
+
     adapter_name: str
     adapter_id: str
 
@@ -68,6 +77,8 @@ class ConversationStartedData(BaseIncomingData):
 # Base incoming event model
 class BaseIncomingEvent(BaseModel):
     """Base model for all events sent to the framework"""
+    model_config = FROZEN_MODEL_CONFIG
+
     adapter_type: str
     event_type: str
     data: Dict[str, Any]
@@ -39,6 +39,12 @@ class ReactionData(BaseModel):
     message_id: str
     emoji: str
 
+class ReactionsData(BaseModel):
+    """Add/remove several reactions request data model"""
+    conversation_id: str
+    message_id: str
+    emojis: List[str]
+
 class FetchHistoryData(BaseModel):
     """Fetch history request data model"""
     conversation_id: str
@@ -81,6 +87,16 @@ class RemoveReactionEvent(BaseOutgoingEvent):
     event_type: str = "remove_reaction"
     data: ReactionData
 
+class AddReactionsEvent(BaseOutgoingEvent):
+    """Complete add reactions event model"""
+    event_type: str = "add_reactions"
+    data: ReactionsData
+
+class RemoveReactionsEvent(BaseOutgoingEvent):
+    """Complete remove reactions event model"""
+    event_type: str = "remove_reactions"
+    data: ReactionsData
+
 class FetchHistoryEvent(BaseOutgoingEvent):
     """Complete fetch history event model"""
     event_type: str = "fetch_history"
@@ -8,10 +8,11 @@ import os
 from abc import ABC, abstractmethod
 from enum import Enum
 from pydantic import BaseModel
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List
 
 from src.core.conversation.base_data_classes import BaseConversationInfo, UserInfo
 from src.core.events.builders.outgoing_event_builder import OutgoingEventBuilder
+from src.core.events.models.outgoing_events import ReactionData
 from src.core.rate_limiter.rate_limiter import RateLimiter
 from src.core.utils.config import Config
 
@@ -22,6 +23,8 @@ class OutgoingEventType(str, Enum):
     DELETE_MESSAGE = "delete_message"
     ADD_REACTION = "add_reaction"
     REMOVE_REACTION = "remove_reaction"
+    ADD_REACTIONS = "add_reactions"
+    REMOVE_REACTIONS = "remove_reactions"
     FETCH_HISTORY = "fetch_history"
     FETCH_ATTACHMENT = "fetch_attachment"
     PIN_MESSAGE = "pin_message"
@@ -42,6 +45,8 @@ class BaseOutgoingEventProcessor(ABC):
         self.client = client
         self.conversation_manager = conversation_manager
         self.adapter_type = self.config.get_setting("adapter", "adapter_type")
+        self.download_dir = self.config.get_setting("attachments", "storage_dir")
+        self.max_message_length = self.config.get_setting("adapter", "max_message_length")
         self.rate_limiter = RateLimiter.get_instance(self.config)
         self.outgoing_event_builder = OutgoingEventBuilder()
 
@@ -61,6 +66,8 @@ class BaseOutgoingEventProcessor(ABC):
                 OutgoingEventType.DELETE_MESSAGE: self._handle_delete_message_event,
                 OutgoingEventType.ADD_REACTION: self._handle_add_reaction_event,
                 OutgoingEventType.REMOVE_REACTION: self._handle_remove_reaction_event,
+                OutgoingEventType.ADD_REACTIONS: self._handle_add_reactions_event,
+                OutgoingEventType.REMOVE_REACTIONS: self._handle_remove_reactions_event,
                 OutgoingEventType.FETCH_HISTORY: self._handle_fetch_history_event,
                 OutgoingEventType.FETCH_ATTACHMENT: self._handle_fetch_attachment_event,
                 OutgoingEventType.PIN_MESSAGE: self._handle_pin_event,
@@ -87,10 +94,7 @@ class BaseOutgoingEventProcessor(ABC):
             attachment = self.conversation_manager.attachment_cache.get_attachment(data.attachment_id)
 
             if attachment:
-                local_file_path = os.path.join(
-                    self.config.get_setting("attachments", "storage_dir"),
-                    attachment.file_path
-                )
+                local_file_path = os.path.join(self.download_dir, attachment.file_path)
                 with open(local_file_path, "rb") as f:
                     return {
                         "request_completed": True,
@@ -235,6 +239,73 @@ class BaseOutgoingEventProcessor(ABC):
         """Remove a reaction from a message"""
         raise NotImplementedError("Child classes must implement _remove_reaction")
 
+    async def _handle_add_reactions_event(self, data: BaseModel) -> Dict[str, Any]:
+        """Add several reactions to a message concurrently
+
+        Args:
+            data: Event data containing conversation_id, message_id, and emojis
+
+        Returns:
+            Dict[str, Any]: Dictionary containing the status
+        """
+        return await self._handle_reactions(self._add_reaction, data)
+
+    async def _handle_remove_reactions_event(self, data: BaseModel) -> Dict[str, Any]:
+        """Remove several reactions from a message concurrently
+
+        Args:
+            data: Event data containing conversation_id, message_id, and emojis
+
+        Returns:
+            Dict[str, Any]: Dictionary containing the status
+        """
+        return await self._handle_reactions(self._remove_reaction, data)
+
+    async def _handle_reactions(self, handler: Any, data: BaseModel) -> Dict[str, Any]:
+        """Run a reaction handler for every emoji of a request
+
+        Reactions run concurrently unless the adapter updates them in a way
+        that is not safe to interleave. Each handler takes its rate limit slot
+        first, and the rate limiter hands out slots one at a time, so only the
+        API requests overlap; they are paced exactly as sequential reactions.
+
+        Args:
+            handler: Single reaction handler (_add_reaction or _remove_reaction)
+            data: Event data containing conversation_id, message_id, and emojis
+
+        Returns:
+            Dict[str, Any]: Dictionary containing the status, completed only if every reaction succeeded
+        """
+        reactions = [
+            ReactionData(conversation_id=data.conversation_id, message_id=data.message_id, emoji=reaction_emoji)
+            for reaction_emoji in data.emojis
+        ]
+
+        if self._reactions_can_run_concurrently():
+            results = await asyncio.gather(
+                *(handler(reaction) for reaction in reactions), return_exceptions=True
+            )
+        else:
+            results = []
+            for reaction in reactions:
+                try:
+                    results.append(await handler(reaction))
+                except Exception as e:
+                    results.append(e)
+
+        request_completed = True
+        for reaction_emoji, result in zip(data.emojis, results):
+            if isinstance(result, Exception):
+                logging.error(
+                    f"Failed to update reaction {reaction_emoji} on message {data.message_id}: {result}",
+                    exc_info=result
+                )
+                request_completed = False
+            elif not result.get("request_completed", False):
+                request_completed = False
+
+        return {"request_completed": request_completed}
+
     async def _handle_fetch_history_event(self, data: BaseModel) -> Dict[str, Any]:
         """Fetch history of a conversation
 
@@ -321,53 +392,61 @@ class BaseOutgoingEventProcessor(ABC):
         """Check if a conversation should exist before sending or editing a message"""
         raise NotImplementedError("Child classes must implement _conversation_should_exist")
 
-    def _split_long_message(self, text: str) -> List[str]:
+    def _reactions_can_run_concurrently(self) -> bool:
+        """Check if several reactions to the same message can be updated concurrently
+
+        Returns:
+            bool: True if reactions can be updated concurrently, False otherwise
+        """
+        return True
+
+    def _split_long_message(self, text: str) -> Iterator[str]:
         """Split a long message at sentence boundaries to fit within adapter's message length limits.
 
+        Parts are yielded one at a time, so a part can be sent before the next one is cut.
+
         Args:
             text: The message text to split
 
-        Returns:
-            List of message parts, each under the maximum length
+        Yields:
+            Message parts, each under the maximum length
         """
-        max_length = self.config.get_setting("adapter", "max_message_length")
+        max_length = self.max_message_length
 
         if len(text) <= max_length:
-            return [text]
+            yield text
+            return
 
         sentence_endings = [".", "!", "?", ".\n", "!\n", "?\n", ".\t", "!\t", "?\t"]
-        message_parts = []
-        remaining_text = text
+        start = 0
 
-        while len(remaining_text) > max_length:
+        while len(text) - start > max_length:
             cut_point = max_length
 
             for i in range(max_length - 1, max(0, max_length - 200), -1):
                 for ending in sentence_endings:
                     end_pos = i - len(ending) + 1
-                    if end_pos >= 0 and remaining_text[end_pos:i+1] == ending:
+                    if end_pos >= 0 and text.startswith(ending, start + end_pos, start + i + 1):
                         cut_point = i + 1  # Include the ending punctuation and space
                         break
                 if cut_point < max_length:
                     break
             if cut_point == max_length:
-                last_newline = remaining_text.rfind("\n", 0, max_length)
-                if last_newline > max_length // 2:
-                    cut_point = last_newline + 1
+                last_newline = text.rfind("\n", start, start + max_length)
+                if last_newline != -1 and last_newline - start > max_length // 2:
+                    cut_point = last_newline - start + 1
                 else:
-                    last_space = remaining_text.rfind(" ", max_length // 2, max_length)
-                    if last_space > 0:
-                        cut_point = last_space + 1
+                    last_space = text.rfind(" ", start + max_length // 2, start + max_length)
+                    if last_space != -1 and last_space - start > 0:
+                        cut_point = last_space - start + 1
                     else:
                         cut_point = max_length
 
-            message_parts.append(remaining_text[:cut_point])
-            remaining_text = remaining_text[cut_point:]
-
-        if remaining_text:
-            message_parts.append(remaining_text)
+            yield text[start:start + cut_point]
+            start += cut_point
 
-        return message_parts
+        if start < len(text):
+            yield text[start:]
 
     def _mention_users(self,
                        conversation_info: BaseConversationInfo,
@@ -47,6 +47,26 @@ class RateLimiter:
         self.global_request_count = 0
         self.per_conversation_request_counts: Dict[str, int] = {}
 
+        # Request budget reported by the server (if the platform reports it)
+        self.server_remaining: Optional[int] = None
+        self.server_reset_time = 0.0
+
+        # Serializes slot reservations so concurrent callers are paced one after another
+        self._lock = asyncio.Lock()
+
+    def update_server_limits(self, remaining: int, reset_time: float) -> None:
+        """Update the request budget reported by the server
+
+        The remaining requests are spread evenly over the rest of the
+        server's rate limit window.
+
+        Args:
+            remaining: Number of requests left in the current window
+            reset_time: Unix time at which the window resets
+        """
+        self.server_remaining = max(0, remaining)
+        self.server_reset_time = reset_time
+
     async def get_wait_time(self,
                             request_type: str,
                             conversation_id: Optional[str] = None) -> float:
@@ -60,51 +80,117 @@ class RateLimiter:
             Wait time in seconds
         """
         try:
-          current_time = time.time()
-          wait_times = []
-
-          global_time_since = current_time - self.last_global_request
-          global_wait = max(0, (60 / self.global_rpm) - global_time_since)
-          wait_times.append(global_wait)
-
-          if conversation_id:
-              conversation_time_since = current_time - self.last_conversation_requests.get(conversation_id, 0)
-              conversation_wait = max(0, (60 / self.per_conversation_rpm) - conversation_time_since)
-              wait_times.append(conversation_wait)
+            current_time = time.time()
+            wait_times = [self._get_global_wait(current_time)]
 
-          if request_type == "message":
-              msg_time_since = current_time - self.last_message_request
-              msg_wait = max(0, (60 / self.message_rpm) - msg_time_since)
-              wait_times.append(msg_wait)
+            if conversation_id:
+                wait_times.append(self._get_conversation_wait(conversation_id, current_time))
+            if request_type == "message":
+                wait_times.append(self._get_message_wait(current_time))
 
-          return max(wait_times)
+            return max(wait_times)
         except Exception as e:
             logging.error(f"Error calculating wait time: {e}")
             return 1.0
 
+    def _get_global_wait(self, current_time: float) -> float:
+        """Get the wait imposed by the global and the server-reported limits
+
+        Args:
+            current_time: Current time
+
+        Returns:
+            Wait time in seconds
+        """
+        global_time_since = current_time - self.last_global_request
+        global_wait = max(0, (60 / self.global_rpm) - global_time_since)
+
+        if self.server_remaining is None or self.server_reset_time <= current_time:
+            return global_wait
+
+        window_left = self.server_reset_time - current_time
+        if self.server_remaining == 0:
+            return max(global_wait, window_left)
+        return max(global_wait, window_left / self.server_remaining - global_time_since)
+
+    def _get_conversation_wait(self, conversation_id: str, current_time: float) -> float:
+        """Get the wait imposed by the per-conversation limit
+
+        Args:
+            conversation_id: Conversation ID
+            current_time: Current time
+
+        Returns:
+            Wait time in seconds
+        """
+        conversation_time_since = current_time - self.last_conversation_requests.get(conversation_id, 0)
+        return max(0, (60 / self.per_conversation_rpm) - conversation_time_since)
+
+    def _get_message_wait(self, current_time: float) -> float:
+        """Get the wait imposed by the message limit
+
+        Args:
+            current_time: Current time
+
+        Returns:
+            Wait time in seconds
+        """
+        msg_time_since = current_time - self.last_message_request
+        return max(0, (60 / self.message_rpm) - msg_time_since)
+
     async def limit_request(self,
                             request_type: str,
                             conversation_id: Optional[str] = None) -> None:
         """Apply rate limiting before making a request
 
+        The wait is computed and the request's slots are reserved under a lock,
+        so concurrent callers are spaced out instead of all computing the same
+        wait; the wait itself happens outside the lock. The global and message
+        slots are reserved at the earliest time their own limits allow, so a
+        request waiting for a busy conversation does not hold back requests
+        for other conversations.
+
         Args:
             request_type: Type of request (message, media, general)
             conversation_id: Conversation ID for per-conversation limits
         """
-        wait_time = await self.get_wait_time(request_type, conversation_id)
+        async with self._lock:
+            wait_time = await self.get_wait_time(request_type, conversation_id)
+            self._reserve_request(request_type, conversation_id, wait_time)
 
         if wait_time > 0:
             logging.debug(f"Rate limiting: waiting {wait_time:.2f} seconds")
             await asyncio.sleep(wait_time)
 
+    def _reserve_request(self,
+                         request_type: str,
+                         conversation_id: Optional[str],
+                         wait_time: float) -> None:
+        """Record a request that will be sent after wait_time, the caller must hold the lock
+
+        Args:
+            request_type: Type of request (message, media, general)
+            conversation_id: Conversation ID for per-conversation limits
+            wait_time: Seconds until the request is sent
+        """
         current_time = time.time()
-        self.last_global_request = current_time
+
+        try:
+            global_wait = min(wait_time, self._get_global_wait(current_time))
+            message_wait = min(wait_time, self._get_message_wait(current_time))
+        except Exception:
+            global_wait = message_wait = wait_time
+
+        self.last_global_request = current_time + global_wait
 
         if conversation_id:
-            self.last_conversation_requests[conversation_id] = current_time
+            self.last_conversation_requests[conversation_id] = current_time + wait_time
             self.per_conversation_request_counts[conversation_id] = self.per_conversation_request_counts.get(conversation_id, 0) + 1
 
         if request_type == "message":
-            self.last_message_request = current_time
+            self.last_message_request = current_time + message_wait
+
+        if self.server_remaining:
+            self.server_remaining -= 1
 
         self.global_request_count += 1
@@ -2,25 +2,60 @@ import asyncio
 import logging
 import socketio
 import time
+import uuid
 
 from aiohttp import web
+from collections import OrderedDict, deque
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from typing import Deque, Dict, Any, Optional
 
 from src.core.events.builders.request_event_builder import RequestEventBuilder
 from src.core.utils.config import Config
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class OrjsonPacketCodec:
+    """json-compatible module for Socket.IO packets, backed by orjson
+
+    python-socketio calls dumps with separators=(",", ":"), which matches
+    orjson's compact output, so extra keyword arguments are ignored.
+    """
+
+    @staticmethod
+    def dumps(value: Any, **kwargs) -> str:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    @staticmethod
+    def loads(value: Any, **kwargs) -> Any:
+        return orjson.loads(value)
+
+@dataclass(slots=True)
 class SocketIOQueuedEvent:
     """Represents an event queued for processing"""
     data: Dict[str, Any]  # Event data
     sid: str  # Socket ID of sender
-    timestamp: float  # When it was queued
+    timestamp: float  # When it was queued (time.monotonic())
     request_id: Optional[str] = None  # Optional ID for tracking/cancellation
 
 class SocketIOServer:
     """Socket.IO server for communicating with LLM services"""
 
+    # Fetched histories longer than this are validated off the event loop
+    HISTORY_VALIDATION_THRESHOLD = 50
+    # Room joined by every connected LLM client, status events are emitted to it
+    CLIENTS_ROOM = "llm"
+    # Most queued events sent to the adapter at the same time
+    MAX_INFLIGHT_EVENTS = 16
+    # Most pending requests tracked, the oldest one is failed beyond that
+    MAX_PENDING_REQUESTS = 10000
+    # Most events waiting in the queue, new requests are failed beyond that
+    MAX_QUEUED_EVENTS = 1000
+    # Adapter result keys forwarded to the client, the first one present wins
+    RESULT_KEYS = ("message_ids", "history", "content", "file_content")
+
     def __init__(self, config: Config):
         """Initialize the Socket.IO server
 
@@ -34,30 +69,34 @@ class SocketIOServer:
             cors_allowed_origins=self.config.get_setting(
                 "socketio", "cors_allowed_origins", "*"
             ),
-            logger=True
+            logger=self.config.get_setting("socketio", "debug_logging", False),
+            json=OrjsonPacketCodec if orjson else None
         )
         self.app = web.Application()
         self.sio.attach(self.app)
         self.runner = None
         self.site = None
         self.adapter = None  # Will be set later
-        self.connected_clients = set()  # Track connected clients
+        self._process_outgoing_event = None  # Bound adapter.process_outgoing_event
 
-        self.event_queue = asyncio.Queue()
+        self.event_queue = asyncio.Queue(maxsize=self.MAX_QUEUED_EVENTS)
         self.processing_task = None
         self.is_processing = False
-        self.request_map = {}
+        self._inflight = asyncio.Semaphore(self.MAX_INFLIGHT_EVENTS)
+        self._inflight_tasks = set()
+        # conversation_id -> events waiting for the running event of the conversation
+        self._conversation_backlogs: Dict[Optional[str], Deque[SocketIOQueuedEvent]] = {}
+        self._backlogged_events = 0
+        self.request_map: "OrderedDict[str, SocketIOQueuedEvent]" = OrderedDict()
         self.request_event_builder = RequestEventBuilder(self.adapter_type)
 
         @self.sio.event
         async def connect(sid, environ):
-            self.connected_clients.add(sid)
+            await self.sio.enter_room(sid, self.CLIENTS_ROOM)
             logging.info(f"LLM client connected: {sid}")
 
         @self.sio.event
         async def disconnect(sid):
-            if sid in self.connected_clients:
-                self.connected_clients.remove(sid)
             logging.info(f"LLM client disconnected: {sid}.")
 
         @self.sio.event
@@ -70,17 +109,33 @@ class SocketIOServer:
             """Handle request to send a message to adapter"""
             await self._queue_event(sid, data)
 
-    async def emit_event(self, event: str, data: Dict[str, Any] = {}) -> None:
+    async def emit_event(self, event: str, data: Optional[Dict[str, Any]] = None) -> None:
         """Emit a status event to all connected clients
 
         Args:
             event: Event type
-            data: Event data
+            data: Event data, an empty object is sent when omitted
         """
-        await self.sio.emit(event, data)
+        if self._has_clients(self.CLIENTS_ROOM):
+            await self.sio.emit(event, data if data is not None else {}, room=self.CLIENTS_ROOM)
         #print(f"Emitted event: {event} with data: {data}")
         #logging.info(f"Emitted event: {event} with data: {data}")
 
+    def _has_clients(self, room: str) -> bool:
+        """Check whether an emit to a room would reach anyone
+
+        Every client is also in a room named after its sid, so this works for
+        replies to a single client too; python-socketio would otherwise encode
+        the packet before finding that there is nobody to send it to.
+
+        Args:
+            room: Room name or client sid
+
+        Returns:
+            True if at least one client is in the room, False otherwise
+        """
+        return bool(self.sio.manager.rooms.get("/", {}).get(room))
+
     def set_adapter(self, adapter: Any) -> None:
         """Set the reference to the adapter instance
 
@@ -88,6 +143,7 @@ class SocketIOServer:
             adapter: Adapter instance
         """
         self.adapter = adapter
+        self._process_outgoing_event = adapter.process_outgoing_event
 
     async def start(self) -> None:
         """Start the Socket.IO server"""
@@ -114,6 +170,9 @@ class SocketIOServer:
                     await self.processing_task
                 except asyncio.CancelledError:
                     pass
+            for task in list(self._inflight_tasks):
+                task.cancel()
+            await asyncio.gather(*self._inflight_tasks, return_exceptions=True)
             logging.info("Event queue processor stopped")
 
         if self.runner:
@@ -130,22 +189,47 @@ class SocketIOServer:
         Returns:
             request_id: ID of the queued request
         """
-        request_id = data.get("request_id", f"req_{sid}_{int(time.time())}")
-        event = SocketIOQueuedEvent(data, sid, time.time(), request_id)
-        self.request_map[request_id] = event
+        request_id = data.get("request_id") or f"req_{sid}_{uuid.uuid4().hex}"
+        internal_request_id = data.get("internal_request_id", None)
+        event = SocketIOQueuedEvent(data, sid, time.monotonic(), request_id)
+
+        try:
+            if self._backlogged_events >= self.MAX_QUEUED_EVENTS:
+                raise asyncio.QueueFull()
+            self.event_queue.put_nowait(event)
+        except asyncio.QueueFull:
+            logging.warning("Event queue is full, rejecting request %s.", request_id)
+            await self.sio.emit(
+                "request_failed",
+                self.request_event_builder.build_status(request_id, internal_request_id),
+                room=sid
+            )
+            return
 
-        await self.event_queue.put(event)
-        logging.info(f"Queued event with request_id {request_id}.")
+        self.request_map[request_id] = event
+        if len(self.request_map) > self.MAX_PENDING_REQUESTS:
+            await self._evict_oldest_request()
+        logging.info("Queued event with request_id %s.", request_id)
 
-        internal_request_id = data.get("internal_request_id", None)
         await self.sio.emit(
             "request_queued",
-            self.request_event_builder.build(request_id, internal_request_id).model_dump(),
+            self.request_event_builder.build_status(request_id, internal_request_id),
             room=sid
         )
         logging.info(
-            f"Emitted request_queued event with request_id {request_id} and "\
-            f"internal_request_id {internal_request_id}."
+            "Emitted request_queued event with request_id %s and internal_request_id %s.",
+            request_id, internal_request_id
+        )
+
+    async def _evict_oldest_request(self) -> None:
+        """Drop the oldest pending request and report it as failed to its client"""
+        request_id, event = self.request_map.popitem(last=False)
+        logging.warning("Too many pending requests, dropping request %s.", request_id)
+
+        await self.sio.emit(
+            "request_failed",
+            self.request_event_builder.build_status(request_id, event.data.get("internal_request_id", None)),
+            room=event.sid
         )
 
     async def _cancel_request(self, sid: str, data: Dict[str, Any]) -> None:
@@ -164,77 +248,229 @@ class SocketIOServer:
             logging.warning(f"Request {request_id} not found in request map and cannot be cancelled.")
             await self.sio.emit(
                 "request_failed",
-                self.request_event_builder.build(
-                    request_id, data.get("internal_request_id", None)
-                ).model_dump(),
+                self.request_event_builder.build_status(request_id, data.get("internal_request_id", None)),
                 room=sid
             )
-            logging.info(f"Emitted request_failed event with request_id {request_id}.")
+            logging.info("Emitted request_failed event with request_id %s.", request_id)
             return
 
         del self.request_map[request_id]
-        logging.info(f"Request with request_id {request_id} cancelled successfully.")
+        logging.info("Request with request_id %s cancelled successfully.", request_id)
 
         await self.sio.emit(
             "request_success",
-            self.request_event_builder.build(
-                request_id, data.get("internal_request_id", None)
-            ).model_dump(),
+            self.request_event_builder.build_status(request_id, data.get("internal_request_id", None)),
             room=sid
         )
-        logging.info(f"Emitted request_success event with request_id {request_id}.")
+        logging.info("Emitted request_success event with request_id %s.", request_id)
+
+    async def _build_request_event(self,
+                                   request_id: str,
+                                   internal_request_id: Optional[str],
+                                   data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build and dump a request event
+
+        Validating a long fetched history is pure CPU work, so it runs in a
+        worker thread to keep the loop serving other clients; small payloads
+        are built inline to avoid the thread hand-off.
+
+        Args:
+            request_id: The request ID
+            internal_request_id: The internal request ID
+            data: The data to build the event from
+
+        Returns:
+            The request event as a dictionary
+        """
+        if not data:
+            return self.request_event_builder.build_status(request_id, internal_request_id)
+
+        def build() -> Dict[str, Any]:
+            return self.request_event_builder.build(request_id, internal_request_id, data).model_dump()
+
+        if len(data.get("history", [])) > self.HISTORY_VALIDATION_THRESHOLD:
+            return await asyncio.to_thread(build)
+        return build()
 
     async def _process_event_queue(self) -> None:
-        """Process events from the queue with rate limiting"""
+        """Process events from the queue with rate limiting
+
+        Up to MAX_INFLIGHT_EVENTS conversations are served at the same time.
+        Events of a conversation that is already being served wait in its
+        backlog without taking a slot, so they keep their order and a burst
+        in one conversation does not hold back the others.
+        """
         logging.info("Starting event queue processor")
 
         while self.is_processing:
             try:
                 event = await self.event_queue.get()
-
-                if event.request_id and event.request_id not in self.request_map:
+                try:
+                    await self._schedule_event(event)
+                except BaseException:
                     self.event_queue.task_done()
-                    continue
-
-                internal_request_id = None
-                if "internal_request_id" in event.data:
-                    internal_request_id = event.data["internal_request_id"]
-                    del event.data["internal_request_id"]
-
-                result = await self.adapter.process_outgoing_event(event.data)
-                status = "request_success" if result["request_completed"] else "request_failed"
-                data = {}
-
-                if "message_ids" in result:
-                    data["message_ids"] = result["message_ids"]
-                elif "history" in result:
-                    data["history"] = result["history"]
-                elif "content" in result:
-                    data["content"] = result["content"]
-                elif "file_content" in result:
-                    data["file_content"] = result["file_content"]
-                elif "directories" in result and "files" in result:
-                    data["directories"] = result["directories"]
-                    data["files"] = result["files"]
-
-                await self.sio.emit(
-                    status,
-                    self.request_event_builder.build(
-                        event.request_id, internal_request_id, data
-                    ).model_dump(),
-                    room=event.sid
-                )
-                logging.info(
-                    f"Emitted {status} event with request_id {event.request_id} and "\
-                    f"internal_request_id {internal_request_id}."
-                )
-
-                if event.request_id in self.request_map:
-                    del self.request_map[event.request_id]
-                self.event_queue.task_done()
+                    raise
             except asyncio.CancelledError:
                 logging.info("Event queue processor cancelled")
                 break
             except Exception as e:
                 logging.error(f"Unexpected error in event queue processor: {e}", exc_info=True)
                 await asyncio.sleep(5)  # Prevent tight loop on error
+
+    async def _schedule_event(self, event: SocketIOQueuedEvent) -> None:
+        """Add an event to the backlog of its conversation and start serving the conversation if needed
+
+        Args:
+            event: Queued event
+        """
+        conversation_id = self._get_conversation_id(event)
+
+        backlog = self._conversation_backlogs.get(conversation_id)
+        if backlog is not None:
+            backlog.append(event)
+            self._backlogged_events += 1
+            return
+
+        await self._inflight.acquire()
+        backlog = deque([event])
+        self._conversation_backlogs[conversation_id] = backlog
+        self._backlogged_events += 1
+
+        task = asyncio.create_task(self._serve_conversation(conversation_id, backlog))
+        self._inflight_tasks.add(task)
+        task.add_done_callback(
+            lambda done, conversation_id=conversation_id: self._finish_conversation(conversation_id, backlog, done)
+        )
+
+    def _get_conversation_id(self, event: SocketIOQueuedEvent) -> Optional[str]:
+        """Get the conversation an event belongs to, tolerating malformed payloads
+
+        Args:
+            event: Queued event
+
+        Returns:
+            Conversation ID or None if the event data has none
+        """
+        data = event.data.get("data")
+        return data.get("conversation_id") if isinstance(data, dict) else None
+
+    async def _serve_conversation(self,
+                                  conversation_id: Optional[str],
+                                  backlog: Deque[SocketIOQueuedEvent]) -> None:
+        """Process the events of a conversation one by one until its backlog is empty
+
+        The event being processed stays at the head of the backlog until it is done.
+
+        Args:
+            conversation_id: Conversation ID
+            backlog: Events of the conversation
+        """
+        while backlog:
+            await self._dispatch_event(backlog[0])
+            backlog.popleft()
+            self._backlogged_events -= 1
+            self.event_queue.task_done()
+
+        del self._conversation_backlogs[conversation_id]
+
+    def _finish_conversation(self,
+                             conversation_id: Optional[str],
+                             backlog: Deque[SocketIOQueuedEvent],
+                             task: asyncio.Task) -> None:
+        """Release the slot of a served conversation and drop the events a cancelled one left behind
+
+        Args:
+            conversation_id: Conversation ID
+            backlog: Events of the conversation
+            task: Finished task
+        """
+        self._inflight_tasks.discard(task)
+        self._inflight.release()
+
+        if self._conversation_backlogs.get(conversation_id) is not backlog:
+            return
+
+        del self._conversation_backlogs[conversation_id]
+        self._backlogged_events -= len(backlog)
+        for _ in backlog:
+            self.event_queue.task_done()
+        backlog.clear()
+
+    async def _dispatch_event(self, event: SocketIOQueuedEvent) -> None:
+        """Process an event and report it as failed if processing raises
+
+        Args:
+            event: Queued event
+        """
+        internal_request_id = event.data.get("internal_request_id", None)
+
+        try:
+            await self._process_event(event, internal_request_id)
+        except Exception as e:
+            logging.error(f"Unexpected error in event queue processor: {e}", exc_info=True)
+            await self._fail_request(event, internal_request_id)
+
+    async def _fail_request(self, event: SocketIOQueuedEvent, internal_request_id: Optional[str]) -> None:
+        """Report an event whose processing raised as failed to its client
+
+        Args:
+            event: Queued event
+            internal_request_id: The internal request ID
+        """
+        if self.request_map.pop(event.request_id, None) is None:
+            return  # Cancelled or dropped, the client was already answered
+
+        try:
+            await self.sio.emit(
+                "request_failed",
+                self.request_event_builder.build_status(event.request_id, internal_request_id),
+                room=event.sid
+            )
+        except Exception as e:
+            logging.error(f"Error emitting request_failed for request {event.request_id}: {e}")
+
+    async def _process_event(self,
+                             event: SocketIOQueuedEvent,
+                             internal_request_id: Optional[str] = None) -> None:
+        """Send a queued event to the adapter and report the result to the client
+
+        The event data is passed on as received; outgoing event builders only
+        read event_type and data, so internal_request_id does not need removing.
+
+        Args:
+            event: Queued event
+            internal_request_id: The internal request ID
+        """
+        if event.request_id and event.request_id not in self.request_map:
+            return
+
+        result = await self._process_outgoing_event(event.data)
+        if not self._has_clients(event.sid):
+            self.request_map.pop(event.request_id, None)
+            logging.info("Client of request %s disconnected, not reporting the result.", event.request_id)
+            return
+
+        status = "request_success" if result["request_completed"] else "request_failed"
+        data = {}
+
+        for key in self.RESULT_KEYS:
+            if key in result:
+                data[key] = result[key]
+                break
+        else:
+            if "directories" in result and "files" in result:
+                data["directories"] = result["directories"]
+                data["files"] = result["files"]
+
+        await self.sio.emit(
+            status,
+            await self._build_request_event(event.request_id, internal_request_id, data),
+            room=event.sid
+        )
+        logging.info(
+            "Emitted %s event with request_id %s and internal_request_id %s.",
+            status, event.request_id, internal_request_id
+        )
+
+        if event.request_id in self.request_map:
+            del self.request_map[event.request_id]
@@ -1,19 +1,27 @@
 """Util functions and classes implementation."""
 
 from src.core.utils.attachment_loading import (
+    chunk_attachments,
     create_attachment_dir,
     get_attachment_type_by_extension,
     move_attachment,
     save_metadata_file
 )
 from src.core.utils.config import Config
-from src.core.utils.emoji_converter import EmojiConverter
+from src.core.utils.emoji_converter import EmojiConverter, get_emoji_name, get_emoji_symbol
+from src.core.utils.event_loop import get_event_loop_factory, run_event_loop, wait_for_any
 from src.core.utils.logger import setup_logging
 
 __all__ = [
     "Config",
     "EmojiConverter",
+    "get_emoji_name",
+    "get_emoji_symbol",
+    "get_event_loop_factory",
+    "run_event_loop",
+    "wait_for_any",
     "setup_logging",
+    "chunk_attachments",
     "create_attachment_dir",
     "get_attachment_type_by_extension",
     "move_attachment",
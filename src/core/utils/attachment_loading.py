@@ -3,7 +3,9 @@ import json
 import logging
 import shutil
 
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from itertools import islice
+from typing import Optional, Dict, Any, Iterable, Iterator, List
 
 # Comprehensive file type mapping
 EXTENSION_TYPE_MAPPING = {
@@ -37,6 +39,19 @@ def create_attachment_dir(attachment_dir: str) -> str:
     except Exception as e:
         logging.error(f"Error creating attachment directory: {e}")
 
+def get_file_extension(filename: Optional[str]) -> Optional[str]:
+    """Get the lowercased extension of a file name
+
+    Args:
+        filename: File name, can be None
+
+    Returns:
+        Extension without the dot, or None if the name has no dot
+    """
+    _, dot, extension = (filename or "").rpartition(".")
+    return extension.lower() if dot else None
+
+@lru_cache(maxsize=256)
 def get_attachment_type_by_extension(file_extension: Optional[str]) -> str:
     """Determine the specific attachment type based on file extension
 
@@ -96,3 +111,20 @@ def save_metadata_file(metadata: Dict[str, Any], attachment_dir: str) -> None:
     except Exception as e:
         logging.error(f"Error saving attachment metadata: {e}")
         raise IOError(f"Could not save attachment metadata: {e}")
+
+def chunk_attachments(attachments: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """Split attachments into chunks that fit in one message
+
+    Chunks are built lazily, one at a time, from a single pass over the attachments.
+
+    Args:
+        attachments: Attachments to split
+        chunk_size: Maximum number of attachments per chunk
+
+    Yields:
+        Lists of at most chunk_size attachments, in the original order
+    """
+    iterator = iter(attachments)
+
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
@@ -4,6 +4,11 @@ import logging
 
 from typing import Any
 
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml bindings, when PyYAML was built with them
+except ImportError:
+    from yaml import SafeLoader
+
 logger = logging.getLogger("Config")
 
 class Config:
@@ -32,7 +37,7 @@ class Config:
         """Load configuration from YAML file"""
         if os.path.exists(self.config_path):
             with open(self.config_path, "r") as file:
-                config = yaml.safe_load(file) or {}
+                config = yaml.load(file, Loader=SafeLoader) or {}
                 for category in self.categories:
                     if category in config and isinstance(config[category], dict):
                         setattr(self, category, config[category])
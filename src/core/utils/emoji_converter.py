@@ -3,9 +3,46 @@ import emoji
 import os
 import logging
 
+from functools import lru_cache
 from typing import Optional
 from src.core.utils.config import Config
 
+# Names of single emoji, precomputed so that reactions do not need a demojize pass
+EMOJI_TO_NAME = {
+    unicode_emoji: data["en"].strip(":") for unicode_emoji, data in emoji.EMOJI_DATA.items()
+}
+
+def get_emoji_name(unicode_emoji: str) -> str:
+    """Get the emoji library name of an emoji
+
+    Args:
+        unicode_emoji: Emoji character(s)
+
+    Returns:
+        Emoji library name without colons
+    """
+    emoji_name = EMOJI_TO_NAME.get(unicode_emoji, None)
+    if emoji_name is None:
+        return emoji.demojize(unicode_emoji).strip(":")
+    return emoji_name
+
+@lru_cache(maxsize=4096)
+def get_emoji_symbol(emoji_name: str) -> Optional[str]:
+    """Get the emoji character(s) for an emoji library name
+
+    Args:
+        emoji_name: Emoji library name without colons
+
+    Returns:
+        Emoji character(s) or None if the emoji library does not know the name
+    """
+    name_with_colons = f":{emoji_name}:"
+    emoji_symbol = emoji.emojize(name_with_colons)
+
+    if not emoji_symbol or emoji_symbol == name_with_colons:
+        return None
+    return emoji_symbol
+
 class EmojiConverter:
     """Singleton class for handling emoji name conversions.
 
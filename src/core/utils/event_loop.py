@@ -0,0 +1,53 @@
+import asyncio
+import sys
+
+from typing import Any, Callable, Coroutine, Optional
+
+def get_event_loop_factory(use_uvloop: bool = True) -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """Get the factory for the event loop adapters should run on
+
+    uvloop is an optional dependency (see the "speedups" extra). It is used
+    when it is installed and the platform supports it, otherwise asyncio
+    falls back to its default event loop.
+
+    Args:
+        use_uvloop: Whether uvloop may be used
+
+    Returns:
+        uvloop event loop factory or None for the default asyncio loop
+    """
+    if not use_uvloop or sys.platform == "win32":
+        return None
+
+    try:
+        import uvloop
+    except ImportError:
+        return None
+
+    return uvloop.new_event_loop
+
+async def wait_for_any(*events: asyncio.Event) -> None:
+    """Wait until at least one of the events is set
+
+    Args:
+        events: Events to wait for
+    """
+    waiters = [asyncio.create_task(event.wait()) for event in events]
+    try:
+        await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for waiter in waiters:
+            waiter.cancel()
+
+def run_event_loop(main: Coroutine[Any, Any, Any], use_uvloop: bool = True) -> Any:
+    """Run the adapter entrypoint coroutine until it completes
+
+    Args:
+        main: Entrypoint coroutine
+        use_uvloop: Whether uvloop may be used
+
+    Returns:
+        Result of the entrypoint coroutine
+    """
+    with asyncio.Runner(loop_factory=get_event_loop_factory(use_uvloop)) as runner:
+        return runner.run(main)
@@ -87,8 +87,8 @@ class TestSocketIOToDiscordWebhookFlowIntegration:
     def uploader_mock(self):
         """Create a mocked Uploader"""
         uploader_mock = MagicMock(spec=Uploader)
-        uploader_mock.upload_attachment = MagicMock(return_value=[])
-        uploader_mock.clean_up_uploaded_files = MagicMock()
+        uploader_mock.upload_attachment = AsyncMock(return_value=[])
+        uploader_mock.clean_up_uploaded_files = AsyncMock()
         return uploader_mock
 
     @pytest.fixture
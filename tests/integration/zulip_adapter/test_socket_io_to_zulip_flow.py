@@ -29,14 +29,20 @@ class TestSocketIOToZulipFlowIntegration:
         """Create a mocked Zulip client"""
         client = MagicMock()
         client.api_key = "test_api_key"
-        client.send_message = MagicMock(return_value={"result": "success", "id": 123})
-        client.update_message = MagicMock(return_value={"result": "success"})
-        client.call_endpoint = MagicMock(return_value={"result": "success"})
-        client.add_reaction = MagicMock(return_value={"result": "success"})
-        client.remove_reaction = MagicMock(return_value={"result": "success"})
         client.get_messages = MagicMock(return_value={"result": "success", "messages": []})
         return client
 
+    @pytest.fixture
+    def api_client_mock(self):
+        """Create a mocked asynchronous Zulip API client"""
+        api_client = AsyncMock()
+        api_client.send_message = AsyncMock(return_value={"result": "success", "id": 123})
+        api_client.update_message = AsyncMock(return_value={"result": "success"})
+        api_client.call_endpoint = AsyncMock(return_value={"result": "success"})
+        api_client.add_reaction = AsyncMock(return_value={"result": "success"})
+        api_client.remove_reaction = AsyncMock(return_value={"result": "success"})
+        return api_client
+
     @pytest.fixture
     def uploader_mock(self):
         """Create a mocked Uploader"""
@@ -77,6 +83,7 @@ class TestSocketIOToZulipFlowIntegration:
                 zulip_config,
                 socketio_mock,
                 zulip_client_mock,
+                api_client_mock,
                 uploader_mock,
                 rate_limiter_mock):
         """Create a Zulip adapter with mocked dependencies"""
@@ -89,6 +96,7 @@ class TestSocketIOToZulipFlowIntegration:
         )
         adapter.outgoing_events_processor.rate_limiter = rate_limiter_mock
         adapter.outgoing_events_processor.uploader = uploader_mock
+        adapter.outgoing_events_processor.api_client = api_client_mock
 
         adapter.incoming_events_processor = IncomingEventProcessor(
             zulip_config, zulip_client_mock, adapter.conversation_manager
@@ -145,6 +153,7 @@ class TestSocketIOToZulipFlowIntegration:
 
             if conversation_id in adapter.conversation_manager.conversations:
                 adapter.conversation_manager.conversations[conversation_id].messages.add(message_id)
+                adapter.conversation_manager._message_to_conversation[message_id] = conversation_id
 
             return cached_msg
         return _setup
@@ -152,7 +161,7 @@ class TestSocketIOToZulipFlowIntegration:
     # =============== TEST METHODS ===============
 
     @pytest.mark.asyncio
-    async def test_send_private_message_flow(self, adapter, zulip_client_mock, setup_private_conversation):
+    async def test_send_private_message_flow(self, adapter, api_client_mock, setup_private_conversation):
         """Test the complete flow from socket.io send_message to Zulip for private messages"""
         setup_private_conversation()
 
@@ -166,7 +175,7 @@ class TestSocketIOToZulipFlowIntegration:
         assert response["request_completed"] is True
         assert response["message_ids"] == ["123"]
 
-        zulip_client_mock.send_message.assert_called_once_with({
+        api_client_mock.send_message.assert_called_once_with({
             "type": "private",
             "to": ["test@example.com", "bot@example.com"],
             "content": "Hello, world!",
@@ -174,7 +183,7 @@ class TestSocketIOToZulipFlowIntegration:
         })
 
     @pytest.mark.asyncio
-    async def test_send_stream_message_flow(self, adapter, zulip_client_mock, setup_stream_conversation):
+    async def test_send_stream_message_flow(self, adapter, api_client_mock, setup_stream_conversation):
         """Test the complete flow from socket.io send_message to Zulip for stream messages"""
         setup_stream_conversation()
 
@@ -188,7 +197,7 @@ class TestSocketIOToZulipFlowIntegration:
         assert response["request_completed"] is True
         assert response["message_ids"] == ["123"]
 
-        zulip_client_mock.send_message.assert_called_once_with({
+        api_client_mock.send_message.assert_called_once_with({
             "type": "stream",
             "to": "Test Stream",
             "content": "Hello, stream!",
@@ -196,7 +205,7 @@ class TestSocketIOToZulipFlowIntegration:
         })
 
     @pytest.mark.asyncio
-    async def test_send_message_with_attachment_flow(self, adapter, zulip_client_mock, setup_private_conversation):
+    async def test_send_message_with_attachment_flow(self, adapter, api_client_mock, setup_private_conversation):
         """Test sending a message with an attachment"""
         setup_private_conversation()
 
@@ -217,16 +226,16 @@ class TestSocketIOToZulipFlowIntegration:
         assert response["message_ids"] == ["123"]
 
         adapter.outgoing_events_processor.uploader.upload_attachment.assert_called_once()
-        zulip_client_mock.send_message.assert_called_once()
+        api_client_mock.send_message.assert_called_once()
 
-        call_args = zulip_client_mock.send_message.call_args[0][0]
+        call_args = api_client_mock.send_message.call_args[0][0]
         assert call_args["type"] == "private"
         assert call_args["to"] == ["test@example.com", "bot@example.com"]
         assert "See attachment" in call_args["content"]
         assert "/user_uploads/test.txt" in call_args["content"]
 
     @pytest.mark.asyncio
-    async def test_edit_message_flow(self, adapter, zulip_client_mock, setup_private_conversation, setup_message):
+    async def test_edit_message_flow(self, adapter, api_client_mock, setup_private_conversation, setup_message):
         """Test the complete flow from socket.io edit_message to Zulip call"""
         setup_private_conversation()
         await setup_message("101_102")
@@ -241,13 +250,13 @@ class TestSocketIOToZulipFlowIntegration:
         })
         assert response["request_completed"] is True
 
-        zulip_client_mock.update_message.assert_called_once_with({
+        api_client_mock.update_message.assert_called_once_with({
             "message_id": 12345,  # Should be converted to int
             "content": "Edited message content"
         })
 
     @pytest.mark.asyncio
-    async def test_delete_message_flow(self, adapter, zulip_client_mock, setup_private_conversation, setup_message):
+    async def test_delete_message_flow(self, adapter, api_client_mock, setup_private_conversation, setup_message):
         """Test the complete flow from socket.io delete_message to Zulip call"""
         setup_private_conversation()
         await setup_message("101_102")
@@ -261,7 +270,7 @@ class TestSocketIOToZulipFlowIntegration:
         })
         assert response["request_completed"] is True
 
-        zulip_client_mock.call_endpoint.assert_called_once_with(
+        api_client_mock.call_endpoint.assert_called_once_with(
             "messages/12345",
             method="DELETE"
         )
@@ -269,7 +278,7 @@ class TestSocketIOToZulipFlowIntegration:
     @pytest.mark.asyncio
     async def test_add_reaction_flow(self,
                                      adapter,
-                                     zulip_client_mock,
+                                     api_client_mock,
                                      emoji_converter_mock,
                                      setup_private_conversation,
                                      setup_message):
@@ -288,7 +297,7 @@ class TestSocketIOToZulipFlowIntegration:
             })
             assert response["request_completed"] is True
 
-            zulip_client_mock.add_reaction.assert_called_once_with({
+            api_client_mock.add_reaction.assert_called_once_with({
                 "message_id": 12345,
                 "emoji_name": "+1"
             })
@@ -296,7 +305,7 @@ class TestSocketIOToZulipFlowIntegration:
     @pytest.mark.asyncio
     async def test_remove_reaction_flow(self,
                                         adapter,
-                                        zulip_client_mock,
+                                        api_client_mock,
                                         emoji_converter_mock,
                                         setup_private_conversation,
                                         setup_message):
@@ -315,7 +324,7 @@ class TestSocketIOToZulipFlowIntegration:
             })
             assert response["request_completed"] is True
 
-            zulip_client_mock.remove_reaction.assert_called_once_with({
+            api_client_mock.remove_reaction.assert_called_once_with({
                 "message_id": 12345,
                 "emoji_name": "+1"
             })
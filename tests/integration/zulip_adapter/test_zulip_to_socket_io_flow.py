@@ -139,6 +139,7 @@ class TestZulipToSocketIOFlowIntegration:
 
             if conversation_id in adapter.conversation_manager.conversations:
                 adapter.conversation_manager.conversations[conversation_id].messages.add(message_id)
+                adapter.conversation_manager._message_to_conversation[message_id] = conversation_id
 
             return cached_msg
         return _setup
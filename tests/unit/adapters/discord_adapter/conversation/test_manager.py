@@ -329,7 +329,7 @@ class TestManager:
                                       mock_discord_deleted_message):
             """Test deleting a message"""
             manager.conversations["987654321/123456789"] = conversation_info_mock
-            manager.message_cache.get_message_by_id.return_value = cached_message_mock
+            manager.message_cache.get_messages_by_ids.return_value = {"111222333": cached_message_mock}
             manager.message_cache.delete_message.return_value = True
 
             with patch.object(ThreadHandler, "remove_thread_info"):
@@ -337,9 +337,8 @@ class TestManager:
                     incoming_event=mock_discord_deleted_message
                 )
 
-                manager.message_cache.get_message_by_id.assert_called_with(
-                    conversation_id="987654321/123456789",
-                    message_id="111222333"
+                manager.message_cache.get_messages_by_ids.assert_called_once_with(
+                    "987654321/123456789", ["111222333"]
                 )
                 manager.message_cache.delete_message.assert_called_with(
                     "987654321/123456789", "111222333"
@@ -1,3 +1,4 @@
+import asyncio
 import discord
 import os
 import pytest
@@ -113,6 +114,35 @@ class TestOutgoingEventProcessor:
             assert channel_mock.send.call_count == 2
             channel_mock.send.assert_has_calls([call("Part 1"), call("Part 2")])
 
+        @pytest.mark.asyncio
+        async def test_send_message_long_text_concurrently(self, processor, channel_mock):
+            """Test that message parts are sent in parallel when enabled and ids keep the part order"""
+            processor.send_parts_concurrently = True
+            first_sent = asyncio.Event()
+
+            async def send(message):
+                if message == "Part 1":
+                    await first_sent.wait()
+                    return MagicMock(id=1)
+                first_sent.set()
+                return MagicMock(id=2)
+
+            channel_mock.send.side_effect = send
+            event_data = {
+                "event_type": "send_message",
+                "data": {
+                    "conversation_id": "123456789",
+                    "text": "This is a sentence. " * 100
+                }
+            }
+
+            with patch.object(processor, "_split_long_message", return_value=iter(["Part 1", "Part 2"])):
+                response = await asyncio.wait_for(processor.process_event(event_data), timeout=1)
+
+            assert response["request_completed"] is True
+            assert response["message_ids"] == ["1", "2"]
+            assert processor.rate_limiter.limit_request.call_args_list.count(call("message", "123456789")) == 2
+
         @pytest.mark.asyncio
         async def test_send_message_with_attachments(self, processor, channel_mock):
             """Test sending a message with attachments"""
@@ -269,6 +299,60 @@ class TestOutgoingEventProcessor:
             response = await processor.process_event(event_data)
             assert response["request_completed"] is False
 
+    class TestMessageCache:
+        """Tests for reusing recently sent or fetched messages"""
+
+        def reaction_event(self, message_id):
+            """Build an add_reaction event for a message"""
+            return {
+                "event_type": "add_reaction",
+                "data": {
+                    "conversation_id": "123456789",
+                    "message_id": message_id,
+                    "emoji": "thumbs_up"
+                }
+            }
+
+        @pytest.mark.asyncio
+        async def test_sent_message_is_not_fetched(self, processor, channel_mock):
+            """Test that a reaction to a message that was just sent does not fetch it"""
+            sent_message = AsyncMock(id=999)
+            channel_mock.send.return_value = sent_message
+
+            await processor.process_event({
+                "event_type": "send_message",
+                "data": {"conversation_id": "123456789", "text": "Hello, world!"}
+            })
+            response = await processor.process_event(self.reaction_event("999"))
+
+            assert response["request_completed"] is True
+            channel_mock.fetch_message.assert_not_called()
+            sent_message.add_reaction.assert_called_once()
+
+        @pytest.mark.asyncio
+        async def test_fetched_message_is_reused_until_deleted(self, processor, channel_mock):
+            """Test that a fetched message is reused and fetched again after it was deleted"""
+            await processor.process_event(self.reaction_event("987654321"))
+            await processor.process_event(self.reaction_event("987654321"))
+            assert channel_mock.fetch_message.call_count == 1
+
+            await processor.process_event({
+                "event_type": "delete_message",
+                "data": {"conversation_id": "123456789", "message_id": "987654321"}
+            })
+            await processor.process_event(self.reaction_event("987654321"))
+            assert channel_mock.fetch_message.call_count == 2
+
+        @pytest.mark.asyncio
+        async def test_expired_message_is_fetched_again(self, processor, channel_mock):
+            """Test that cached messages are fetched again once they are older than the TTL"""
+            processor.MESSAGE_CACHE_TTL = 0
+
+            await processor.process_event(self.reaction_event("987654321"))
+            await processor.process_event(self.reaction_event("987654321"))
+
+            assert channel_mock.fetch_message.call_count == 2
+
     class TestReactions:
         """Tests for the reaction-related methods"""
 
@@ -0,0 +1,9 @@
+"""
+Unit tests for the Discord webhook attachment loaders.
+
+This package contains unit tests for the attachment loaders including:
+- Uploader: For preparing attachments for upload
+"""
+
+__author__ = "Your Name"
+__version__ = "0.1.0"
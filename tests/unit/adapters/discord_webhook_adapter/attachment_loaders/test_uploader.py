@@ -0,0 +1,147 @@
+import base64
+import os
+import pytest
+
+from types import SimpleNamespace
+
+from src.adapters.discord_webhook_adapter.attachment_loaders.uploader import Uploader
+
+class TestUploader:
+    """Tests for the Discord webhook Uploader class"""
+
+    @pytest.fixture
+    def uploader(self, discord_webhook_config, tmp_path):
+        """Create an Uploader that writes into a temporary directory"""
+        uploader = Uploader(discord_webhook_config)
+        uploader.temp_dir = str(tmp_path)
+        return uploader
+
+    @pytest.mark.asyncio
+    async def test_upload_attachment(self, uploader):
+        """Test that valid attachments are written in order and invalid ones are skipped"""
+        attachments = [
+            SimpleNamespace(file_name="first.txt", content="Zmlyc3Q="),
+            SimpleNamespace(file_name="broken.txt", content="not base64!"),
+            SimpleNamespace(file_name="second.txt", content="c2Vjb25k")
+        ]
+
+        files = await uploader.upload_attachment(attachments)
+
+        assert [os.path.basename(file) for file in files] == ["first.txt", "second.txt"]
+        assert all(os.path.dirname(os.path.dirname(file)) == uploader.temp_dir for file in files)
+        with open(files[0], "rb") as f:
+            assert f.read() == b"first"
+
+    @pytest.mark.asyncio
+    async def test_upload_attachments_with_same_name(self, uploader):
+        """Test that attachments with the same file name are all written under that name"""
+        attachments = [
+            SimpleNamespace(file_name="same.txt", content="Zmlyc3Q="),
+            SimpleNamespace(file_name="other.txt", content="b3RoZXI="),
+            SimpleNamespace(file_name="same.txt", content="c2Vjb25k")
+        ]
+
+        files = await uploader.upload_attachment(attachments)
+
+        assert [os.path.basename(file) for file in files] == ["same.txt", "other.txt", "same.txt"]
+        assert len(set(files)) == 3
+        contents = []
+        for file in files:
+            with open(file, "rb") as f:
+                contents.append(f.read())
+        assert contents == [b"first", b"other", b"second"]
+
+    @pytest.mark.asyncio
+    async def test_upload_attachment_too_large(self, uploader):
+        """Test that attachments over the size limit are skipped"""
+        uploader.max_file_size = 3
+
+        files = await uploader.upload_attachment(
+            [SimpleNamespace(file_name="first.txt", content="Zmlyc3Q=")]
+        )
+
+        assert files == []
+        assert os.listdir(uploader.temp_dir) == []
+
+    @pytest.mark.asyncio
+    async def test_upload_attachment_in_blocks(self, uploader):
+        """Test that content split across decode blocks is decoded as a whole"""
+        uploader.DECODE_BLOCK_SIZE = 6
+        content = base64.b64encode(b"a longer attachment body").decode("utf-8")
+        content = content[:10] + "\n" + content[10:]
+
+        files = await uploader.upload_attachment(
+            [SimpleNamespace(file_name="long.txt", content=content)]
+        )
+
+        with open(files[0], "rb") as f:
+            assert f.read() == b"a longer attachment body"
+
+    @pytest.mark.asyncio
+    async def test_upload_attachment_skips_non_base64_characters(self, uploader):
+        """Test that characters outside the base64 alphabet are ignored like a non-strict decode"""
+        uploader.DECODE_BLOCK_SIZE = 4
+        content = "Zm!lyc\r\n3Q="
+
+        files = await uploader.upload_attachment(
+            [SimpleNamespace(file_name="first.txt", content=content)]
+        )
+
+        with open(files[0], "rb") as f:
+            assert f.read() == base64.b64decode(content) == b"first"
+
+    @pytest.mark.asyncio
+    async def test_upload_raw_bytes(self, uploader):
+        """Test that raw bytes are written without decoding"""
+        files = await uploader.upload_attachment(
+            [SimpleNamespace(file_name="raw.bin", content=b"\x00raw")]
+        )
+
+        with open(files[0], "rb") as f:
+            assert f.read() == b"\x00raw"
+
+    @pytest.mark.asyncio
+    async def test_upload_attachment_removes_partial_file(self, uploader):
+        """Test that a file is not left behind when decoding fails part way"""
+        uploader.DECODE_BLOCK_SIZE = 4
+
+        files = await uploader.upload_attachment(
+            [SimpleNamespace(file_name="broken.txt", content="Zmlyc3Q=Zm9")]
+        )
+
+        assert files == []
+        assert os.listdir(uploader.temp_dir) == []
+
+    @pytest.mark.asyncio
+    async def test_clean_up_uploaded_files(self, uploader):
+        """Test that uploaded files are removed"""
+        files = await uploader.upload_attachment(
+            [SimpleNamespace(file_name="first.txt", content="Zmlyc3Q=")]
+        )
+
+        await uploader.clean_up_uploaded_files(files)
+
+        assert os.listdir(uploader.temp_dir) == []
+
+    @pytest.mark.asyncio
+    async def test_clean_up_missing_file(self, uploader):
+        """Test that a file that is already gone does not stop the clean up"""
+        files = await uploader.upload_attachment(
+            [SimpleNamespace(file_name="first.txt", content="Zmlyc3Q=")]
+        )
+        missing = os.path.join(uploader.temp_dir, "missing.txt")
+
+        await uploader.clean_up_uploaded_files([missing] + files)
+
+        assert not os.path.exists(files[0])
+
+    @pytest.mark.asyncio
+    async def test_aclose(self, uploader):
+        """Test that closing the uploader removes the temporary directory"""
+        await uploader.upload_attachment(
+            [SimpleNamespace(file_name="first.txt", content="Zmlyc3Q=")]
+        )
+
+        await uploader.aclose()
+
+        assert not os.path.exists(uploader.temp_dir)
@@ -49,8 +49,8 @@ class TestOutgoingEventProcessor:
     def uploader_mock(self):
         """Create a mocked uploader"""
         uploader = MagicMock()
-        uploader.upload_attachment = MagicMock()
-        uploader.clean_up_uploaded_files = MagicMock()
+        uploader.upload_attachment = AsyncMock(return_value=[])
+        uploader.clean_up_uploaded_files = AsyncMock()
         return uploader
 
     @pytest.fixture
@@ -124,6 +124,21 @@ class TestWebhookAdapter:
                             "disconnect", {"adapter_type": adapter.adapter_type}
                         )
 
+    class TestTeardown:
+        """Tests for adapter teardown"""
+
+        @pytest.mark.asyncio
+        async def test_teardown_client(self, adapter, discord_webhook_client_mock, processor_mock):
+            """Test that teardown removes uploaded files and disconnects the client"""
+            adapter.client = discord_webhook_client_mock
+            adapter.outgoing_events_processor = processor_mock
+            processor_mock.uploader.aclose = AsyncMock()
+
+            await adapter._teardown_client()
+
+            processor_mock.uploader.aclose.assert_awaited_once()
+            discord_webhook_client_mock.disconnect.assert_awaited_once()
+
     class TestEventProcessing:
         """Tests for event processing"""
 
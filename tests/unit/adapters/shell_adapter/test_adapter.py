@@ -82,6 +82,7 @@ class TestShellAdapter:
 
         assert adapter.running is False
         adapter.session_manager.stop.assert_awaited_once()
+        assert adapter.stopped.is_set()
         adapter.monitoring_task.cancel.assert_called_once()
         adapter.socketio_server.emit_event.assert_awaited_once_with(
             "disconnect", {"adapter_type": adapter.adapter_type}
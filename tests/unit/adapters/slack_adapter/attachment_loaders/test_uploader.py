@@ -30,9 +30,14 @@ class TestUploader:
         return rate_limiter
 
     @pytest.fixture
-    def uploader(self, slack_config, mock_client, rate_limiter_mock):
-        """Create an Uploader with mocked dependencies"""
+    def uploader(self, slack_config, mock_client, rate_limiter_mock, tmp_path):
+        """Create an Uploader that writes into its own temporary directory
+
+        Uploaders left over from other tests remove the configured temp dir
+        when they are garbage collected, so it is not shared with them.
+        """
         uploader = Uploader(slack_config, mock_client)
+        uploader.temp_dir = str(tmp_path)
         uploader.rate_limiter = rate_limiter_mock
         return uploader
 
@@ -59,7 +64,7 @@ class TestUploader:
                     await uploader.upload_attachments(sample_send_message_data)
 
                     uploader.client.files_upload_v2.assert_called_once_with(
-                        file="test_attachments/tmp_uploads/test.txt",
+                        file=os.path.join(uploader.temp_dir, "test.txt"),
                         channel="C456"
                     )
                     assert mock_create_dir.called
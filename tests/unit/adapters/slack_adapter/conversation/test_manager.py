@@ -401,7 +401,7 @@ class TestManager:
                                       mock_slack_deleted_message):
             """Test deleting a message"""
             manager.conversations["T12345678/C87654321"] = conversation_info_mock
-            manager.message_cache.get_message_by_id.return_value = cached_message_mock
+            manager.message_cache.get_messages_by_ids.return_value = {"1625176800.123456": cached_message_mock}
             manager.message_cache.delete_message.return_value = True
 
             with patch.object(ThreadHandler, "remove_thread_info"):
@@ -409,9 +409,8 @@ class TestManager:
                     incoming_event=mock_slack_deleted_message
                 )
 
-                manager.message_cache.get_message_by_id.assert_called_with(
-                    conversation_id="T12345678/C87654321",
-                    message_id="1625176800.123456"
+                manager.message_cache.get_messages_by_ids.assert_called_once_with(
+                    "T12345678/C87654321", ["1625176800.123456"]
                 )
                 manager.message_cache.delete_message.assert_called_with(
                     "T12345678/C87654321", "1625176800.123456"
@@ -436,7 +435,7 @@ class TestManager:
 
             cached_attachment = MagicMock()
             cached_attachment.attachment_id = "F12345678"
-            manager.attachment_cache.add_attachment.return_value = cached_attachment
+            manager.attachment_cache.add_attachments.return_value = [cached_attachment]
 
             result = await manager._update_attachment(
                 conversation_info, [attachment_mock]
@@ -451,6 +450,24 @@ class TestManager:
             assert "attachment_type" not in result[0]
             assert "created_at" not in result[0]
             assert "F12345678" in conversation_info.attachments
-            manager.attachment_cache.add_attachment.assert_called_once_with(
-                "T12345678/C87654321", attachment_mock
+            manager.attachment_cache.add_attachments.assert_called_once_with(
+                "T12345678/C87654321", [attachment_mock]
+            )
+
+        @pytest.mark.asyncio
+        async def test_update_attachment_duplicates(self, manager, attachment_mock):
+            """Test that an attachment repeated in one event is cached and returned once"""
+            conversation_info = ConversationInfo(
+                conversation_id="T12345678/C87654321",
+                conversation_type="channel"
+            )
+            conversation_info.attachments.add(attachment_mock["attachment_id"])
+
+            result = await manager._update_attachment(
+                conversation_info, [attachment_mock, None, dict(attachment_mock)]
+            )
+
+            assert [attachment["attachment_id"] for attachment in result] == [attachment_mock["attachment_id"]]
+            manager.attachment_cache.add_attachments.assert_called_once_with(
+                "T12345678/C87654321", [attachment_mock]
             )
@@ -2,6 +2,7 @@ import json
 import os
 import pytest
 from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, mock_open
 
 from src.adapters.telegram_adapter.attachment_loaders.base_loader import BaseLoader
@@ -86,6 +87,16 @@ class TestBaseLoader:
         """Test getting file size from a photo message"""
         assert base_loader._get_file_size(mock_photo_message) == 12345
 
+    def test_get_file_size_largest_photo_size(self, base_loader, mock_photo_message):
+        """Test that the largest photo size is used and sizes without a size are skipped"""
+        mock_photo_message.photo.sizes = [
+            SimpleNamespace(size=100),
+            SimpleNamespace(type="stripped"),
+            SimpleNamespace(size=54321),
+            SimpleNamespace(size=2000)
+        ]
+        assert base_loader._get_file_size(mock_photo_message) == 54321
+
     def test_get_file_size_document(self, base_loader, mock_document_message):
         """Test getting file size from a document message"""
         assert base_loader._get_file_size(mock_document_message) == 98765
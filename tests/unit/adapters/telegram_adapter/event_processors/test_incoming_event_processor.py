@@ -9,6 +9,21 @@ from src.adapters.telegram_adapter.event_processors.incoming_event_processor imp
     IncomingEventProcessor, TelegramIncomingEventType
 )
 
+@pytest.fixture(scope="class")
+def all_handlers():
+    """Install one handler mock per event type on the processor class, for the requesting class"""
+    handler_mocks = {
+        handler_type: AsyncMock(return_value=["event_info"])
+        for handler_type in TelegramIncomingEventType
+    }
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        for handler_type, handler_mock in handler_mocks.items():
+            monkeypatch.setattr(
+                IncomingEventProcessor, f"_handle_{handler_type.value}", handler_mock
+            )
+        yield handler_mocks
+
 class TestIncomingEventProcessor:
     """Tests for the IncomingEventProcessor class"""
 
@@ -77,20 +92,13 @@ class TestIncomingEventProcessor:
             TelegramIncomingEventType.DELETED_MESSAGE,
             TelegramIncomingEventType.CHAT_ACTION
         ])
-        async def test_process_event_calls_correct_handler(self, processor, event_type):
+        async def test_process_event_calls_correct_handler(self, processor, all_handlers, event_type):
             """Test that process_event calls the correct handler method"""
-            data = {"test": "data"}
-            handler_mocks = {}
-
-            for handler_type in TelegramIncomingEventType:
-                method_name = f"_handle_{handler_type.value}"
-                handler_mock = AsyncMock(return_value=["event_info"])
-                handler_mocks[handler_type] = handler_mock
-                setattr(processor, method_name, handler_mock)
+            all_handlers[event_type].reset_mock()
 
-            event = {"type": event_type, "data": data}
+            event = {"type": event_type, "data": {"test": "data"}}
             assert await processor.process_event(event) == ["event_info"]
-            handler_mocks[event_type].assert_called_once_with(event)
+            all_handlers[event_type].assert_called_once_with(event)
 
         @pytest.mark.asyncio
         async def test_process_unknown_event(self, processor):
@@ -255,7 +263,7 @@ class TestIncomingEventProcessor:
         @pytest.fixture
         def deleted_message_event_mock(self):
             """Create a mock for a deleted message event"""
-            event = MagicMock()
+            event = MagicMock(spec_set=["deleted_ids", "channel_id"])
             event.deleted_ids = [123, 456]
             event.channel_id = 789
             return event
@@ -301,23 +309,23 @@ class TestIncomingEventProcessor:
             peer_id = MagicMock()
             peer_id.user_id = 456
 
-            action = MagicMock()
+            action = MagicMock(spec_set=["channel_id"])
             action.__class__.__name__ = "MessageActionPinMessage"
             action.channel_id = 789
 
-            message = MagicMock()
+            message = MagicMock(spec_set=["reply_to", "peer_id", "action"])
             message.reply_to = reply_to
             message.peer_id = peer_id
             message.action = action
 
-            event = MagicMock()
+            event = MagicMock(spec_set=["action_message"])
             event.action_message = message
             return event
 
         @pytest.fixture
         def unpin_action_event_mock(self):
             """Create a mock for an unpin message event"""
-            event = MagicMock()
+            event = MagicMock(spec_set=["action_message", "original_update"])
             event.action_message = None
             original_update = MagicMock()
             original_update.messages = [123]
@@ -347,6 +347,34 @@ class TestOutgoingEventProcessor:
                 "message": message_mock
             })
 
+        @pytest.mark.asyncio
+        async def test_remove_reactions_run_sequentially(self, processor):
+            """Test that several reactions to one message are not updated concurrently"""
+            in_flight = 0
+            max_in_flight = 0
+
+            async def remove_reaction(data):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0)
+                in_flight -= 1
+                return {"request_completed": True}
+
+            with patch.object(processor, "_remove_reaction", side_effect=remove_reaction) as remove_mock:
+                response = await processor.process_event({
+                    "event_type": "remove_reactions",
+                    "data": {
+                        "conversation_id": "123",
+                        "message_id": "456",
+                        "emojis": ["thumbs_up", "red_heart"]
+                    }
+                })
+
+            assert response["request_completed"] is True
+            assert remove_mock.call_count == 2
+            assert max_in_flight == 1
+
         @pytest.mark.asyncio
         async def test_remove_reaction_success(self,
                                                processor,
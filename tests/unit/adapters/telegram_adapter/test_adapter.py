@@ -45,8 +45,11 @@ class TestAdapter:
 
     @pytest.fixture
     def conversation_manager_mock(self):
-        """Create a mocked ConversationManager"""
-        return MagicMock()
+        """Create a mocked conversation manager with mocked caches"""
+        conversation_manager = MagicMock()
+        conversation_manager.message_cache = MagicMock()
+        conversation_manager.attachment_cache = MagicMock()
+        return conversation_manager
 
     @pytest.fixture
     def rate_limiter_mock(self):
@@ -57,22 +60,18 @@ class TestAdapter:
         return rate_limiter
 
     @pytest.fixture
-    def adapter(self, socketio_server_mock, rate_limiter_mock, telegram_config):
+    def adapter(self, socketio_server_mock, rate_limiter_mock, conversation_manager_mock, telegram_config):
         """Create a Adapter with mocked dependencies"""
-        conversation_manager_mock = MagicMock()
-        attachment_cache_mock = MagicMock()
-        message_cache_mock = MagicMock()
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr("os.path.exists", lambda path: False)
+            monkeypatch.setattr("os.makedirs", lambda *args, **kwargs: None)
+            monkeypatch.setattr("os.listdir", lambda path: [])
 
-        conversation_manager_mock.message_cache = message_cache_mock
-        conversation_manager_mock.attachment_cache = attachment_cache_mock
+            adapter = Adapter(telegram_config, socketio_server_mock)
 
-        with patch("os.path.exists", return_value=False):
-            with patch("os.makedirs"):
-                with patch("os.listdir", return_value=[]):
-                    adapter = Adapter(telegram_config, socketio_server_mock)
-                    adapter.conversation_manager = conversation_manager_mock
-                    adapter.rate_limiter = rate_limiter_mock
-                    return adapter
+        adapter.conversation_manager = conversation_manager_mock
+        adapter.rate_limiter = rate_limiter_mock
+        return adapter
 
     class TestMonitorConnection:
         """Tests for the connection monitoring"""
@@ -140,7 +139,47 @@ class TestAdapter:
             await adapter.process_incoming_event(test_event)
 
             incoming_event_processor_mock.process_event.assert_called_once_with(test_event)
-            adapter.socketio_server.emit_event.assert_called_once_with("bot_request", {"test": "event"})
+            adapter.socketio_server.emit_event.assert_not_called()
+            assert adapter.emit_queue.get_nowait() == ("bot_request", {"test": "event"})
+
+        @pytest.mark.asyncio
+        async def test_emit_queued_events(self, adapter):
+            """Test that queued events are emitted in order by the writer task"""
+            events = [("bot_request", {"event": i}) for i in range(3)]
+            for event in events:
+                adapter.emit_queue.put_nowait(event)
+
+            adapter.socketio_server.emit_event.side_effect = [Exception("Emit failed"), None, None]
+            emit_task = asyncio.create_task(adapter._emit_queued_events())
+
+            await asyncio.wait_for(adapter.emit_queue.join(), timeout=5)
+            emit_task.cancel()
+            await emit_task
+
+            assert [
+                call.args for call in adapter.socketio_server.emit_event.call_args_list
+            ] == events
+
+        @pytest.mark.asyncio
+        async def test_stop_emits_queued_events_before_disconnect(self,
+                                                                   adapter,
+                                                                   telethon_client_mock,
+                                                                   incoming_event_processor_mock):
+            """Test that teardown drains the queue and connection events keep their place"""
+            adapter.client = telethon_client_mock
+            adapter.incoming_events_processor = incoming_event_processor_mock
+            adapter.running = True
+            await adapter._perform_post_setup_tasks()
+
+            await adapter._emit_event("connect")
+            await adapter.process_incoming_event({"type": "new_message"})
+            await adapter.stop()
+
+            assert [
+                call.args[0] for call in adapter.socketio_server.emit_event.call_args_list
+            ] == ["connect", "bot_request", "disconnect"]
+            assert adapter.emit_task is None
+            telethon_client_mock.disconnect.assert_called_once()
 
         @pytest.mark.asyncio
         async def test_process_socket_io_event(self, adapter, outgoing_event_processor_mock):
@@ -92,6 +92,7 @@ class TestFileAdapter:
         await adapter.stop()
 
         assert adapter.running is False
+        assert adapter.stopped.is_set()
         adapter.socketio_server.emit_event.assert_awaited_once_with(
             "disconnect", {"adapter_type": adapter.adapter_type}
         )
@@ -98,6 +98,26 @@ class TestDownloader:
                                     assert result[1]["attachment_id"] == "def456"
                                     assert mock_download.call_count == 2
 
+        @pytest.mark.asyncio
+        async def test_download_attachment_duplicate_links(self, downloader, mock_magic_instance):
+            """Test that a file linked twice in one message is downloaded once"""
+            message = {
+                "content": "[file1.txt](/user_uploads/1/cd/abc123/file1.txt) "
+                           "and again [file1.txt](/user_uploads/1/cd/abc123/file1.txt)"
+            }
+
+            with patch("os.path.exists", return_value=False):
+                with patch("src.core.utils.attachment_loading.create_attachment_dir"):
+                    with patch.object(downloader, "_download_file", return_value=True) as mock_download:
+                        with patch("src.core.utils.attachment_loading.save_metadata_file"):
+                            with patch("magic.Magic", return_value=mock_magic_instance):
+                                with patch("os.path.getsize", return_value=12345):
+                                    result = await downloader.download_attachment(message)
+
+                                    assert len(result) == 1
+                                    assert result[0]["attachment_id"] == "abc123"
+                                    mock_download.assert_called_once()
+
         @pytest.mark.asyncio
         async def test_download_attachment_no_attachments(self, downloader):
             """Test handling a message with no attachments"""
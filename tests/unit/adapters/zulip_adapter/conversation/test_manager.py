@@ -102,6 +102,20 @@ class TestManager:
             conversation_id = await manager._get_conversation_id(private_message_mock)
             assert conversation_id == "101_102" # sorted user IDs
 
+        @pytest.mark.asyncio
+        async def test_get_conversation_id_private_cached(self, manager, private_message_mock):
+            """Test that private conversation IDs are reused for the same recipients"""
+            reordered_message = {
+                **private_message_mock,
+                "display_recipient": list(reversed(private_message_mock["display_recipient"]))
+            }
+
+            first = await manager._get_conversation_id(private_message_mock)
+            second = await manager._get_conversation_id(reordered_message)
+
+            assert first == second == "101_102"
+            assert manager._private_conversation_ids == {frozenset({101, 102}): "101_102"}
+
         @pytest.mark.asyncio
         async def test_get_conversation_id_stream(self, manager, stream_message_mock):
             """Test getting conversation ID for stream message"""
@@ -181,11 +195,74 @@ class TestManager:
 
                 mock_create_message.assert_called_once()
 
+        @pytest.mark.asyncio
+        async def test_add_message_outside_lock(self,
+                                                manager,
+                                                private_message_mock,
+                                                cached_private_message_mock,
+                                                user_info_mock):
+            """Test that the message is cached under its conversation lock, not the manager lock"""
+            async def create_message(*args):
+                assert not manager._lock.locked()
+                assert manager._get_conversation_lock("101_102").locked()
+                return cached_private_message_mock
+
+            with patch.object(UserBuilder, "add_user_info_to_conversation", return_value=user_info_mock), \
+                 patch.object(ThreadHandler, "add_thread_info", return_value=None), \
+                 patch.object(manager, "_create_message", side_effect=create_message), \
+                 patch.object(manager, "_get_mentions", return_value=[]):
+
+                delta = await manager.add_to_conversation({"message": private_message_mock})
+
+                assert delta["added_messages"][0]["message_id"] == "12346"
+
+        @pytest.mark.asyncio
+        async def test_add_message_not_blocked_by_manager_lock(self,
+                                                              manager,
+                                                              private_message_mock,
+                                                              cached_private_message_mock,
+                                                              user_info_mock):
+            """Test that adding a message does not wait for the manager lock"""
+            with patch.object(UserBuilder, "add_user_info_to_conversation", return_value=user_info_mock), \
+                 patch.object(ThreadHandler, "add_thread_info", return_value=None), \
+                 patch.object(manager, "_create_message", return_value=cached_private_message_mock), \
+                 patch.object(manager, "_get_mentions", return_value=[]):
+
+                async with manager._lock:
+                    delta = await asyncio.wait_for(
+                        manager.add_to_conversation({"message": private_message_mock}),
+                        timeout=1
+                    )
+
+                assert delta["added_messages"][0]["message_id"] == "12346"
+
         @pytest.mark.asyncio
         async def test_add_empty_message(self, manager):
             """Test adding an empty message"""
             assert await manager.add_to_conversation({}) == {}
 
+        @pytest.mark.asyncio
+        async def test_add_many_messages(self,
+                                         manager,
+                                         private_message_mock,
+                                         cached_private_message_mock,
+                                         user_info_mock):
+            """Test adding several messages in one call"""
+            with patch.object(UserBuilder, "add_user_info_to_conversation", return_value=user_info_mock), \
+                 patch.object(ThreadHandler, "add_thread_info", return_value=None), \
+                 patch.object(manager, "_create_message", return_value=cached_private_message_mock) as mock_create_message, \
+                 patch.object(manager, "_get_mentions", return_value=[]):
+
+                delta = await manager.add_many_to_conversation([
+                    {"message": private_message_mock, "history_fetching_in_progress": True},
+                    {},
+                    {"message": private_message_mock, "history_fetching_in_progress": True}
+                ])
+
+                assert len(delta["added_messages"]) == 2
+                assert all(msg["message_id"] == "12346" for msg in delta["added_messages"])
+                assert mock_create_message.call_count == 2
+
     class TestUpdateConversation:
         """Tests for update_conversation method"""
 
@@ -220,6 +297,7 @@ class TestManager:
             """Test updating a message's content"""
             manager.message_cache.get_message_by_id.return_value = cached_private_message_mock
             manager.conversations["101_102"] = conversation_info_mock
+            manager._message_to_conversation["12346"] = "101_102"
 
             with patch.object(ThreadHandler, "update_thread_info", return_value=(False, None)):
                 delta = await manager.update_conversation({
@@ -243,6 +321,7 @@ class TestManager:
             """Test updating a message's reactions"""
             manager.message_cache.get_message_by_id.return_value = cached_private_message_mock
             manager.conversations["101_102"] = conversation_info_mock
+            manager._message_to_conversation["12346"] = "101_102"
 
             instance_mock = MagicMock()
             instance_mock.platform_specific_to_standard.return_value = "thumbs_up"
@@ -262,6 +341,43 @@ class TestManager:
                 assert len(cached_private_message_mock.reactions) == 1
                 assert cached_private_message_mock.reactions["thumbs_up"] == 1
 
+        @pytest.mark.asyncio
+        async def test_update_reaction_not_blocked_by_manager_lock(self,
+                                                                   manager,
+                                                                   conversation_info_mock,
+                                                                   cached_private_message_mock,
+                                                                   reaction_message_mock):
+            """Test that reactions only take the lock of their own conversation"""
+            manager.message_cache.get_message_by_id.return_value = cached_private_message_mock
+            manager.conversations["101_102"] = conversation_info_mock
+            manager._message_to_conversation["12346"] = "101_102"
+
+            instance_mock = MagicMock()
+            instance_mock.platform_specific_to_standard.return_value = "thumbs_up"
+
+            with patch.object(EmojiConverter, "_instance", instance_mock):
+                async with manager._lock:
+                    delta = await asyncio.wait_for(
+                        manager.update_conversation({
+                            "event_type": ZulipEventType.REACTION,
+                            "message": reaction_message_mock
+                        }),
+                        timeout=1
+                    )
+
+            assert delta["added_reactions"] == ["thumbs_up"]
+
+        @pytest.mark.asyncio
+        async def test_update_reaction_unknown_message(self, manager, reaction_message_mock):
+            """Test that reactions to unknown messages are ignored"""
+            delta = await manager.update_conversation({
+                "event_type": ZulipEventType.REACTION,
+                "message": reaction_message_mock
+            })
+
+            assert delta == {}
+            manager.message_cache.get_message_by_id.assert_not_called()
+
         @pytest.mark.asyncio
         async def test_update_nonexistent_message(self, manager, edited_message_mock):
             """Test updating a non-existent message"""
@@ -282,7 +398,7 @@ class TestManager:
                                       cached_private_message_mock):
             """Test deleting a message"""
             manager.conversations["101_102"] = conversation_info_mock
-            manager.message_cache.get_message_by_id.return_value = cached_private_message_mock
+            manager.message_cache.get_messages_by_ids.return_value = {"12345": cached_private_message_mock}
             manager.message_cache.delete_message.return_value = True
 
             with patch.object(ThreadHandler, "remove_thread_info", return_value=(False, None)):
@@ -293,11 +409,30 @@ class TestManager:
                     }
                 )
 
-                manager.message_cache.get_message_by_id.assert_called_once_with(
-                    conversation_id="101_102",
-                    message_id="12345"
-                )
+                manager.message_cache.get_messages_by_ids.assert_called_once_with("101_102", ["12345"])
                 manager.message_cache.delete_message.assert_called_once_with("101_102", "12345")
+                assert "12345" not in manager._message_to_conversation
+
+        @pytest.mark.asyncio
+        async def test_delete_message_not_blocked_by_manager_lock(self,
+                                                                  manager,
+                                                                  conversation_info_mock,
+                                                                  cached_private_message_mock):
+            """Test that deletions only take the lock of their own conversation"""
+            manager.conversations["101_102"] = conversation_info_mock
+            manager.message_cache.get_messages_by_ids.return_value = {"12346": cached_private_message_mock}
+
+            async with manager._lock:
+                delta = await asyncio.wait_for(
+                    manager.delete_from_conversation(
+                        outgoing_event={"deleted_ids": ["12346"], "conversation_id": "101_102"}
+                    ),
+                    timeout=1
+                )
+
+            assert delta["deleted_message_ids"] == ["12346"]
+            assert "12346" not in conversation_info_mock.messages
+            assert manager._get_conversation_lock("101_102") is manager._get_conversation_lock("101_102")
 
         @pytest.mark.asyncio
         async def test_delete_nonexistent_message(self, manager):
@@ -306,7 +441,7 @@ class TestManager:
                 conversation_id="101_102",
                 conversation_type="private"
             )
-            manager.message_cache.get_message_by_id.return_value = None
+            manager.message_cache.get_messages_by_ids.return_value = {}
 
             await manager.delete_from_conversation(
                 outgoing_event={
@@ -347,6 +482,84 @@ class TestManager:
 
             assert len(delta["deleted_message_ids"]) == 2
             assert manager.message_cache.migrate_message.call_count == 2
+            assert manager._message_to_conversation == {
+                "12345": "201/New Topic",
+                "12346": "201/New Topic"
+            }
+
+        @pytest.mark.asyncio
+        async def test_migrate_messages_with_attachments(self,
+                                                         manager,
+                                                         zulip_config,
+                                                         migration_message_mock):
+            """Test that attachments follow the migrated messages"""
+            manager.message_cache = MessageCache(zulip_config)
+            manager.attachment_cache.peek_attachment = MagicMock(return_value=None)
+            manager.conversations["201/Old Topic"] = ConversationInfo(
+                conversation_id="201/Old Topic",
+                conversation_type="stream",
+                messages={"12345", "12347"},
+                attachments={"attachment1", "attachment2"}
+            )
+
+            for message_id, attachment_id in (("12345", "attachment1"), ("12347", "attachment2")):
+                cached_msg = await manager.message_cache.add_message({
+                    "message_id": message_id,
+                    "conversation_id": "201/Old Topic",
+                    "text": "Hello!",
+                    "timestamp": 1609459200
+                })
+                cached_msg.attachments.add(attachment_id)
+
+            await manager.migrate_between_conversations(migration_message_mock)
+
+            old_conversation = manager.conversations["201/Old Topic"]
+            new_conversation = manager.conversations["201/New Topic"]
+
+            assert old_conversation.messages == {"12347"}
+            assert old_conversation.attachments == {"attachment2"}
+            assert new_conversation.messages == {"12345", "12346"}
+            assert new_conversation.attachments == {"attachment1"}
+            assert "12345" in manager.message_cache.messages["201/New Topic"]
+
+        @pytest.mark.asyncio
+        async def test_migrate_holds_both_conversation_locks(self, manager, migration_message_mock):
+            """Test that messages are moved under the locks of both conversations"""
+            manager.conversations["201/Old Topic"] = ConversationInfo(
+                conversation_id="201/Old Topic",
+                conversation_type="stream",
+                messages={"12345", "12346"}
+            )
+
+            async def migrate_message(*args):
+                assert manager._get_conversation_lock("201/Old Topic").locked()
+                assert manager._get_conversation_lock("201/New Topic").locked()
+                assert not manager._lock.locked()
+
+            manager.message_cache.migrate_message.side_effect = migrate_message
+
+            await manager.migrate_between_conversations(migration_message_mock)
+
+            assert manager.message_cache.migrate_message.call_count == 2
+            assert not any(lock.locked() for lock in manager._conversation_locks)
+
+        @pytest.mark.asyncio
+        async def test_migrate_within_one_lock_stripe(self, manager, migration_message_mock):
+            """Test that conversations sharing a lock stripe take it only once"""
+            manager.conversations["201/Old Topic"] = ConversationInfo(
+                conversation_id="201/Old Topic",
+                conversation_type="stream",
+                messages={"12345", "12346"}
+            )
+
+            with patch.object(manager, "_get_conversation_lock_index", return_value=0):
+                delta = await asyncio.wait_for(
+                    manager.migrate_between_conversations(migration_message_mock),
+                    timeout=5
+                )
+
+            assert delta["deleted_message_ids"] == ["12345", "12346"]
+            assert not manager._conversation_locks[0].locked()
 
         @pytest.mark.asyncio
         async def test_migrate_nonexistent_conversation(self, manager, migration_message_mock):
@@ -402,3 +615,55 @@ class TestManager:
             assert result.message_id == "12346"
             assert result.conversation_id == "101_102"
             assert result.text == "Hello!"
+            assert manager._message_to_conversation["12346"] == "101_102"
+
+        def test_iter_conversation_cache(self, manager, cached_private_message_mock):
+            """Test that cached messages are yielded lazily and empty messages are skipped"""
+            empty_message = CachedMessage(
+                message_id="12347",
+                conversation_id="101_102",
+                thread_id=None,
+                sender_id="102",
+                sender_name="Test User 2",
+                text="",
+                timestamp=1609459201,
+                is_from_bot=False
+            )
+            manager.message_cache.messages = {
+                "101_102": {"12346": cached_private_message_mock, "12347": empty_message}
+            }
+
+            messages = manager.iter_conversation_cache("101_102")
+
+            assert next(messages)["message_id"] == "12346"
+            assert next(messages, None) is None
+            assert manager.get_conversation_cache("101_102")[0]["mentions"] == []
+            assert manager.get_conversation_cache("unknown") == []
+
+        @pytest.mark.asyncio
+        async def test_evicted_messages_leave_the_index(self, zulip_config, cached_private_message_mock):
+            """Test that messages evicted from the cache are dropped from the message index"""
+            manager = Manager(zulip_config)
+            manager.message_cache.max_messages_per_conversation = 1
+            newer_message = {
+                "message_id": "12347",
+                "conversation_id": "101_102",
+                "text": "Newer",
+                "timestamp": 1609459201
+            }
+
+            for message in (cached_private_message_mock.__dict__, newer_message):
+                await manager.message_cache.add_message(message)
+                manager._message_to_conversation[message["message_id"]] = "101_102"
+            await manager.message_cache._run_maintenance()
+
+            assert manager._message_to_conversation == {"12347": "101_102"}
+
+        @pytest.mark.asyncio
+        async def test_get_conversation_id_from_update(self, manager):
+            """Test resolving the conversation of an indexed message"""
+            manager._message_to_conversation["12346"] = "101_102"
+
+            assert await manager._get_conversation_id_from_update({"message_id": 12346}) == "101_102"
+            assert await manager._get_conversation_id_from_update({"message_id": 99999}) is None
+            assert await manager._get_conversation_id_from_update({}) is None
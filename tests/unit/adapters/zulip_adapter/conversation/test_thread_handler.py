@@ -75,6 +75,13 @@ class TestThreadHandler:
             assert result is None
             assert len(conversation_info.threads) == 0
 
+        @pytest.mark.asyncio
+        async def test_reply_deep_in_content(self, thread_handler, conversation_info):
+            """Test that a live message is scanned for its reply reference in full"""
+            content = "x" * 2000 + " [said](https://zulip.example.com/123-general/near/1001)"
+
+            assert thread_handler._extract_reply_to_id({"content": content}) == "1001"
+
         @pytest.mark.asyncio
         async def test_new_thread(self, thread_handler, conversation_info):
             """Test creating a new thread"""
@@ -187,3 +187,21 @@ class TestUserBuilder:
         assert result.username == "Existing Name"  # Not updated
         assert result.email == "existing@example.com"  # Not updated
         assert result.is_bot is True  # Not updated
+
+    @pytest.mark.asyncio
+    async def test_add_user_info_to_conversation_known_sender(self,
+                                                              config_mock,
+                                                              mock_private_message,
+                                                              conversation_info):
+        """Test that a known sender is returned without rebuilding user info"""
+        first = await UserBuilder.add_user_info_to_conversation(
+            config_mock, mock_private_message, conversation_info
+        )
+        config_mock.get_setting.reset_mock()
+
+        second = await UserBuilder.add_user_info_to_conversation(
+            config_mock, mock_private_message, conversation_info
+        )
+
+        assert second is first
+        config_mock.get_setting.assert_not_called()
@@ -0,0 +1,18 @@
+import pytest
+
+class FakeRateLimiter:
+    """Stand-in for the rate limiter that records requests without waiting"""
+
+    def __init__(self):
+        self.requests = []
+
+    async def limit_request(self, request_type, conversation_id=None):
+        self.requests.append((request_type, conversation_id))
+
+    async def get_wait_time(self, request_type, conversation_id=None):
+        return 0
+
+@pytest.fixture
+def rate_limiter_mock():
+    """Create a fake rate limiter shared by the Zulip event processor tests"""
+    return FakeRateLimiter()
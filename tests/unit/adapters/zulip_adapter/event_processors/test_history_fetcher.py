@@ -1,13 +1,87 @@
 import json
 import pytest
 import re
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping, Tuple
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.adapters.zulip_adapter.conversation.data_classes import ConversationInfo
 from src.adapters.zulip_adapter.conversation.manager import Manager
-from src.adapters.zulip_adapter.event_processors.history_fetcher import HistoryFetcher
+from src.adapters.zulip_adapter.event_processors.history_fetcher import FormattedMessage, HistoryFetcher
 from src.core.conversation.base_data_classes import UserInfo
 
+# Read-only sample data shared by all tests; mappings are wrapped in
+# MappingProxyType so that a test cannot modify them for the others
+MOCK_MESSAGES = (
+    MappingProxyType({
+        "id": 1001,
+        "sender_id": 123,
+        "sender_full_name": "User One",
+        "content": "Hello world",
+        "timestamp": 1627984000,
+        "subject": "Test Topic"
+    }),
+    MappingProxyType({
+        "id": 1002,
+        "sender_id": 456,
+        "sender_full_name": "User Two",
+        "content": "@_**User One|123** [said](https://zulip.example.com/123-general/near/1001):\n```quote\nHello world\n```\nReply to message",
+        "timestamp": 1627984100,
+        "subject": "Test Topic"
+    })
+)
+
+MOCK_CACHED_MESSAGES = (
+    MappingProxyType({
+        "message_id": "1001",
+        "conversation_id": "123_456",
+        "sender": MappingProxyType({
+            "user_id": "123",
+            "display_name": "User One"
+        }),
+        "text": "Hello world",
+        "thread_id": None,
+        "timestamp": 1627984000,
+        "attachments": ()
+    }),
+)
+
+MOCK_ATTACHMENTS = (
+    MappingProxyType({
+        "attachment_id": "attachment1",
+        "filename": "image.jpg",
+        "size": 12345,
+        "content_type": "image/jpeg",
+        "content": None,
+        "url": "https://zulip.com/user_uploads/1/ab/attachment1/image.jpg",
+        "processable": True
+    }),
+)
+
+@dataclass(frozen=True)
+class FakeConversation:
+    """Stand-in for ConversationInfo with only the attributes HistoryFetcher reads"""
+    conversation_id: str
+    conversation_type: str
+    emails: Tuple[str, ...] = ()
+    known_members: Mapping[str, UserInfo] = field(default_factory=dict)
+
+    def to_fields(self):
+        return list(self.emails)
+
+PRIVATE_CONVERSATION = FakeConversation(
+    conversation_id="123_456",
+    conversation_type="private",
+    emails=("user1@example.com", "user2@example.com"),
+    known_members=MappingProxyType({
+        "123": UserInfo(user_id="123", username="User One", email="user1@example.com"),
+        "456": UserInfo(user_id="456", username="User Two", email="user2@example.com")
+    })
+)
+
+@pytest.mark.xdist_group(name="zulip_history")
 class TestHistoryFetcher:
     """Tests for the HistoryFetcher class"""
 
@@ -25,137 +99,80 @@ class TestHistoryFetcher:
         downloader.download_attachment = AsyncMock()
         return downloader
 
-    @pytest.fixture
-
-    def rate_limiter_mock(self):
-        """Create a mocked rate limiter"""
-        limiter = AsyncMock()
-        limiter.limit_request = AsyncMock()
-        return limiter
-
     @pytest.fixture
     def conversation_manager_mock(self):
         """Create a mocked conversation manager"""
         manager = AsyncMock(spec=Manager)
         manager.get_conversation = MagicMock()
         manager.get_conversation_cache = MagicMock(return_value=[])
-        manager.add_to_conversation = AsyncMock()
+        manager.add_many_to_conversation = AsyncMock()
         return manager
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def conversation(self):
-        """Create a private conversation fixture"""
-        conversation = MagicMock(spec=ConversationInfo)
-        conversation.conversation_id = "123_456"
-        conversation.conversation_type = "private"
-        conversation.to_fields = MagicMock(return_value=["user1@example.com", "user2@example.com"])
-        conversation.known_members = {
-            "123": UserInfo(user_id="123", username="User One", email="user1@example.com"),
-            "456": UserInfo(user_id="456", username="User Two", email="user2@example.com")
-        }
-        return conversation
+        """Private conversation fixture"""
+        return PRIVATE_CONVERSATION
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_messages(self):
-        """Create mock message data"""
-        return [
-            {
-                "id": 1001,
-                "sender_id": 123,
-                "sender_full_name": "User One",
-                "content": "Hello world",
-                "timestamp": 1627984000,
-                "subject": "Test Topic"
-            },
-            {
-                "id": 1002,
-                "sender_id": 456,
-                "sender_full_name": "User Two",
-                "content": "@_**User One|123** [said](https://zulip.example.com/123-general/near/1001):\n```quote\nHello world\n```\nReply to message",
-                "timestamp": 1627984100,
-                "subject": "Test Topic"
-            }
-        ]
+        """Mock message data"""
+        return MOCK_MESSAGES
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_cached_messages(self):
-        """Create mock cached message data"""
-        return [
-            {
-                "message_id": "1001",
-                "conversation_id": "123_456",
-                "sender": {
-                    "user_id": "123",
-                    "display_name": "User One"
-                },
-                "text": "Hello world",
-                "thread_id": None,
-                "timestamp": 1627984000,
-                "attachments": []
-            }
-        ]
+        """Mock cached message data"""
+        return MOCK_CACHED_MESSAGES
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_attachments(self):
-        """Create mock attachment data"""
-        return [
-            {
-                "attachment_id": "attachment1",
-                "filename": "image.jpg",
-                "size": 12345,
-                "content_type": "image/jpeg",
-                "content": None,
-                "url": "https://zulip.com/user_uploads/1/ab/attachment1/image.jpg",
-                "processable": True
-            }
-        ]
+        """Mock attachment data"""
+        return MOCK_ATTACHMENTS
 
     @pytest.fixture
-    def history_fetcher(self,
-                        zulip_config,
-                        zulip_client_mock,
-                        conversation_manager_mock,
-                        rate_limiter_mock,
-                        downloader_mock,
-                        conversation):
-        """Create a HistoryFetcher instance"""
-        def _create(conversation_id, anchor=None, before=None, after=None, history_limit=None):
-            if conversation_id == "123_456":
-                conversation_manager_mock.get_conversation.return_value = conversation
-            else:
-                conversation_manager_mock.get_conversation.return_value = None
-
-            fetcher = HistoryFetcher(
-                config=zulip_config,
-                client=zulip_client_mock,
-                conversation_manager=conversation_manager_mock,
-                conversation_id=conversation_id,
-                anchor=anchor,
-                before=before,
-                after=after,
-                history_limit=history_limit
-            )
-            fetcher.downloader = downloader_mock
-            fetcher.rate_limiter = rate_limiter_mock
-
-            return fetcher
-        return _create
+    def fetcher(self,
+                request,
+                zulip_config,
+                zulip_client_mock,
+                conversation_manager_mock,
+                rate_limiter_mock,
+                downloader_mock,
+                conversation):
+        """Create a HistoryFetcher for the private conversation
+
+        Constructor arguments can be overridden by parametrizing the fixture indirectly.
+        """
+        kwargs = {"conversation_id": "123_456", **getattr(request, "param", {})}
+        if kwargs["conversation_id"] == conversation.conversation_id:
+            conversation_manager_mock.get_conversation.return_value = conversation
+        else:
+            conversation_manager_mock.get_conversation.return_value = None
+
+        fetcher = HistoryFetcher(
+            config=zulip_config,
+            client=zulip_client_mock,
+            conversation_manager=conversation_manager_mock,
+            **kwargs
+        )
+        fetcher.downloader = downloader_mock
+        fetcher.rate_limiter = rate_limiter_mock
+
+        return fetcher
 
     @pytest.mark.asyncio
+    @pytest.mark.parametrize("fetcher", [{"anchor": "2000"}], indirect=True)
     async def test_fetch_with_anchor(self,
-                                     history_fetcher,
+                                     fetcher,
                                      mock_messages,
                                      mock_attachments):
         """Test fetching history with an anchor"""
-        fetcher = history_fetcher("123_456", anchor="2000")
         fetcher.downloader.download_attachment.return_value = mock_attachments
         fetcher.client.get_messages.return_value = {
             "result": "success",
             "messages": mock_messages
         }
-        fetcher.conversation_manager.add_to_conversation.side_effect = [
-            {
-                "added_messages": [{
+        fetcher.conversation_manager.add_many_to_conversation.return_value = {
+            "added_messages": [
+                {
                     "message_id": str(mock_messages[0]["id"]),
                     "conversation_id": "123_456",
                     "sender": {
@@ -166,10 +183,8 @@ class TestHistoryFetcher:
                     "thread_id": None,
                     "timestamp": mock_messages[0]["timestamp"],
                     "attachments": mock_attachments
-                }]
-            },
-            {
-                "added_messages": [{
+                },
+                {
                     "message_id": str(mock_messages[1]["id"]),
                     "conversation_id": "123_456",
                     "sender": {
@@ -180,26 +195,24 @@ class TestHistoryFetcher:
                     "thread_id": "1001",
                     "timestamp": mock_messages[1]["timestamp"],
                     "attachments": mock_attachments
-                }]
-            }
-        ]
+                }
+            ]
+        }
 
         history = await fetcher.fetch()
 
-        fetcher.rate_limiter.limit_request.assert_called_once()
+        assert len(fetcher.rate_limiter.requests) == 1
         fetcher.client.get_messages.assert_called_once()
         call_args = fetcher.client.get_messages.call_args[0][0]
 
-        assert json.loads(call_args["narrow"]) == [
-            {"operator": "pm-with", "operand": "user1@example.com,user2@example.com"}
-        ]
+        assert call_args["narrow"] == fetcher._get_serialized_narrow()
         assert call_args["anchor"] == "2000"
         assert call_args["num_before"] == 10
         assert call_args["num_after"] == 0
         assert call_args["include_anchor"] is False
 
         assert fetcher.downloader.download_attachment.call_count == 2
-        assert fetcher.conversation_manager.add_to_conversation.call_count == 2
+        fetcher.conversation_manager.add_many_to_conversation.assert_called_once()
 
         assert len(history) == 2
         assert history[0]["message_id"] == "1001"
@@ -216,12 +229,16 @@ class TestHistoryFetcher:
         assert history[1]["timestamp"] == 1627984100
 
     @pytest.mark.asyncio
-    async def test_fetch_with_before(self,
-                                history_fetcher,
-                                mock_messages,
-                                mock_attachments):
-        """Test fetching history with before timestamp"""
-        fetcher = history_fetcher("123_456", before=1627984200, history_limit=50)
+    @pytest.mark.parametrize("fetcher,expected_batch_args", [
+        ({"before": 1627984200, "history_limit": 50}, (0, True, False)),
+        ({"after": 1627983900, "history_limit": 50}, (-1, False, True))
+    ], ids=["before", "after"], indirect=["fetcher"])
+    async def test_fetch_with_timestamp(self,
+                                        fetcher,
+                                        mock_messages,
+                                        mock_attachments,
+                                        expected_batch_args):
+        """Test fetching history with a before or after timestamp"""
         fetcher._fetch_history_in_batches = AsyncMock(return_value=mock_messages)
         fetcher._download_attachments = AsyncMock(
             return_value={0: mock_attachments, 1: mock_attachments}
@@ -241,10 +258,9 @@ class TestHistoryFetcher:
                 "timestamp": msg["timestamp"],
                 "attachments": mock_attachments
             })
-        fetcher.conversation_manager.add_to_conversation.side_effect = [
-            {"added_messages": [formatted_messages[0]]},
-            {"added_messages": [formatted_messages[1]]}
-        ]
+        fetcher.conversation_manager.add_many_to_conversation.return_value = {
+            "added_messages": formatted_messages
+        }
 
         history = await fetcher.fetch()
 
@@ -253,69 +269,179 @@ class TestHistoryFetcher:
 
         # Verify _fetch_history_in_batches was called with correct parameters
         fetcher._fetch_history_in_batches.assert_called_once()
-        call_args = fetcher._fetch_history_in_batches.call_args[0]
-        assert call_args[0] == 0  # index
-        assert call_args[1] > 0  # num_before
-        assert call_args[2] == 0  # num_after
+        index, num_before, num_after = fetcher._fetch_history_in_batches.call_args[0]
+        assert (index, num_before > 0, num_after > 0) == expected_batch_args
 
-        assert len(history) == 2  # Both messages are before the timestamp
-        assert fetcher.conversation_manager.add_to_conversation.call_count == 2
+        assert len(history) == 2  # Both messages are within the timestamp bound
+        fetcher.conversation_manager.add_many_to_conversation.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_fetch_with_after(self,
-                                    history_fetcher,
-                                    mock_messages,
-                                    mock_attachments):
-        """Test fetching history with after timestamp"""
-        fetcher = history_fetcher("123_456", after=1627983900, history_limit=50)
+    @pytest.mark.parametrize("fetcher", [
+        {"before": 1627984050, "history_limit": 50}
+    ], indirect=True)
+    async def test_fetch_with_timestamp_without_caching(self, fetcher, mock_messages):
+        """Test that uncached history is filtered by timestamp and returned as dictionaries"""
+        fetcher.cache_fetched_history = False
         fetcher._fetch_history_in_batches = AsyncMock(return_value=mock_messages)
-        fetcher._download_attachments = AsyncMock(
-            return_value={0: mock_attachments, 1: mock_attachments}
+        fetcher._download_attachments = AsyncMock(return_value={})
+
+        history = await fetcher.fetch()
+
+        assert [msg["message_id"] for msg in history] == ["1001"]
+        assert isinstance(history[0], dict)
+        fetcher.conversation_manager.add_many_to_conversation.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_parse_fetched_history_without_caching(self,
+                                                         fetcher,
+                                                         mock_messages,
+                                                         mock_attachments):
+        """Test formatting fetched messages when history is not cached"""
+        fetcher.cache_fetched_history = False
+        fetcher.downloader.download_attachment.return_value = mock_attachments
+
+        history = await fetcher._parse_fetched_history(
+            [*mock_messages, {"id": 1003, "sender_realm_str": "zulipinternal"}]
         )
 
-        formatted_messages = []
-        for msg in mock_messages:
-            formatted_messages.append({
-                "message_id": str(msg["id"]),
+        fetcher.conversation_manager.add_many_to_conversation.assert_not_called()
+        assert all(isinstance(msg, FormattedMessage) for msg in history)
+        assert [msg.to_dict() for msg in history] == [
+            {
+                "message_id": "1001",
                 "conversation_id": "123_456",
-                "sender": {
-                    "user_id": str(msg["sender_id"]),
-                    "display_name": msg["sender_full_name"]
-                },
-                "text": msg["content"],
+                "sender": {"user_id": "123", "display_name": "User One"},
+                "text": "Hello world",
                 "thread_id": None,
-                "timestamp": msg["timestamp"],
-                "attachments": mock_attachments
-            })
-        fetcher.conversation_manager.add_to_conversation.side_effect = [
-            {"added_messages": [formatted_messages[0]]},
-            {"added_messages": [formatted_messages[1]]}
+                "timestamp": 1627984000,
+                "attachments": mock_attachments,
+                "is_direct_message": True,
+                "mentions": []
+            },
+            {
+                "message_id": "1002",
+                "conversation_id": "123_456",
+                "sender": {"user_id": "456", "display_name": "User Two"},
+                "text": mock_messages[1]["content"],
+                "thread_id": "1001",
+                "timestamp": 1627984100,
+                "attachments": mock_attachments,
+                "is_direct_message": True,
+                "mentions": []
+            }
         ]
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fetcher", [{"anchor": "2000"}], indirect=True)
+    async def test_fetch_without_caching_returns_dicts(self,
+                                                       fetcher,
+                                                       mock_messages):
+        """Test that uncached history is converted to dictionaries when returned"""
+        fetcher.cache_fetched_history = False
+        fetcher.downloader.download_attachment.return_value = []
+        fetcher.client.get_messages.return_value = {
+            "result": "success",
+            "messages": list(reversed(mock_messages))
+        }
+
         history = await fetcher.fetch()
 
-        # Check cache was checked first
-        fetcher.conversation_manager.get_conversation_cache.assert_called_once()
+        assert all(isinstance(msg, dict) for msg in history)
+        assert [msg["message_id"] for msg in history] == ["1001", "1002"]
 
-        # Verify _fetch_history_in_batches was called with correct parameters
-        fetcher._fetch_history_in_batches.assert_called_once()
-        call_args = fetcher._fetch_history_in_batches.call_args[0]
-        assert call_args[0] == -1  # index
-        assert call_args[1] == 0  # num_before
-        assert call_args[2] > 0  # num_after
+    @pytest.mark.asyncio
+    async def test_download_attachments_skips_failed_downloads(self,
+                                                               fetcher,
+                                                               mock_messages,
+                                                               mock_attachments):
+        """Test that a failed download does not affect other messages"""
+        fetcher.downloader.download_attachment.side_effect = [
+            Exception("Download failed"), mock_attachments
+        ]
 
-        assert len(history) == 2  # Both messages are before the timestamp
-        assert fetcher.conversation_manager.add_to_conversation.call_count == 2
+        assert await fetcher._download_attachments(mock_messages) == {1: mock_attachments}
+        assert fetcher.downloader.download_attachment.call_count == 2
 
     @pytest.mark.asyncio
-    async def test_fetch_no_conversation(self, history_fetcher):
+    @pytest.mark.parametrize("fetcher", [{"conversation_id": "nonexistent_id"}], indirect=True)
+    async def test_fetch_no_conversation(self, fetcher):
         """Test fetching history with no conversation"""
-        fetcher = history_fetcher("nonexistent_id")
         assert await fetcher.fetch() == []
 
-    def test_extract_reply_to_id(self, history_fetcher):
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("fetcher", [{"anchor": "2000", "history_limit": 3}], indirect=True)
+    async def test_fetch_history_in_pages(self,
+                                          zulip_config,
+                                          fetcher,
+                                          mock_messages,
+                                          mock_attachments):
+        """Test that history before an anchor is requested page by page"""
+        zulip_config.add_setting("adapter", "history_page_size", 1)
+        fetcher.downloader.download_attachment.side_effect = [mock_attachments, []]
+        fetcher.client.get_messages.side_effect = [
+            {"result": "success", "messages": [mock_messages[1]]},
+            {"result": "success", "messages": [mock_messages[0]]},
+            {"result": "success", "messages": []}
+        ]
+
+        history, attachments = await fetcher._fetch_history_in_pages()
+
+        assert history == list(mock_messages)
+        assert attachments == {0: [], 1: mock_attachments}
+        assert fetcher.client.get_messages.call_count == 3
+
+        anchors = [call.args[0]["anchor"] for call in fetcher.client.get_messages.call_args_list]
+        assert anchors == ["2000", 1002, 1001]
+        assert all(
+            call.args[0]["num_before"] == 1 for call in fetcher.client.get_messages.call_args_list
+        )
+
+    def test_serialized_narrow_is_cached(self, fetcher):
+        """Test that the narrow is built and serialized only once per fetcher"""
+
+        with patch.object(
+            fetcher, "_get_narrow_for_conversation", wraps=fetcher._get_narrow_for_conversation
+        ) as narrow_mock:
+            first = fetcher._get_serialized_narrow()
+            second = fetcher._get_serialized_narrow()
+
+            assert first is second
+            assert json.loads(first) == [
+                {"operator": "pm-with", "operand": "user1@example.com,user2@example.com"}
+            ]
+            narrow_mock.assert_called_once()
+
+    def test_serialized_narrow_without_orjson(self, fetcher):
+        """Test that the narrow is serialized with json when orjson is not installed"""
+
+        with patch("src.adapters.zulip_adapter.event_processors.history_fetcher.orjson", None):
+            narrow = fetcher._get_serialized_narrow()
+
+        assert narrow == json.dumps(
+            [{"operator": "pm-with", "operand": "user1@example.com,user2@example.com"}]
+        )
+
+    def test_get_narrow_for_stream_conversation(self, fetcher):
+        """Test that the stream narrow uses the topic split off the conversation id"""
+        fetcher.conversation = ConversationInfo(
+            conversation_id="789/Topic/With/Slashes",
+            conversation_type="stream",
+            conversation_name="general"
+        )
+
+        assert fetcher.conversation.stream_id == "789"
+        assert fetcher._get_narrow_for_conversation() == [
+            {"operator": "stream", "operand": "general"},
+            {"operator": "topic", "operand": "Topic/With/Slashes"}
+        ]
+
+    def test_extract_reply_to_id(self, fetcher):
         """Test extracting reply to ID from content"""
-        fetcher = history_fetcher("123_456")
         content = "@_**User One|123** [said](https://zulip.example.com/123-general/near/1001):\n```quote\nHello world\n```\nReply to message"
         assert fetcher._extract_reply_to_id(content) == "1001"
         assert fetcher._extract_reply_to_id("Regular message") is None
+
+    def test_extract_reply_to_id_only_scans_message_start(self, fetcher):
+        """Test that links to other messages deep in the content are not treated as replies"""
+        content = "x" * 2000 + " [said](https://zulip.example.com/123-general/near/1001)"
+        assert fetcher._extract_reply_to_id(content) is None
@@ -23,14 +23,6 @@ class TestIncomingEventProcessor:
         manager.migrate_between_conversations = AsyncMock()
         return manager
 
-    @pytest.fixture
-    def rate_limiter_mock(self):
-        """Create a mock rate limiter"""
-        rate_limiter = AsyncMock()
-        rate_limiter.limit_request = AsyncMock(return_value=None)
-        rate_limiter.get_wait_time = AsyncMock(return_value=0)
-        return rate_limiter
-
     @pytest.fixture
     def processor(self,
                   zulip_config,
@@ -101,25 +93,26 @@ class TestIncomingEventProcessor:
         """Tests for the process_event method"""
 
         @pytest.mark.asyncio
-        @pytest.mark.parametrize("event_type,event_key", [
-            (ZulipIncomingEventType.MESSAGE, "message"),
-            (ZulipIncomingEventType.UPDATE_MESSAGE, "update_message"),
-            (ZulipIncomingEventType.DELETE_MESSAGE, "delete_message"),
-            (ZulipIncomingEventType.REACTION, "reaction")
-        ])
-        async def test_process_event_calls_correct_handler(self, processor, event_type, event_key):
-            """Test that process_event calls the correct handler method"""
-            event = {"type": event_type}
+        async def test_process_event_dispatches_all_handlers(self, processor):
+            """Test that process_event calls the correct handler method for every event type"""
             handler_mocks = {}
 
             for handler_type in ZulipIncomingEventType:
-                method_name = f"_handle_{handler_type.value}"
                 handler_mock = AsyncMock(return_value=["event_info"])
                 handler_mocks[handler_type] = handler_mock
-                setattr(processor, method_name, handler_mock)
+                setattr(processor, f"_handle_{handler_type.value}", handler_mock)
+
+            for event_type in ZulipIncomingEventType:
+                event = {"type": event_type}
+
+                assert await processor.process_event(event) == ["event_info"]
+                handler_mocks[event_type].assert_called_once_with(event)
+
+                for handler_type, handler_mock in handler_mocks.items():
+                    if handler_type != event_type:
+                        handler_mock.assert_not_called()
 
-            assert await processor.process_event(event) == ["event_info"]
-            handler_mocks[event_type].assert_called_once_with(event)
+                handler_mocks[event_type].reset_mock()
 
         @pytest.mark.asyncio
         async def test_process_unknown_event(self, processor):
@@ -1,5 +1,7 @@
 import pytest
 import asyncio
+import inspect
+from collections import defaultdict
 from unittest.mock import AsyncMock, MagicMock, patch
 import emoji
 
@@ -9,27 +11,113 @@ from src.adapters.zulip_adapter.event_processors.outgoing_event_processor import
 from src.core.events.processors.base_outgoing_event_processor import OutgoingEventType
 from src.core.utils.emoji_converter import EmojiConverter
 
+class FakeZulipClient:
+    """Stand-in for the Zulip client, only its site and credentials are used"""
+    base_url = "https://zulip.example.com/api/"
+    email = "adapter_email@example.com"
+    api_key = "test_api_key"
+
+class FakeUploader:
+    """Stand-in for the Zulip uploader that uploads nothing"""
+
+    async def upload_attachment(self, attachment):
+        return None
+
+class FakeApiClient:
+    """In-memory stand-in for the asynchronous Zulip API client
+
+    Every call is recorded in `calls` as (name, args, kwargs). The response of
+    an endpoint is taken from `responses`: a dict is returned as is, a list is
+    consumed one item per call and a callable is called with the arguments.
+    """
+
+    def __init__(self):
+        self.calls = []
+        self.responses = defaultdict(lambda: {"result": "success"})
+
+    async def send_message(self, message_data):
+        return await self._call("send_message", message_data)
+
+    async def update_message(self, message_data):
+        return await self._call("update_message", message_data)
+
+    async def add_reaction(self, reaction_data):
+        return await self._call("add_reaction", reaction_data)
+
+    async def remove_reaction(self, reaction_data):
+        return await self._call("remove_reaction", reaction_data)
+
+    async def call_endpoint(self, url, method="POST", request=None):
+        if request is None:
+            return await self._call("call_endpoint", url, method=method)
+        return await self._call("call_endpoint", url, method=method, request=request)
+
+    def calls_to(self, name):
+        """Get the positional arguments of every call to an endpoint"""
+        return [args for call_name, args, _ in self.calls if call_name == name]
+
+    def assert_called_once_with(self, name, *args, **kwargs):
+        """Assert that an endpoint was called exactly once with the given arguments"""
+        assert [(args_, kwargs_) for call_name, args_, kwargs_ in self.calls if call_name == name] == [(args, kwargs)]
+
+    async def _call(self, name, *args, **kwargs):
+        self.calls.append((name, args, kwargs))
+
+        response = self.responses[name]
+        if isinstance(response, list):
+            response = response.pop(0)
+        if callable(response):
+            response = response(*args)
+            if inspect.isawaitable(response):
+                response = await response
+        return response
+
+SENTENCE = "This is a sentence. "
+
+_real_sleep = asyncio.sleep
+
+async def _no_sleep(*args, **kwargs):
+    """Replacement for asyncio.sleep that returns immediately"""
+    return None
+
+@pytest.fixture(autouse=True, scope="module")
+def fast_sleep():
+    """Make asyncio.sleep instantaneous for every test in this module"""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(asyncio, "sleep", _no_sleep)
+        yield
+
+MISSING_FIELD_CASES = [
+    (OutgoingEventType.SEND_MESSAGE, {"text": "Hello"}),
+    (OutgoingEventType.SEND_MESSAGE, {"conversation_id": "123_456"}),
+    (OutgoingEventType.EDIT_MESSAGE, {"message_id": "789", "text": "Hello"}),
+    (OutgoingEventType.EDIT_MESSAGE, {"conversation_id": "123_456", "text": "Hello"}),
+    (OutgoingEventType.EDIT_MESSAGE, {"conversation_id": "123_456", "message_id": "789"}),
+    (OutgoingEventType.DELETE_MESSAGE, {"message_id": "789"}),
+    (OutgoingEventType.DELETE_MESSAGE, {"conversation_id": "123_456"}),
+    (OutgoingEventType.ADD_REACTION, {"message_id": "789", "emoji": "+1"}),
+    (OutgoingEventType.ADD_REACTION, {"conversation_id": "123_456", "emoji": "+1"}),
+    (OutgoingEventType.ADD_REACTION, {"conversation_id": "123_456", "message_id": "789"}),
+    (OutgoingEventType.REMOVE_REACTION, {"message_id": "789", "emoji": "+1"}),
+    (OutgoingEventType.REMOVE_REACTION, {"conversation_id": "123_456", "emoji": "+1"}),
+    (OutgoingEventType.REMOVE_REACTION, {"conversation_id": "123_456", "message_id": "789"})
+]
+
+@pytest.mark.xdist_group(name="zulip_outgoing")
 class TestOutgoingEventProcessor:
     """Tests for the OutgoingEventProcessor class"""
 
     @pytest.fixture
-    def zulip_client_mock(self):
-        """Create a mocked Zulip client"""
-        client = AsyncMock()
-        client.client = MagicMock()
-        client.send_message = MagicMock(return_value={"result": "success"})
-        client.update_message = MagicMock(return_value={"result": "success"})
-        client.call_endpoint = MagicMock(return_value={"result": "success"})
-        client.add_reaction = MagicMock(return_value={"result": "success"})
-        client.remove_reaction = MagicMock(return_value={"result": "success"})
-        return client
+    def api_client(self):
+        """Create a fake asynchronous Zulip API client"""
+        return FakeApiClient()
 
     @pytest.fixture
     def private_conversation_mock(self):
         """Create a mocked private conversation"""
         conversation = MagicMock()
         conversation.conversation_type = "private"
-        conversation.to_fields.return_value = ["test@example.com", "test@example.com"]
+        conversation.to_fields = lambda: ["test@example.com", "test@example.com"]
         return conversation
 
     @pytest.fixture
@@ -37,23 +125,19 @@ class TestOutgoingEventProcessor:
         """Create a mocked stream conversation"""
         conversation = MagicMock()
         conversation.conversation_type = "stream"
-        conversation.to_fields.return_value = "test-stream"
+        conversation.to_fields = lambda: "test-stream"
         conversation.conversation_id = "789/Some topic"
+        conversation.topic = "Some topic"
         return conversation
 
     @pytest.fixture
     def conversation_manager_mock(self, private_conversation_mock, stream_conversation_mock):
         """Create a mocked conversation manager"""
         manager = AsyncMock()
-
-        def get_conversation_side_effect(conversation_id):
-            if conversation_id == "123_456":
-                return private_conversation_mock
-            elif conversation_id == "789/Some topic":
-                return stream_conversation_mock
-            return None
-
-        manager.get_conversation = MagicMock(side_effect=get_conversation_side_effect)
+        manager.get_conversation = {
+            "123_456": private_conversation_mock,
+            "789/Some topic": stream_conversation_mock
+        }.get
         manager.add_to_conversation = AsyncMock()
         manager.update_conversation = AsyncMock()
         manager.delete_from_conversation = AsyncMock()
@@ -62,39 +146,45 @@ class TestOutgoingEventProcessor:
 
     @pytest.fixture
     def uploader_mock(self):
-        """Create a mocked uploader"""
-        uploader = AsyncMock()
-        uploader.upload_file = AsyncMock(return_value={"uri": "test-uri"})
-        return uploader
+        """Create a fake uploader"""
+        return FakeUploader()
 
     @pytest.fixture
-    def rate_limiter_mock(self):
-        """Create a mock rate limiter"""
-        rate_limiter = AsyncMock()
-        rate_limiter.limit_request = AsyncMock(return_value=None)
-        rate_limiter.get_wait_time = AsyncMock(return_value=0)
-        return rate_limiter
+    def long_text(self, zulip_config):
+        """Create the shortest run of sentences that exceeds the max message length"""
+        max_length = zulip_config.get_setting("adapter", "max_message_length")
+        return SENTENCE * (max_length // len(SENTENCE) + 1)
 
     @pytest.fixture
     def processor(self,
                   zulip_config,
-                  zulip_client_mock,
+                  api_client,
                   conversation_manager_mock,
                   uploader_mock,
                   rate_limiter_mock):
         """Create a ZulipOutgoingEventProcessor with mocked dependencies"""
         processor = OutgoingEventProcessor(
-            zulip_config, zulip_client_mock, conversation_manager_mock
+            zulip_config, FakeZulipClient(), conversation_manager_mock
         )
         processor.rate_limiter = rate_limiter_mock
         processor.uploader = uploader_mock
+        processor.api_client = api_client
         return processor
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("event_type,data", MISSING_FIELD_CASES)
+    async def test_missing_required_fields(self, processor, api_client, event_type, data):
+        """Test that requests with a missing required field are rejected"""
+        response = await processor.process_event({"event_type": event_type, "data": data})
+
+        assert response["request_completed"] is False
+        assert api_client.calls == []
+
     class TestSendMessage:
         """Tests for the send_message method"""
 
         @pytest.mark.asyncio
-        async def test_send_message_private_success(self, processor, zulip_client_mock):
+        async def test_send_message_private_success(self, processor, api_client):
             """Test sending a private message successfully"""
             event_data = {
                 "event_type": OutgoingEventType.SEND_MESSAGE,
@@ -104,11 +194,10 @@ class TestOutgoingEventProcessor:
                 }
             }
 
-            with patch("asyncio.sleep"):
-                response = await processor.process_event(event_data)
-                assert response["request_completed"] is True
+            response = await processor.process_event(event_data)
+            assert response["request_completed"] is True
 
-            zulip_client_mock.send_message.assert_called_once_with({
+            api_client.assert_called_once_with("send_message", {
                 "type": "private",
                 "to": ["test@example.com", "test@example.com"],
                 "content": "Hello, world!",
@@ -116,7 +205,7 @@ class TestOutgoingEventProcessor:
             })
 
         @pytest.mark.asyncio
-        async def test_send_message_stream_success(self, processor, zulip_client_mock):
+        async def test_send_message_stream_success(self, processor, api_client):
             """Test sending a stream message successfully"""
             event_data = {
                 "event_type": OutgoingEventType.SEND_MESSAGE,
@@ -126,11 +215,10 @@ class TestOutgoingEventProcessor:
                 }
             }
 
-            with patch("asyncio.sleep"):
-                response = await processor.process_event(event_data)
-                assert response["request_completed"] is True
+            response = await processor.process_event(event_data)
+            assert response["request_completed"] is True
 
-            zulip_client_mock.send_message.assert_called_once_with({
+            api_client.assert_called_once_with("send_message", {
                 "type": "stream",
                 "to": "test-stream",
                 "content": "Hello, stream!",
@@ -138,42 +226,117 @@ class TestOutgoingEventProcessor:
             })
 
         @pytest.mark.asyncio
-        async def test_send_message_long_text(self, processor, zulip_client_mock):
+        async def test_send_message_long_text(self, processor, api_client, long_text):
             """Test sending a message with text longer than max length"""
             event_data = {
                 "event_type": OutgoingEventType.SEND_MESSAGE,
                 "data": {
                     "conversation_id": "123_456",
-                    "text": "This is a sentence. " * 10
+                    "text": long_text
                 }
             }
 
-            with patch("asyncio.sleep"):
-                response = await processor.process_event(event_data)
-                assert response["request_completed"] is True
-            assert zulip_client_mock.send_message.call_count > 1
+            response = await processor.process_event(event_data)
+            assert response["request_completed"] is True
+            assert len(api_client.calls_to("send_message")) > 1
 
         @pytest.mark.asyncio
-        async def test_send_message_missing_required_fields(self, processor):
-            """Test sending a message with missing required fields"""
-            # Missing conversation_id
-            response = await processor.process_event({
+        async def test_send_message_with_attachments(self, processor, api_client, uploader_mock):
+            """Test that attachments are uploaded concurrently and linked in order"""
+            uploader_mock.upload_attachment = AsyncMock(side_effect=[
+                "/user_uploads/1/ab/first.txt", "/user_uploads/1/cd/second.txt", "/user_uploads/1/ef/third.txt"
+            ])
+            event_data = {
                 "event_type": OutgoingEventType.SEND_MESSAGE,
-                "data": {"text": "Hello"}
+                "data": {
+                    "conversation_id": "123_456",
+                    "text": "Files",
+                    "attachments": [
+                        {"file_name": "first.txt", "content": "Zmlyc3Q="},
+                        {"file_name": "second.txt", "content": "c2Vjb25k"},
+                        {"file_name": "third.txt", "content": "dGhpcmQ="}
+                    ]
+                }
+            }
+
+            response = await processor.process_event(event_data)
+            assert response["request_completed"] is True
+
+            assert uploader_mock.upload_attachment.call_count == 3
+            assert len(processor.rate_limiter.requests) == 4
+            api_client.assert_called_once_with("send_message", {
+                "type": "private",
+                "to": ["test@example.com", "test@example.com"],
+                "content": (
+                    "Files"
+                    "\n[first.txt](/user_uploads/1/ab/first.txt)"
+                    "\n[second.txt](/user_uploads/1/cd/second.txt)"
+                    "\n[third.txt](/user_uploads/1/ef/third.txt)"
+                ),
+                "subject": None
             })
-            assert response["request_completed"] is False
 
-            # Missing text
-            response = await processor.process_event({
+        @pytest.mark.asyncio
+        @pytest.mark.parametrize("failed_upload", [None, Exception("Upload failed")])
+        async def test_send_message_upload_failure(self, processor, api_client, uploader_mock, failed_upload):
+            """Test that a message is not sent without one of its attachments"""
+            uploader_mock.upload_attachment = AsyncMock(side_effect=[
+                "/user_uploads/1/ab/first.txt", failed_upload
+            ])
+            event_data = {
                 "event_type": OutgoingEventType.SEND_MESSAGE,
-                "data": {"conversation_id": "123_456"}
-            })
+                "data": {
+                    "conversation_id": "123_456",
+                    "text": "Files",
+                    "attachments": [
+                        {"file_name": "first.txt", "content": "Zmlyc3Q="},
+                        {"file_name": "second.txt", "content": "c2Vjb25k"}
+                    ]
+                }
+            }
+
+            response = await processor.process_event(event_data)
+
             assert response["request_completed"] is False
+            assert api_client.calls_to("send_message") == []
+
+        @pytest.mark.asyncio
+        async def test_send_message_sends_chunks_during_upload(self,
+                                                               processor,
+                                                               api_client,
+                                                               uploader_mock,
+                                                               long_text):
+            """Test that earlier chunks are sent while attachments are still uploading"""
+            first_chunk_sent = asyncio.Event()
+            api_client.responses["send_message"] = lambda _: (
+                first_chunk_sent.set() or {"result": "success"}
+            )
+
+            async def upload_attachment(_):
+                await first_chunk_sent.wait()
+                return "/user_uploads/1/ab/file.txt"
+
+            uploader_mock.upload_attachment = AsyncMock(side_effect=upload_attachment)
+            event_data = {
+                "event_type": OutgoingEventType.SEND_MESSAGE,
+                "data": {
+                    "conversation_id": "123_456",
+                    "text": long_text,
+                    "attachments": [{"file_name": "file.txt", "content": "ZmlsZQ=="}]
+                }
+            }
+
+            response = await asyncio.wait_for(processor.process_event(event_data), timeout=1)
+
+            assert response["request_completed"] is True
+            assert len(api_client.calls_to("send_message")) > 1
+            last_call = api_client.calls_to("send_message")[-1][0]
+            assert last_call["content"].endswith("\n[file.txt](/user_uploads/1/ab/file.txt)")
 
         @pytest.mark.asyncio
-        async def test_send_message_api_failure(self, processor, zulip_client_mock):
+        async def test_send_message_api_failure(self, processor, api_client):
             """Test sending a message when API fails"""
-            zulip_client_mock.send_message.return_value = {"result": "error", "msg": "Test error"}
+            api_client.responses["send_message"] = {"result": "error", "msg": "Test error", "code": "BAD_REQUEST"}
             event_data = {
                 "event_type": OutgoingEventType.SEND_MESSAGE,
                 "data": {
@@ -189,7 +352,7 @@ class TestOutgoingEventProcessor:
         """Tests for the edit_message method"""
 
         @pytest.mark.asyncio
-        async def test_edit_message_success(self, processor, zulip_client_mock):
+        async def test_edit_message_success(self, processor, api_client):
             """Test successfully editing a message"""
             event_data = {
                 "event_type": OutgoingEventType.EDIT_MESSAGE,
@@ -202,39 +365,15 @@ class TestOutgoingEventProcessor:
             response = await processor.process_event(event_data)
 
             assert response["request_completed"] is True
-            zulip_client_mock.update_message.assert_called_once_with({
+            api_client.assert_called_once_with("update_message", {
                 "message_id": 789,  # Should be converted to int
                 "content": "Updated text"
             })
 
         @pytest.mark.asyncio
-        async def test_edit_message_missing_required_fields(self, processor):
-            """Test editing a message with missing required fields"""
-            # Missing conversation_id
-            response = await processor.process_event({
-                "event_type": OutgoingEventType.EDIT_MESSAGE,
-                "data": {"message_id": "789", "text": "Hello"}
-            })
-            assert response["request_completed"] is False
-
-            # Missing message_id
-            response = await processor.process_event({
-                "event_type": OutgoingEventType.EDIT_MESSAGE,
-                "data": {"conversation_id": "123_456", "text": "Hello"}
-            })
-            assert response["request_completed"] is False
-
-            # Missing text
-            response = await processor.process_event({
-                "event_type": OutgoingEventType.EDIT_MESSAGE,
-                "data": {"conversation_id": "123_456", "message_id": "789"}
-            })
-            assert response["request_completed"] is False
-
-        @pytest.mark.asyncio
-        async def test_edit_message_api_failure(self, processor, zulip_client_mock):
+        async def test_edit_message_api_failure(self, processor, api_client):
             """Test editing a message when API fails"""
-            zulip_client_mock.update_message.return_value = {"result": "error", "msg": "Test error"}
+            api_client.responses["update_message"] = {"result": "error", "msg": "Test error", "code": "BAD_REQUEST"}
             event_data = {
                 "event_type": OutgoingEventType.EDIT_MESSAGE,
                 "data": {
@@ -251,7 +390,7 @@ class TestOutgoingEventProcessor:
         """Tests for the delete_message method"""
 
         @pytest.mark.asyncio
-        async def test_delete_message_success(self, processor, zulip_client_mock):
+        async def test_delete_message_success(self, processor, api_client):
             """Test successfully deleting a message"""
             event_data = {
                 "event_type": OutgoingEventType.DELETE_MESSAGE,
@@ -263,30 +402,13 @@ class TestOutgoingEventProcessor:
             response = await processor.process_event(event_data)
 
             assert response["request_completed"] is True
-            zulip_client_mock.call_endpoint.assert_called_once_with("messages/789",method="DELETE")
+            api_client.assert_called_once_with("call_endpoint", "messages/789", method="DELETE")
             processor.conversation_manager.delete_from_conversation.assert_called_once()
 
         @pytest.mark.asyncio
-        async def test_delete_message_missing_required_fields(self, processor):
-            """Test deleting a message with missing required fields"""
-            # Missing conversation_id
-            response = await processor.process_event({
-                "event_type": OutgoingEventType.DELETE_MESSAGE,
-                "data": {"message_id": "789"}
-            })
-            assert response["request_completed"] is False
-
-            # Missing message_id
-            response = await processor.process_event({
-                "event_type": OutgoingEventType.DELETE_MESSAGE,
-                "data": {"conversation_id": "123_456"}
-            })
-            assert response["request_completed"] is False
-
-        @pytest.mark.asyncio
-        async def test_delete_message_api_failure(self, processor, zulip_client_mock):
+        async def test_delete_message_api_failure(self, processor, api_client):
             """Test deleting a message when API fails"""
-            zulip_client_mock.call_endpoint.return_value = {"result": "error", "msg": "Test error"}
+            api_client.responses["call_endpoint"] = {"result": "error", "msg": "Test error", "code": "BAD_REQUEST"}
             event_data = {
                 "event_type": OutgoingEventType.DELETE_MESSAGE,
                 "data": {
@@ -302,8 +424,16 @@ class TestOutgoingEventProcessor:
     class TestReactions:
         """Tests for reaction-related methods"""
 
+        @pytest.fixture
+        def emoji_converter(self, monkeypatch):
+            """Install a mocked EmojiConverter instance that maps to "+1" by default"""
+            instance_mock = MagicMock()
+            instance_mock.standard_to_platform_specific.return_value = "+1"
+            monkeypatch.setattr(EmojiConverter, "_instance", instance_mock)
+            return instance_mock
+
         @pytest.mark.asyncio
-        async def test_add_reaction_success(self, processor, zulip_client_mock):
+        async def test_add_reaction_success(self, processor, api_client, emoji_converter):
             """Test successfully adding a reaction"""
             event_data = {
                 "event_type": OutgoingEventType.ADD_REACTION,
@@ -314,46 +444,18 @@ class TestOutgoingEventProcessor:
                 }
             }
 
-            instance_mock = MagicMock()
-            instance_mock.standard_to_platform_specific.return_value = "+1"
-
-            with patch.object(EmojiConverter, "_instance", instance_mock):
-                response = await processor.process_event(event_data)
-
-                assert response["request_completed"] is True
-                zulip_client_mock.add_reaction.assert_called_once_with({
-                    "message_id": 789,
-                    "emoji_name": "+1"
-                })
-
-        @pytest.mark.asyncio
-        async def test_add_reaction_missing_required_fields(self, processor):
-            """Test adding a reaction with missing required fields"""
-            # Missing conversation_id
-            response = await processor.process_event({
-                "event_type": OutgoingEventType.ADD_REACTION,
-                "data": {"message_id": "789", "emoji": "+1"}
-            })
-            assert response["request_completed"] is False
-
-            # Missing message_id
-            response = await processor.process_event({
-                "event_type": OutgoingEventType.ADD_REACTION,
-                "data": {"conversation_id": "123_456", "emoji": "+1"}
-            })
-            assert response["request_completed"] is False
+            response = await processor.process_event(event_data)
 
-            # Missing emoji
-            response = await processor.process_event({
-                "event_type": OutgoingEventType.ADD_REACTION,
-                "data": {"conversation_id": "123_456", "message_id": "789"}
+            assert response["request_completed"] is True
+            api_client.assert_called_once_with("add_reaction", {
+                "message_id": 789,
+                "emoji_name": "+1"
             })
-            assert response["request_completed"] is False
 
         @pytest.mark.asyncio
-        async def test_add_reaction_api_failure(self, processor, zulip_client_mock):
+        async def test_add_reaction_api_failure(self, processor, api_client, emoji_converter):
             """Test adding a reaction when API fails"""
-            zulip_client_mock.add_reaction.return_value = {"result": "error", "msg": "Test error"}
+            api_client.responses["add_reaction"] = {"result": "error", "msg": "Test error", "code": "BAD_REQUEST"}
             event_data = {
                 "event_type": OutgoingEventType.ADD_REACTION,
                 "data": {
@@ -362,15 +464,11 @@ class TestOutgoingEventProcessor:
                     "emoji": "thumbs_up"
                 }
             }
-            instance_mock = MagicMock()
-            instance_mock.standard_to_platform_specific.return_value = "+1"
-
-            with patch.object(EmojiConverter, "_instance", instance_mock):
-                response = await processor.process_event(event_data)
-                assert response["request_completed"] is False
+            response = await processor.process_event(event_data)
+            assert response["request_completed"] is False
 
         @pytest.mark.asyncio
-        async def test_remove_reaction_success(self, processor, zulip_client_mock):
+        async def test_remove_reaction_success(self, processor, api_client, emoji_converter):
             """Test successfully removing a reaction"""
             event_data = {
                 "event_type": OutgoingEventType.REMOVE_REACTION,
@@ -381,60 +479,83 @@ class TestOutgoingEventProcessor:
                 }
             }
 
-            instance_mock = MagicMock()
-            instance_mock.standard_to_platform_specific.return_value = "+1"
-
-            with patch.object(EmojiConverter, "_instance", instance_mock):
-                response = await processor.process_event(event_data)
+            response = await processor.process_event(event_data)
 
-                assert response["request_completed"] is True
-                zulip_client_mock.remove_reaction.assert_called_once_with({
-                    "message_id": 789,
-                    "emoji_name": "+1"
-                })
+            assert response["request_completed"] is True
+            api_client.assert_called_once_with("remove_reaction", {
+                "message_id": 789,
+                "emoji_name": "+1"
+            })
 
         @pytest.mark.asyncio
-        async def test_remove_reaction_missing_required_fields(self, processor):
-            """Test removing a reaction with missing required fields"""
-            # Missing conversation_id
-            response = await processor.process_event({
+        async def test_remove_reaction_api_failure(self, processor, api_client, emoji_converter):
+            """Test removing a reaction when API fails"""
+            api_client.responses["remove_reaction"] = {"result": "error", "msg": "Test error", "code": "BAD_REQUEST"}
+            event_data = {
                 "event_type": OutgoingEventType.REMOVE_REACTION,
-                "data": {"message_id": "789", "emoji": "+1"}
-            })
-            assert response["request_completed"] is False
+                "data": {
+                    "conversation_id": "123_456",
+                    "message_id": "789",
+                    "emoji": "red_heart"
+                }
+            }
+            emoji_converter.standard_to_platform_specific.return_value = "red_heart"
 
-            # Missing message_id
-            response = await processor.process_event({
-                "event_type": OutgoingEventType.REMOVE_REACTION,
-                "data": {"conversation_id": "123_456", "emoji": "+1"}
-            })
+            response = await processor.process_event(event_data)
             assert response["request_completed"] is False
 
-            # Missing emoji
-            response = await processor.process_event({
-                "event_type": OutgoingEventType.REMOVE_REACTION,
-                "data": {"conversation_id": "123_456", "message_id": "789"}
-            })
-            assert response["request_completed"] is False
+        @pytest.mark.asyncio
+        async def test_add_reactions_success(self, processor, api_client, emoji_converter):
+            """Test adding several reactions concurrently"""
+            in_flight = 0
+            max_in_flight = 0
+
+            async def add_reaction(reaction_data):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await _real_sleep(0)
+                in_flight -= 1
+                return {"result": "success"}
+
+            api_client.responses["add_reaction"] = add_reaction
+            event_data = {
+                "event_type": OutgoingEventType.ADD_REACTIONS,
+                "data": {
+                    "conversation_id": "123_456",
+                    "message_id": "789",
+                    "emojis": ["thumbs_up", "red_heart"]
+                }
+            }
+            emoji_converter.standard_to_platform_specific.side_effect = lambda name: name
+
+            response = await processor.process_event(event_data)
+
+            assert response["request_completed"] is True
+            assert len(api_client.calls_to("add_reaction")) == 2
+            assert max_in_flight == 2
+            assert processor.rate_limiter.requests == [("add_reaction", "123_456")] * 2
 
         @pytest.mark.asyncio
-        async def test_remove_reaction_api_failure(self, processor, zulip_client_mock):
-            """Test removing a reaction when API fails"""
-            zulip_client_mock.remove_reaction.return_value = {"result": "error", "msg": "Test error"}
+        async def test_remove_reactions_partial_failure(self, processor, api_client, emoji_converter):
+            """Test that removing several reactions fails if one of them fails"""
+            api_client.responses["remove_reaction"] = [
+                {"result": "success"},
+                {"result": "error", "msg": "Test error", "code": "BAD_REQUEST"}
+            ]
             event_data = {
-                "event_type": OutgoingEventType.REMOVE_REACTION,
+                "event_type": OutgoingEventType.REMOVE_REACTIONS,
                 "data": {
                     "conversation_id": "123_456",
                     "message_id": "789",
-                    "emoji": "red_heart"
+                    "emojis": ["thumbs_up", "red_heart"]
                 }
             }
-            instance_mock = MagicMock()
-            instance_mock.standard_to_platform_specific.return_value = "red_heart"
 
-            with patch.object(EmojiConverter, "_instance", instance_mock):
-                response = await processor.process_event(event_data)
-                assert response["request_completed"] is False
+            response = await processor.process_event(event_data)
+
+            assert response["request_completed"] is False
+            assert len(api_client.calls_to("remove_reaction")) == 2
 
     class TestFetchHistory:
         """Tests for the fetch_history method"""
@@ -488,28 +609,92 @@ class TestOutgoingEventProcessor:
     class TestHelperMethods:
         """Tests for helper methods"""
 
-        def test_check_api_request_success(self, processor):
-            """Test API response checking with success result"""
-            result = {"result": "success"}
-            assert processor._check_api_request_success(result, "test operation") is True
+        @pytest.mark.parametrize("result,expected", [
+            ({"result": "success"}, True),
+            ({"result": "error", "msg": "Test error"}, False),
+            (None, False)
+        ], ids=["success", "failure", "none"])
+        def test_check_api_request(self, processor, result, expected):
+            """Test API response checking"""
+            assert processor._check_api_request_success(result, "test operation") is expected
 
-        def test_check_api_request_failure(self, processor):
-            """Test API response checking with failure result"""
-            result = {"result": "error", "msg": "Test error"}
-            assert processor._check_api_request_success(result, "test operation") is False
+        @pytest.mark.asyncio
+        async def test_call_with_retry_rate_limited(self, processor):
+            """Test that rate limited requests are retried with backoff"""
+            api_call = AsyncMock(side_effect=[
+                {"result": "error", "msg": "API usage exceeded rate limit", "code": "RATE_LIMIT_HIT", "retry-after": 5},
+                {"result": "error", "msg": "Connection reset"},
+                {"result": "success"}
+            ])
+
+            with patch("asyncio.sleep") as sleep_mock:
+                result = await processor._call_with_retry(api_call, {"content": "Hello"})
+
+            assert result == {"result": "success"}
+            assert api_call.call_count == 3
+            assert [call.args[0] for call in sleep_mock.call_args_list] == [5, 2]
+
+        @pytest.mark.asyncio
+        async def test_call_with_retry_gives_up(self, processor):
+            """Test that retries stop after the configured number of attempts"""
+            api_call = AsyncMock(return_value={"result": "error", "msg": "Connection reset"})
 
-        def test_check_api_request_none(self, processor):
-            """Test API response checking with None result"""
-            assert processor._check_api_request_success(None, "test operation") is False
+            with patch("asyncio.sleep") as sleep_mock:
+                result = await processor._call_with_retry(api_call)
+
+            assert result["result"] == "error"
+            assert api_call.call_count == processor.max_request_attempts
+            assert sleep_mock.call_count == processor.max_request_attempts - 1
+
+        @pytest.mark.asyncio
+        async def test_call_with_retry_request_error(self, processor):
+            """Test that request errors reported by Zulip are not retried"""
+            api_call = AsyncMock(return_value={"result": "error", "msg": "Invalid message", "code": "BAD_REQUEST"})
+
+            with patch("asyncio.sleep") as sleep_mock:
+                await processor._call_with_retry(api_call)
+
+            api_call.assert_called_once()
+            sleep_mock.assert_not_called()
+
+        @pytest.mark.asyncio
+        async def test_call_with_retry_not_idempotent(self, processor):
+            """Test that non-idempotent requests are only retried after a rate limit hit"""
+            api_call = AsyncMock(side_effect=[
+                {"result": "error", "msg": "API usage exceeded rate limit", "code": "RATE_LIMIT_HIT"},
+                {"result": "error", "msg": "Connection reset"},
+                {"result": "success"}
+            ])
+
+            with patch("asyncio.sleep") as sleep_mock:
+                result = await processor._call_with_retry(api_call, {"content": "Hello"}, idempotent=False)
+
+            assert result == {"result": "error", "msg": "Connection reset"}
+            assert api_call.call_count == 2
+            assert sleep_mock.call_count == 1
+
+        @pytest.mark.asyncio
+        async def test_send_message_connection_error_not_retried(self, processor, api_client):
+            """Test that a message is not sent twice after a connection error"""
+            api_client.responses["send_message"] = {"result": "error", "msg": "Connection reset"}
+            event_data = {
+                "event_type": OutgoingEventType.SEND_MESSAGE,
+                "data": {"conversation_id": "123_456", "text": "Hello"}
+            }
+
+            response = await processor.process_event(event_data)
+
+            assert response["request_completed"] is False
+            assert len(api_client.calls_to("send_message")) == 1
 
         def test_split_long_message_short(self, processor):
             """Test splitting a message that's already short enough"""
             text = "This is a short message."
-            assert processor._split_long_message(text) == [text]
+            assert list(processor._split_long_message(text)) == [text]
 
-        def test_split_long_message_long(self, processor):
+        def test_split_long_message_long(self, processor, long_text):
             """Test splitting a long message at sentence boundaries"""
-            result = processor._split_long_message("First sentence. Second sentence. " * 100)
+            result = list(processor._split_long_message(long_text))
 
             assert len(result) > 1
             assert (result[-1].endswith(". ") or result[-1].endswith("."))
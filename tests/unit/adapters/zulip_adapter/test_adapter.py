@@ -115,6 +115,29 @@ class TestAdapter:
                     "disconnect", {"adapter_type": adapter.adapter_type}
                 )
 
+    class TestStartStop:
+        """Tests for the stopped event"""
+
+        @pytest.mark.asyncio
+        async def test_stop_sets_stopped(self, adapter):
+            """Test that stopping the adapter wakes up everyone waiting for it"""
+            adapter.running = True
+            adapter._teardown_client = AsyncMock()
+
+            await adapter.stop()
+
+            assert adapter.stopped.is_set()
+
+        @pytest.mark.asyncio
+        async def test_failed_start_sets_stopped(self, adapter):
+            """Test that an adapter that failed to connect is reported as stopped"""
+            adapter._setup_client = AsyncMock()
+
+            await adapter.start()
+
+            assert adapter.running is False
+            assert adapter.stopped.is_set()
+
     class TestEventProcessing:
         """Tests for event processing"""
 
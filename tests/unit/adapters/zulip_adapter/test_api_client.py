@@ -0,0 +1,170 @@
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.adapters.zulip_adapter.api_client import ApiClient
+
+class TestApiClient:
+    """Tests for the asynchronous Zulip ApiClient"""
+
+    @pytest.fixture
+    def response_mock(self):
+        """Create a mocked HTTP response"""
+        response = MagicMock()
+        response.headers = {}
+        response.read = AsyncMock(return_value=b'{"result": "success", "id": 123}')
+        return response
+
+    @pytest.fixture
+    def session_mock(self, response_mock):
+        """Create a mocked aiohttp session"""
+        request_context = MagicMock()
+        request_context.__aenter__ = AsyncMock(return_value=response_mock)
+        request_context.__aexit__ = AsyncMock(return_value=None)
+
+        session = MagicMock()
+        session.closed = False
+        session.close = AsyncMock()
+        session.request = MagicMock(return_value=request_context)
+        return session
+
+    @pytest.fixture
+    def zulip_client_mock(self):
+        """Create a mocked Zulip client with its site and credentials"""
+        zulip_client_mock = MagicMock()
+        zulip_client_mock.base_url = "https://zulip.example.com/api/"
+        zulip_client_mock.email = "bot@example.com"
+        zulip_client_mock.api_key = "test_api_key"
+        return zulip_client_mock
+
+    @pytest.fixture
+    def api_client(self, zulip_config, zulip_client_mock, session_mock):
+        """Create an ApiClient with a mocked session"""
+        api_client = ApiClient(zulip_config, zulip_client_mock)
+        api_client._session = session_mock
+        api_client.rate_limiter = MagicMock()
+        return api_client
+
+    @pytest.mark.asyncio
+    async def test_send_message(self, api_client, session_mock):
+        """Test that messages are posted with JSON-encoded recipients"""
+        result = await api_client.send_message({
+            "type": "private",
+            "to": ["user1@example.com", "user2@example.com"],
+            "content": "Hello",
+            "subject": None
+        })
+
+        assert result == {"result": "success", "id": 123}
+        session_mock.request.assert_called_once()
+
+        method, url = session_mock.request.call_args[0]
+        data = session_mock.request.call_args[1]["data"]
+        assert method == "POST"
+        assert url == f"{api_client.base_url}/messages"
+        assert data.keys() == {"type", "to", "content"}
+        assert data["type"] == "private"
+        assert json.loads(data["to"]) == ["user1@example.com", "user2@example.com"]
+        assert data["content"] == "Hello"
+
+    @pytest.mark.asyncio
+    async def test_send_message_without_orjson(self, api_client, session_mock):
+        """Test that requests and responses fall back to json when orjson is not installed"""
+        with patch("src.adapters.zulip_adapter.api_client.orjson", None):
+            result = await api_client.send_message({
+                "type": "private",
+                "to": ["user1@example.com"],
+                "content": "Hello"
+            })
+
+        assert result == {"result": "success", "id": 123}
+        assert session_mock.request.call_args[1]["data"]["to"] == json.dumps(["user1@example.com"])
+
+    @pytest.mark.asyncio
+    async def test_update_message(self, api_client, session_mock):
+        """Test that the message id is moved into the endpoint path"""
+        await api_client.update_message({"message_id": 456, "content": "Edited"})
+
+        session_mock.request.assert_called_once_with(
+            "PATCH", f"{api_client.base_url}/messages/456", data={"content": "Edited"}
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_events(self, api_client, session_mock):
+        """Test that the event queue is long-polled with query parameters"""
+        await api_client.get_events("test_queue_id", 12345)
+
+        session_mock.request.assert_called_once_with(
+            "GET",
+            f"{api_client.base_url}/events",
+            params={"queue_id": "test_queue_id", "last_event_id": "12345", "dont_block": "false"}
+        )
+
+    @pytest.mark.asyncio
+    async def test_remove_reaction(self, api_client, session_mock):
+        """Test removing a reaction"""
+        await api_client.remove_reaction({"message_id": 456, "emoji_name": "+1"})
+
+        session_mock.request.assert_called_once_with(
+            "DELETE", f"{api_client.base_url}/messages/456/reactions", data={"emoji_name": "+1"}
+        )
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_headers_update_rate_limiter(self, api_client, response_mock):
+        """Test that the rate limit budget reported by Zulip reaches the rate limiter"""
+        response_mock.headers = {"X-RateLimit-Remaining": "59", "X-RateLimit-Reset": "1700000060.5"}
+
+        await api_client.send_message({"type": "stream", "to": "general", "content": "Hi"})
+
+        api_client.rate_limiter.update_server_limits.assert_called_once_with(59, 1700000060.5)
+
+    @pytest.mark.asyncio
+    async def test_call_endpoint_error(self, api_client, session_mock):
+        """Test that request errors are returned as error responses"""
+        session_mock.request.side_effect = Exception("Connection refused")
+
+        result = await api_client.call_endpoint("messages/456", method="DELETE")
+
+        assert result == {"result": "error", "msg": "Connection refused"}
+
+    @pytest.mark.asyncio
+    async def test_session_is_reused(self, zulip_config, zulip_client_mock):
+        """Test that one session is shared between requests and closed on close"""
+        api_client = ApiClient(zulip_config, zulip_client_mock)
+
+        with patch("aiohttp.ClientSession") as session_class_mock:
+            session_class_mock.return_value.closed = False
+            session_class_mock.return_value.close = AsyncMock()
+
+            first = api_client._get_session()
+            second = api_client._get_session()
+            await api_client.close()
+
+        assert first is second
+        session_class_mock.assert_called_once()
+        first.close.assert_called_once()
+        assert api_client._session is None
+
+    def test_session_keeps_long_polls_alive(self, zulip_config, zulip_client_mock):
+        """Test that the session has no total timeout and keeps idle connections open"""
+        api_client = ApiClient(zulip_config, zulip_client_mock)
+
+        with patch("aiohttp.ClientSession") as session_class_mock, \
+             patch("aiohttp.TCPConnector") as connector_class_mock:
+            api_client._get_session()
+
+        timeout = session_class_mock.call_args[1]["timeout"]
+        assert timeout.total is None
+        assert timeout.sock_read == ApiClient.SOCK_READ_TIMEOUT
+        assert connector_class_mock.call_args[1]["keepalive_timeout"] == ApiClient.KEEPALIVE_TIMEOUT
+
+    def test_site_and_credentials_come_from_zulip_client(self, zulip_config, zulip_client_mock):
+        """Test that requests go to the site of the Zulip client and authenticate as its user"""
+        api_client = ApiClient(zulip_config, zulip_client_mock)
+
+        with patch("aiohttp.ClientSession") as session_class_mock, patch("aiohttp.TCPConnector"):
+            api_client._get_session()
+
+        assert api_client.base_url == "https://zulip.example.com/api/v1"
+        auth = session_class_mock.call_args[1]["auth"]
+        assert (auth.login, auth.password) == ("bot@example.com", "test_api_key")
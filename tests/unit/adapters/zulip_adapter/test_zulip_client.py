@@ -35,11 +35,19 @@ class TestZulipClient:
         return rate_limiter
 
     @pytest.fixture
-    def zulip_client(self, zulip_config, zulip_mock, rate_limiter_mock):
+    def api_client_mock(self):
+        """Create a mocked asynchronous API client"""
+        api_client = AsyncMock()
+        api_client.get_events = AsyncMock(return_value={"events": []})
+        return api_client
+
+    @pytest.fixture
+    def zulip_client(self, zulip_config, zulip_mock, rate_limiter_mock, api_client_mock):
         """Create a ZulipClient with mocked dependencies"""
         client = Client(zulip_config, AsyncMock())
         client.client = zulip_mock
         client.rate_limiter = rate_limiter_mock
+        client.api_client = api_client_mock
         yield client
 
     class TestInitialization:
@@ -105,20 +113,127 @@ class TestZulipClient:
                 zulip_mock.register.assert_called_once()
                 assert zulip_client.running is False
 
+    class TestPolling:
+        """Tests for the event polling loop"""
+
+        @pytest.mark.asyncio
+        async def test_polling_loop_queues_events(self, zulip_client, api_client_mock):
+            """Test that polled events are queued in order and advance the last event id"""
+            events = [
+                {"id": 12346, "type": "message", "content": "test message"},
+                {"id": 12347, "type": "reaction", "emoji_name": "heart"}
+            ]
+
+            async def get_events(queue_id, last_event_id):
+                zulip_client.running = False
+                return {"result": "success", "events": events}
+
+            api_client_mock.get_events.side_effect = get_events
+            zulip_client.running = True
+            zulip_client.queue_id = "test_queue_id"
+            zulip_client.last_event_id = 12345
+
+            await asyncio.wait_for(zulip_client._polling_loop(), timeout=5)
+
+            api_client_mock.get_events.assert_called_once_with("test_queue_id", 12345)
+            assert [zulip_client._events.get_nowait() for _ in events] == events
+            assert zulip_client._events.empty()
+            assert zulip_client.last_event_id == 12347
+            zulip_client.process_event.assert_not_called()
+
+        @pytest.mark.asyncio
+        async def test_polling_loop_backs_off_on_error(self, zulip_client, api_client_mock):
+            """Test that failed polls are retried with a growing delay that resets on success"""
+            responses = iter([
+                Exception("Connection reset"),
+                {"result": "error", "msg": "Server error"},
+                {"result": "success", "events": []}
+            ])
+
+            async def get_events(queue_id, last_event_id):
+                response = next(responses)
+                if isinstance(response, Exception):
+                    raise response
+                zulip_client.running = "events" not in response
+                return response
+
+            api_client_mock.get_events.side_effect = get_events
+            zulip_client.running = True
+
+            with patch("asyncio.sleep") as sleep_mock, patch("random.random", return_value=0.5):
+                await asyncio.wait_for(zulip_client._polling_loop(), timeout=5)
+
+            assert [call.args[0] for call in sleep_mock.call_args_list] == [0.2, 0.4]
+            assert zulip_client._polling_backoff == Client.MIN_POLLING_BACKOFF
+
+        @pytest.mark.asyncio
+        async def test_processing_loop_processes_events_in_order(self, zulip_client):
+            """Test that queued events are processed in order and a failing event does not stop processing"""
+            events = [{"id": 12346, "type": "message"}, {"id": 12347, "type": "reaction"}]
+            processed = asyncio.Event()
+
+            async def process_event(event):
+                if event is events[0]:
+                    raise Exception("Test error")
+                processed.set()
+
+            zulip_client.process_event.side_effect = process_event
+            for event in events:
+                zulip_client._events.put_nowait(event)
+
+            processing_task = asyncio.create_task(zulip_client._processing_loop())
+            await asyncio.wait_for(processed.wait(), timeout=5)
+            processing_task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await processing_task
+
+            assert zulip_client.process_event.call_args_list == [call(event) for event in events]
+
+        @pytest.mark.asyncio
+        async def test_processing_loop_yields_between_events(self, zulip_client):
+            """Test that other tasks run between events whose processing never awaits"""
+            order = []
+            processed = asyncio.Event()
+
+            async def other_task():
+                order.append("other")
+
+            async def process_event(event):
+                order.append(event["id"])
+                if event["id"] == 1:
+                    asyncio.create_task(other_task())
+                else:
+                    processed.set()
+
+            zulip_client.process_event.side_effect = process_event
+            zulip_client._events.put_nowait({"id": 1})
+            zulip_client._events.put_nowait({"id": 2})
+
+            processing_task = asyncio.create_task(zulip_client._processing_loop())
+            await asyncio.wait_for(processed.wait(), timeout=5)
+            processing_task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await processing_task
+
+            assert order == [1, "other", 2]
+
     class TestDisconnection:
         """Tests for disconnecting from Zulip"""
 
         @pytest.mark.asyncio
-        @pytest.mark.filterwarnings("ignore::RuntimeWarning")
         async def test_disconnect(self, zulip_client, zulip_mock):
-            """Test disconnecting with an active polling task"""
+            """Test disconnecting cancels and awaits the polling task and deletes the queue"""
             zulip_client.running = True
             zulip_client.queue_id = "test_queue_id"
-            zulip_client._polling_task = AsyncMock()
+            polling_task = asyncio.create_task(asyncio.Event().wait())
+            zulip_client._polling_task = polling_task
 
             with patch.object(zulip_client, "client", zulip_mock):
                 await zulip_client.disconnect()
 
+                assert polling_task.cancelled()
+                zulip_mock.delete_queue.assert_called_once_with("test_queue_id")
                 assert zulip_client.running is False
                 assert zulip_client.queue_id is None
                 assert zulip_client.last_event_id is None
+                zulip_client.api_client.close.assert_called_once()
@@ -85,6 +85,18 @@ class TestAttachmentCache:
 
             assert cached_attachment.metadata_path == expected_path
 
+        def test_cache_to_dict(self, cached_attachment, sample_attachment_info):
+            """Test that the API dictionary has the attachment fields but no content"""
+            assert cached_attachment.cache_to_dict() == {
+                "attachment_id": sample_attachment_info["attachment_id"],
+                "filename": sample_attachment_info["filename"],
+                "content_type": sample_attachment_info["content_type"],
+                "content": None,
+                "size": sample_attachment_info["size"],
+                "processable": sample_attachment_info["processable"],
+                "url": sample_attachment_info["url"]
+            }
+
     class TestUploadExistingAttachments:
         """Tests for the _upload_existing_attachments method"""
 
@@ -186,6 +198,21 @@ class TestAttachmentCache:
             assert len(result.conversations) == 1
             assert "conv123" in result.conversations
 
+        @pytest.mark.asyncio
+        async def test_add_attachments(self, attachment_cache, sample_attachment_info):
+            """Test adding several attachments at once"""
+            other_attachment_info = {**sample_attachment_info, "attachment_id": "other123"}
+
+            result = await attachment_cache.add_attachments(
+                "conv123", [sample_attachment_info, other_attachment_info]
+            )
+
+            assert [attachment.attachment_id for attachment in result] == [
+                sample_attachment_info["attachment_id"], "other123"
+            ]
+            assert all("conv123" in attachment.conversations for attachment in result)
+            assert len(attachment_cache.attachments) == 2
+
     class TestRemoveAttachment:
         """Tests for the remove_attachment method"""
 
@@ -268,3 +295,38 @@ class TestAttachmentCache:
                 remove_mock.assert_any_call("test2")
                 remove_mock.assert_any_call("test3")
                 remove_mock.assert_any_call("test4")
+
+        @pytest.mark.asyncio
+        async def test_enforce_total_limit_keeps_visited(self, attachment_cache):
+            """Test that attachments read since the last pass get a second chance"""
+            attachment_cache.max_total_attachments = 2
+
+            for i in range(3):
+                info = {
+                    "attachment_id": f"test{i}",
+                    "attachment_type": "photo",
+                    "filename": f"test{i}.jpg",
+                    "size": 12345,
+                    "content_type": "image/jpeg",
+                    "content": None,
+                    "url": f"https://example.com/test{i}.jpg",
+                    "created_at": datetime.now() - timedelta(minutes=i),
+                    "processable": True
+                }
+                await attachment_cache.add_attachment(f"conv{i}", info)
+            attachment_cache.get_attachment("test2")
+
+            with patch.object(attachment_cache, "remove_attachment") as remove_mock:
+                await attachment_cache._enforce_total_limit()
+
+                remove_mock.assert_called_once_with("test1")
+
+        def test_peek_attachment_does_not_mark_visited(self, attachment_cache, sample_attachment_info):
+            """Test that peeking at an attachment is not counted as a read"""
+            attachment_cache._add_attachment("conv1", sample_attachment_info)
+
+            assert attachment_cache.peek_attachment(sample_attachment_info["attachment_id"]).visited is False
+            assert attachment_cache.get_attachment(sample_attachment_info["attachment_id"]).visited is True
+
+            attachment_cache._clear_visited()
+            assert attachment_cache.attachments[sample_attachment_info["attachment_id"]].visited is False
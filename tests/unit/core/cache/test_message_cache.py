@@ -114,6 +114,20 @@ class TestMessageCache:
                 "non_existent_conv", "non_existent_msg"
             ) is False
 
+        @pytest.mark.asyncio
+        async def test_get_messages_by_ids(self, message_cache, sample_messages_info):
+            """Test fetching several messages in one call skips unknown ids"""
+            for message_info in sample_messages_info:
+                await message_cache.add_message(message_info)
+
+            messages = await message_cache.get_messages_by_ids(
+                "conv_1", ["msg_2", "missing", "msg_0"]
+            )
+
+            assert list(messages.keys()) == ["msg_2", "msg_0"]
+            assert messages["msg_2"].text == "Message 2"
+            assert await message_cache.get_messages_by_ids("unknown_conv", ["msg_0"]) == {}
+
     class TestConversationMigrationFunctionality:
         """Tests for conversation migration functionality"""
 
@@ -173,3 +187,75 @@ class TestMessageCache:
             # Verify the newest messages are kept (lowest indices in our sample data)
             assert "msg_0" in message_cache.messages["conv_1"]
             assert "msg_conv2_0" in message_cache.messages["conv_2"]
+
+        @pytest.mark.asyncio
+        async def test_total_limit_keeps_visited_messages(self, message_cache, sample_messages_info):
+            """Test that messages read since the last pass get a second chance"""
+            message_cache.max_total_messages = 7
+
+            for msg in sample_messages_info:
+                await message_cache.add_message(msg)
+            await message_cache.get_message_by_id("conv_1", "msg_9")
+
+            await message_cache._enforce_total_limit()
+
+            assert sum(len(msgs) for msgs in message_cache.messages.values()) == 7
+            assert "msg_9" in message_cache.messages["conv_1"]
+            assert "msg_0" in message_cache.messages["conv_1"]
+
+        @pytest.mark.asyncio
+        async def test_maintenance_keeps_visited_messages_in_total_limit(self,
+                                                                          message_cache,
+                                                                          sample_messages_info):
+            """Test that a visited message keeps its second chance until the pass ends"""
+            message_cache.max_messages_per_conversation = 10
+            message_cache.max_total_messages = 7
+
+            for msg in sample_messages_info:
+                await message_cache.add_message(msg)
+            await message_cache.get_message_by_id("conv_1", "msg_9")
+
+            await message_cache._run_maintenance()
+
+            assert sum(len(msgs) for msgs in message_cache.messages.values()) == 7
+            assert "msg_9" in message_cache.messages["conv_1"]
+            assert not any(
+                msg.visited for msgs in message_cache.messages.values() for msg in msgs.values()
+            )
+
+        @pytest.mark.asyncio
+        async def test_conversation_limit_keeps_newest_messages(self, message_cache, sample_messages_info):
+            """Test that reading an old message does not keep it over newer ones of its conversation"""
+            message_cache.max_messages_per_conversation = 5
+
+            for msg in sample_messages_info:
+                await message_cache.add_message(msg)
+            await message_cache.get_message_by_id("conv_1", "msg_9")
+
+            await message_cache._run_maintenance()
+
+            assert set(message_cache.messages["conv_1"]) == {f"msg_{i}" for i in range(5)}
+
+        @pytest.mark.asyncio
+        async def test_evicted_messages_are_reported(self, message_cache, sample_messages_info):
+            """Test that every message dropped by maintenance is passed to on_evict"""
+            message_cache.max_messages_per_conversation = 8
+            message_cache.max_total_messages = 7
+            evicted = []
+            message_cache.on_evict = lambda message: evicted.append(message.message_id)
+
+            for msg in sample_messages_info:
+                await message_cache.add_message(msg)
+            await message_cache._run_maintenance()
+
+            remaining = {msg_id for msgs in message_cache.messages.values() for msg_id in msgs}
+            assert len(evicted) == len(sample_messages_info) - 7
+            assert set(evicted) == {msg["message_id"] for msg in sample_messages_info} - remaining
+
+        @pytest.mark.asyncio
+        async def test_readding_message_does_not_mark_visited(self, message_cache, sample_message_info):
+            """Test that adding an already cached message is not counted as a read"""
+            await message_cache.add_message(sample_message_info)
+            message = await message_cache.add_message(sample_message_info)
+
+            assert message.visited is False
@@ -7,6 +7,7 @@ from src.core.events.models.outgoing_events import (
     EditMessageData,
     DeleteMessageData,
     ReactionData,
+    ReactionsData,
     FetchHistoryData,
     FetchAttachmentData,
     PinStatusData,
@@ -15,6 +16,8 @@ from src.core.events.models.outgoing_events import (
     DeleteMessageEvent,
     AddReactionEvent,
     RemoveReactionEvent,
+    AddReactionsEvent,
+    RemoveReactionsEvent,
     FetchHistoryEvent,
     FetchAttachmentEvent,
     PinMessageEvent,
@@ -223,6 +226,28 @@ class TestOutgoingEventBuilder:
         assert event.data.message_id == sample_remove_reaction_data["data"]["message_id"]
         assert event.data.emoji == sample_remove_reaction_data["data"]["emoji"]
 
+    def test_build_add_reactions(self, event_builder):
+        """Test building an add_reactions event."""
+        event = event_builder.build({
+            "event_type": "add_reactions",
+            "data": {"conversation_id": "conv_123", "message_id": "msg_456", "emojis": ["+1", "heart"]}
+        })
+
+        assert isinstance(event, AddReactionsEvent)
+        assert isinstance(event.data, ReactionsData)
+        assert event.data.emojis == ["+1", "heart"]
+
+    def test_build_remove_reactions(self, event_builder):
+        """Test building a remove_reactions event."""
+        event = event_builder.build({
+            "event_type": "remove_reactions",
+            "data": {"conversation_id": "conv_123", "message_id": "msg_456", "emojis": ["+1"]}
+        })
+
+        assert isinstance(event, RemoveReactionsEvent)
+        assert event.data.message_id == "msg_456"
+        assert event.data.emojis == ["+1"]
+
     def test_build_fetch_history(self, event_builder, sample_fetch_history_data):
         """Test building a fetch_history event."""
         event = event_builder.build(sample_fetch_history_data)
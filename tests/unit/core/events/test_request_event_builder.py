@@ -276,3 +276,10 @@ class TestRequestEventBuilder:
         assert "data" in event_dict
         assert "message_ids" in event_dict["data"]
         assert event_dict["data"]["message_ids"] == message_ids
+
+    def test_build_status(self, request_event_builder):
+        """Test that a data-less status event matches the validated model dump"""
+        assert request_event_builder.build_status("req_123", "internal_456") == \
+            request_event_builder.build("req_123", "internal_456").model_dump()
+        assert request_event_builder.build_status("req_123") == \
+            request_event_builder.build("req_123").model_dump()
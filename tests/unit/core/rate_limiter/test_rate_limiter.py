@@ -117,6 +117,30 @@ class TestRateLimiter:
             expected_wait = 60 / rate_limiter.message_rpm
             assert abs(wait_time - expected_wait) < 0.1
 
+        @pytest.mark.asyncio
+        async def test_get_wait_time_spreads_server_budget(self, rate_limiter):
+            """Test that the server-reported budget is spread over its window"""
+            rate_limiter.global_rpm = 6000
+            rate_limiter.last_global_request = time.time()
+            rate_limiter.update_server_limits(4, time.time() + 20)
+            wait_time = await rate_limiter.get_wait_time("general")
+
+            assert abs(wait_time - 5) < 0.1
+
+        @pytest.mark.asyncio
+        async def test_get_wait_time_server_budget_exhausted(self, rate_limiter):
+            """Test waiting for the server window to reset when no requests are left"""
+            rate_limiter.update_server_limits(0, time.time() + 30)
+            wait_time = await rate_limiter.get_wait_time("general")
+
+            assert abs(wait_time - 30) < 0.1
+
+        @pytest.mark.asyncio
+        async def test_get_wait_time_ignores_expired_server_window(self, rate_limiter):
+            """Test that a server window in the past does not add waiting"""
+            rate_limiter.update_server_limits(0, time.time() - 1)
+            assert await rate_limiter.get_wait_time("general") == 0
+
         @pytest.mark.asyncio
         async def test_get_wait_time_handles_error(self, rate_limiter):
             """Test that get_wait_time handles errors gracefully"""
@@ -195,3 +219,56 @@ class TestRateLimiter:
 
             elapsed = time.time() - start_time
             assert elapsed >= 0.9  # Should wait about 1 second (60/60)
+
+        @pytest.mark.asyncio
+        async def test_concurrent_requests_are_paced(self, rate_limiter):
+            """Test that concurrent callers are spaced out instead of firing together"""
+            rate_limiter.global_rpm = 60  # 1 per second
+            clock = [1000.0]
+            fired = []
+            real_sleep = asyncio.sleep
+
+            async def fake_sleep(seconds):
+                wake_time = clock[0] + seconds
+                await real_sleep(0)
+                clock[0] = max(clock[0], wake_time)
+
+            async def request():
+                await rate_limiter.limit_request("general")
+                fired.append(clock[0])
+
+            with patch("time.time", side_effect=lambda: clock[0]), \
+                 patch("asyncio.sleep", side_effect=fake_sleep):
+                await asyncio.gather(*(request() for _ in range(3)))
+
+            assert fired == pytest.approx([1000.0, 1001.0, 1002.0])
+
+        @pytest.mark.asyncio
+        async def test_conversation_wait_does_not_delay_other_conversations(self, rate_limiter):
+            """Test that a request waiting for its conversation does not hold back other conversations"""
+            rate_limiter.global_rpm = 60  # 1 per second
+            rate_limiter.per_conversation_rpm = 5  # 1 per 12 seconds
+            waits = {}
+            conversation_a_released = asyncio.Event()
+
+            async def fake_sleep(seconds):
+                name = asyncio.current_task().get_name()
+                waits[name] = seconds
+                if name == "a_2":
+                    await conversation_a_released.wait()
+
+            async def request(name, conversation_id):
+                asyncio.current_task().set_name(name)
+                await rate_limiter.limit_request("general", conversation_id)
+
+            with patch("time.time", return_value=1000.0), \
+                 patch("asyncio.sleep", side_effect=fake_sleep):
+                await request("a_1", "conv_a")
+                blocked = asyncio.create_task(request("a_2", "conv_a"))
+                await asyncio.wait_for(request("b_1", "conv_b"), timeout=5)
+
+                assert not blocked.done()
+                conversation_a_released.set()
+                await blocked
+
+            assert waits == {"a_2": pytest.approx(12.0), "b_1": pytest.approx(2.0)}
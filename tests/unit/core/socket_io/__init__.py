@@ -0,0 +1,9 @@
+"""
+Unit tests for the Socket.IO component.
+
+This package contains unit tests for the core Socket.IO component including:
+- SocketIOServer: For queueing LLM requests and dispatching them to the adapter
+"""
+
+__author__ = "Your Name"
+__version__ = "0.1.0"
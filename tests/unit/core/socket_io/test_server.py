@@ -0,0 +1,337 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.core.socket_io.server import SocketIOServer
+
+def emitted(server, event_type):
+    """Get the request ids emitted with the given event type"""
+    return [
+        call.args[1]["request_id"]
+        for call in server.sio.emit.call_args_list if call.args[0] == event_type
+    ]
+
+async def queue(server, request_id, conversation_id="conv_1", **extra):
+    """Queue a send_message request"""
+    await server._queue_event("sid_1", {
+        "request_id": request_id,
+        "event_type": "send_message",
+        "data": {"conversation_id": conversation_id, "text": request_id},
+        **extra
+    })
+
+class TestSocketIOServer:
+    """Tests for the SocketIOServer class"""
+
+    @pytest.fixture
+    def config_mock(self):
+        """Create a mocked config"""
+        config = MagicMock()
+        config.get_setting.side_effect = lambda section, key, default=None: {
+            "adapter": {"adapter_type": "test_adapter"}
+        }.get(section, {}).get(key, default)
+        return config
+
+    @pytest.fixture
+    def adapter_mock(self):
+        """Create a mocked adapter"""
+        adapter = MagicMock()
+        adapter.process_outgoing_event = AsyncMock(
+            return_value={"request_completed": True, "message_ids": ["1"]}
+        )
+        return adapter
+
+    @pytest.fixture
+    def server(self, config_mock, adapter_mock):
+        """Create a server with a mocked emit and every client connected"""
+        server = SocketIOServer(config_mock)
+        server.sio.emit = AsyncMock()
+        server._has_clients = MagicMock(return_value=True)
+        server.set_adapter(adapter_mock)
+        return server
+
+    @pytest.fixture
+    async def processing_server(self, server):
+        """Run the event queue processor of the server for the test"""
+        server.is_processing = True
+        server.processing_task = asyncio.create_task(server._process_event_queue())
+        yield server
+        await server.stop()
+
+    class TestEventDispatch:
+        """Tests for dispatching queued events to the adapter"""
+
+        @pytest.mark.asyncio
+        async def test_conversation_order_is_kept(self, processing_server, adapter_mock):
+            """Test that events of one conversation wait for each other while others overlap"""
+            server = processing_server
+            calls = []
+            release_first = asyncio.Event()
+
+            async def process(data):
+                text = data["data"]["text"]
+                calls.append(("start", text))
+                if text == "req_1":
+                    await release_first.wait()
+                calls.append(("end", text))
+                return {"request_completed": True}
+
+            adapter_mock.process_outgoing_event.side_effect = process
+            server.set_adapter(adapter_mock)
+
+            await queue(server, "req_1", "conv_1")
+            await queue(server, "req_2", "conv_1")
+            await queue(server, "req_3", "conv_2")
+
+            while ("end", "req_3") not in calls:
+                await asyncio.sleep(0)
+            assert ("start", "req_2") not in calls
+
+            release_first.set()
+            await asyncio.wait_for(server.event_queue.join(), timeout=5)
+
+            assert calls.index(("end", "req_1")) < calls.index(("start", "req_2"))
+            assert emitted(server, "request_success") == ["req_3", "req_1", "req_2"]
+            assert server._conversation_backlogs == {}
+            assert server._backlogged_events == 0
+            assert server._inflight_tasks == set()
+
+        @pytest.mark.asyncio
+        async def test_inflight_events_are_bounded(self, config_mock, adapter_mock):
+            """Test that no more than MAX_INFLIGHT_EVENTS events reach the adapter at once"""
+            with patch.object(SocketIOServer, "MAX_INFLIGHT_EVENTS", 2):
+                server = SocketIOServer(config_mock)
+            server.sio.emit = AsyncMock()
+            server._has_clients = MagicMock(return_value=True)
+
+            running = 0
+            most_running = 0
+            release = asyncio.Event()
+
+            async def process(data):
+                nonlocal running, most_running
+                running += 1
+                most_running = max(most_running, running)
+                await release.wait()
+                running -= 1
+                return {"request_completed": True}
+
+            adapter_mock.process_outgoing_event.side_effect = process
+            server.set_adapter(adapter_mock)
+            server.is_processing = True
+            server.processing_task = asyncio.create_task(server._process_event_queue())
+
+            for i in range(5):
+                await queue(server, f"req_{i}", f"conv_{i}")
+            for _ in range(10):
+                await asyncio.sleep(0)
+
+            assert most_running == 2
+            release.set()
+            await asyncio.wait_for(server.event_queue.join(), timeout=5)
+            assert most_running == 2
+            assert server._inflight._value == 2
+
+            await server.stop()
+
+        @pytest.mark.asyncio
+        async def test_burst_in_one_conversation_does_not_delay_others(self, config_mock, adapter_mock):
+            """Test that queued events of a busy conversation do not take the slots of other conversations"""
+            with patch.object(SocketIOServer, "MAX_INFLIGHT_EVENTS", 2):
+                server = SocketIOServer(config_mock)
+            server.sio.emit = AsyncMock()
+            server._has_clients = MagicMock(return_value=True)
+
+            release = asyncio.Event()
+            done = []
+
+            async def process(data):
+                if data["data"]["conversation_id"] == "conv_1":
+                    await release.wait()
+                done.append(data["data"]["text"])
+                return {"request_completed": True}
+
+            adapter_mock.process_outgoing_event.side_effect = process
+            server.set_adapter(adapter_mock)
+            server.is_processing = True
+            server.processing_task = asyncio.create_task(server._process_event_queue())
+
+            for i in range(5):
+                await queue(server, f"req_{i}", "conv_1")
+            await queue(server, "req_conv_2", "conv_2")
+
+            for _ in range(20):
+                await asyncio.sleep(0)
+            assert done == ["req_conv_2"]
+
+            release.set()
+            await asyncio.wait_for(server.event_queue.join(), timeout=5)
+            assert done == ["req_conv_2"] + [f"req_{i}" for i in range(5)]
+
+            await server.stop()
+
+        @pytest.mark.asyncio
+        async def test_stop_settles_dequeued_events(self, server, adapter_mock):
+            """Test that events taken from the queue are marked done when the server stops"""
+            started = asyncio.Event()
+
+            async def process(data):
+                started.set()
+                await asyncio.Event().wait()
+
+            adapter_mock.process_outgoing_event.side_effect = process
+            server.set_adapter(adapter_mock)
+            server.is_processing = True
+            server.processing_task = asyncio.create_task(server._process_event_queue())
+
+            for i in range(3):
+                await queue(server, f"req_{i}")
+            await asyncio.wait_for(started.wait(), timeout=5)
+            await server.stop()
+
+            await asyncio.wait_for(server.event_queue.join(), timeout=5)
+            assert server._conversation_backlogs == {}
+            assert server._backlogged_events == 0
+            assert server._inflight._value == SocketIOServer.MAX_INFLIGHT_EVENTS
+
+        @pytest.mark.asyncio
+        async def test_failed_event_is_reported(self, processing_server, adapter_mock):
+            """Test that an event whose processing raises is failed and frees its slot"""
+            server = processing_server
+            adapter_mock.process_outgoing_event.side_effect = Exception("Adapter error")
+
+            await queue(server, "req_1", internal_request_id="internal_1")
+            await asyncio.wait_for(server.event_queue.join(), timeout=5)
+
+            failed = [
+                call.args[1] for call in server.sio.emit.call_args_list
+                if call.args[0] == "request_failed"
+            ]
+            assert [event["internal_request_id"] for event in failed] == ["internal_1"]
+            assert "req_1" not in server.request_map
+            assert server._inflight._value == SocketIOServer.MAX_INFLIGHT_EVENTS
+
+        @pytest.mark.asyncio
+        async def test_malformed_data_does_not_leak_a_slot(self, processing_server, adapter_mock):
+            """Test that an event without a data object is still processed and answered"""
+            server = processing_server
+
+            await server._queue_event("sid_1", {"request_id": "bad", "event_type": "send_message", "data": None})
+            await queue(server, "req_1")
+            await asyncio.wait_for(server.event_queue.join(), timeout=5)
+
+            assert emitted(server, "request_success") == ["bad", "req_1"]
+            assert server.request_map == {}
+            assert server._inflight._value == SocketIOServer.MAX_INFLIGHT_EVENTS
+
+        @pytest.mark.asyncio
+        async def test_stop_cancels_inflight_events(self, server, adapter_mock):
+            """Test that stopping the server cancels events still being processed"""
+            started = asyncio.Event()
+
+            async def process(data):
+                started.set()
+                await asyncio.Event().wait()
+
+            adapter_mock.process_outgoing_event.side_effect = process
+            server.set_adapter(adapter_mock)
+            server.is_processing = True
+            server.processing_task = asyncio.create_task(server._process_event_queue())
+
+            await queue(server, "req_1")
+            await asyncio.wait_for(started.wait(), timeout=5)
+            tasks = set(server._inflight_tasks)
+
+            await server.stop()
+
+            assert tasks and all(task.cancelled() for task in tasks)
+            assert server._inflight_tasks == set()
+            assert server.processing_task.done()
+
+    class TestRequestMap:
+        """Tests for tracking pending requests"""
+
+        @pytest.mark.asyncio
+        async def test_disconnect_keeps_queued_requests(self, processing_server, adapter_mock):
+            """Test that requests acknowledged as queued are still sent after their client leaves"""
+            server = processing_server
+            release = asyncio.Event()
+
+            async def process(data):
+                await release.wait()
+                return {"request_completed": True}
+
+            adapter_mock.process_outgoing_event.side_effect = process
+            server.set_adapter(adapter_mock)
+
+            await queue(server, "req_1")
+            await queue(server, "req_2")
+            await server.sio.handlers["/"]["disconnect"]("sid_1")
+            release.set()
+            await asyncio.wait_for(server.event_queue.join(), timeout=5)
+
+            assert adapter_mock.process_outgoing_event.await_count == 2
+
+        @pytest.mark.asyncio
+        async def test_requests_without_id_get_distinct_ids(self, server):
+            """Test that requests queued back to back without an id do not share one"""
+            data = {"event_type": "send_message", "data": {"conversation_id": "conv_1", "text": "hi"}}
+
+            await server._queue_event("sid_1", dict(data))
+            await server._queue_event("sid_1", dict(data))
+
+            assert len(server.request_map) == 2
+            assert len(set(emitted(server, "request_queued"))) == 2
+
+        @pytest.mark.asyncio
+        async def test_oldest_request_is_failed_when_full(self, server):
+            """Test that the oldest pending request is dropped once the map is full"""
+            server.MAX_PENDING_REQUESTS = 2
+
+            for i in range(3):
+                await queue(server, f"req_{i}")
+
+            assert list(server.request_map) == ["req_1", "req_2"]
+            assert emitted(server, "request_failed") == ["req_0"]
+
+    class TestBuildRequestEvent:
+        """Tests for building request events"""
+
+        @pytest.fixture
+        def history(self):
+            """Create a history longer than the validation threshold"""
+            return [
+                {
+                    "message_id": f"msg_{i}",
+                    "conversation_id": "conv_1",
+                    "sender": {"user_id": "user_1", "display_name": "Test User"},
+                    "text": f"Message {i}",
+                    "thread_id": None,
+                    "attachments": [],
+                    "timestamp": 1000 + i
+                }
+                for i in range(SocketIOServer.HISTORY_VALIDATION_THRESHOLD + 1)
+            ]
+
+        @pytest.mark.asyncio
+        async def test_offloaded_build_matches_inline_build(self, server, history):
+            """Test that a history built in a worker thread dumps the same as one built inline"""
+            with patch("src.core.socket_io.server.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+                offloaded = await server._build_request_event("req_1", "internal_1", {"history": history})
+            assert to_thread.call_count == 1
+
+            server.HISTORY_VALIDATION_THRESHOLD = len(history)
+            with patch("src.core.socket_io.server.asyncio.to_thread") as to_thread:
+                inline = await server._build_request_event("req_1", "internal_1", {"history": history})
+            to_thread.assert_not_called()
+
+            assert offloaded == inline
+            assert len(offloaded["data"]["history"]) == len(history)
+
+        @pytest.mark.asyncio
+        async def test_empty_data_builds_status(self, server):
+            """Test that an event without data matches the dumped model"""
+            event = await server._build_request_event("req_1", "internal_1", {})
+
+            assert event == server.request_event_builder.build("req_1", "internal_1").model_dump()
+            assert event["data"] is None
@@ -6,8 +6,10 @@ from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch, mock_open
 
 from src.core.utils.attachment_loading import (
+    chunk_attachments,
     create_attachment_dir,
     get_attachment_type_by_extension,
+    get_file_extension,
     move_attachment,
     save_metadata_file
 )
@@ -49,6 +51,17 @@ class TestAttachmentLoading:
         """Test attachment type detection by file extension"""
         assert get_attachment_type_by_extension(extension) == expected_type
 
+    @pytest.mark.parametrize("filename,expected_extension", [
+        ("photo.JPG", "jpg"),
+        ("archive.tar.gz", "gz"),
+        ("README", None),
+        ("", None),
+        (None, None)
+    ])
+    def test_get_file_extension(self, filename, expected_extension):
+        """Test extracting the lowercased extension from a file name"""
+        assert get_file_extension(filename) == expected_extension
+
     def test_move_attachment(self):
         """Test moving an attachment file"""
         src_path = "/test/source/file.pdf"
@@ -78,3 +91,13 @@ class TestAttachmentLoading:
                 expected_path = os.path.join(attachment_dir, "test123.json")
                 mock_file.assert_called_once_with(expected_path, "w")
                 mock_json_dump.assert_called_once()
+
+    @pytest.mark.parametrize("attachments,chunk_size,expected_chunks", [
+        ([], 2, []),
+        ([1, 2, 3], 1, [[1], [2], [3]]),
+        ([1, 2, 3, 4, 5], 2, [[1, 2], [3, 4], [5]]),
+        ([1, 2], 10, [[1, 2]])
+    ])
+    def test_chunk_attachments(self, attachments, chunk_size, expected_chunks):
+        """Test splitting attachments into ordered chunks of limited size"""
+        assert list(chunk_attachments(attachments, chunk_size)) == expected_chunks
@@ -0,0 +1,29 @@
+import emoji
+import pytest
+
+from src.core.utils.emoji_converter import get_emoji_name, get_emoji_symbol
+
+class TestGetEmojiName:
+    """Tests for the get_emoji_name function"""
+
+    @pytest.mark.parametrize("unicode_emoji", ["👍", "❤️", "🎉", "👨‍👩‍👧"])
+    def test_matches_demojize(self, unicode_emoji):
+        """Test that precomputed names match the emoji library"""
+        assert get_emoji_name(unicode_emoji) == emoji.demojize(unicode_emoji).strip(":")
+
+    def test_unknown_name_falls_back_to_demojize(self):
+        """Test that text which is not a single known emoji is demojized"""
+        assert get_emoji_name("custom_emoji") == "custom_emoji"
+        assert get_emoji_name("👍👍") == "thumbs_up::thumbs_up"
+
+class TestGetEmojiSymbol:
+    """Tests for the get_emoji_symbol function"""
+
+    @pytest.mark.parametrize("emoji_name", ["thumbs_up", "red_heart", "party_popper"])
+    def test_matches_emojize(self, emoji_name):
+        """Test that known names are converted like the emoji library does"""
+        assert get_emoji_symbol(emoji_name) == emoji.emojize(f":{emoji_name}:")
+
+    def test_unknown_name(self):
+        """Test that names unknown to the emoji library are rejected"""
+        assert get_emoji_symbol("custom_emoji") is None
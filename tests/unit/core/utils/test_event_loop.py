@@ -0,0 +1,61 @@
+import asyncio
+import pytest
+import sys
+
+from types import ModuleType
+from unittest.mock import MagicMock, patch
+
+from src.core.utils.event_loop import get_event_loop_factory, run_event_loop, wait_for_any
+
+class TestEventLoop:
+    """Tests for the event loop helpers"""
+
+    @pytest.fixture
+    def uvloop_mock(self):
+        """Create a stand-in uvloop module"""
+        module = ModuleType("uvloop")
+        module.new_event_loop = MagicMock()
+        return module
+
+    def test_uvloop_used_when_installed(self, uvloop_mock):
+        """Test that uvloop is picked when it can be imported"""
+        with patch.dict(sys.modules, {"uvloop": uvloop_mock}), \
+             patch.object(sys, "platform", "linux"):
+            assert get_event_loop_factory() is uvloop_mock.new_event_loop
+
+    def test_uvloop_disabled(self, uvloop_mock):
+        """Test that the default loop is used when uvloop is disabled"""
+        with patch.dict(sys.modules, {"uvloop": uvloop_mock}):
+            assert get_event_loop_factory(use_uvloop=False) is None
+
+    def test_uvloop_not_installed(self):
+        """Test that the default loop is used when uvloop is missing"""
+        with patch.dict(sys.modules, {"uvloop": None}):
+            assert get_event_loop_factory() is None
+
+    def test_uvloop_unsupported_platform(self, uvloop_mock):
+        """Test that the default loop is used on Windows"""
+        with patch.dict(sys.modules, {"uvloop": uvloop_mock}), \
+             patch.object(sys, "platform", "win32"):
+            assert get_event_loop_factory() is None
+
+    def test_run_event_loop(self):
+        """Test running a coroutine to completion"""
+        async def main():
+            await asyncio.sleep(0)
+            return "done"
+
+        with patch.dict(sys.modules, {"uvloop": None}):
+            assert run_event_loop(main()) == "done"
+
+    @pytest.mark.asyncio
+    async def test_wait_for_any(self):
+        """Test that waiting returns once one of the events is set"""
+        first = asyncio.Event()
+        second = asyncio.Event()
+
+        asyncio.get_running_loop().call_soon(second.set)
+        await asyncio.wait_for(wait_for_any(first, second), timeout=1)
+
+        assert second.is_set()
+        assert not first.is_set()